@@ -1,6 +1,8 @@
+from lamina.docs import docs_handler
 from lamina.main import Request, lamina
 from lamina.spec import get_openapi_spec
+from lamina.warmup import warmup
 
 __version__ = "6.2.9"
 
-__all__ = ["Request", "lamina", "get_openapi_spec"]
+__all__ = ["Request", "lamina", "get_openapi_spec", "docs_handler", "warmup"]
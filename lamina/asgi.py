@@ -0,0 +1,176 @@
+"""ASGI adapter for lamina handlers.
+
+Example:
+    # app.py
+    from lamina.asgi import App
+
+    import my_project.handlers  # noqa: F401 - registers the handlers
+
+    app = App()
+
+    $ uvicorn app:app --workers 4
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping, Optional
+
+from loguru import logger
+
+from lamina import resources
+from lamina.errors import error_response
+from lamina.gateway import (
+    LocalContext,
+    Router,
+    build_event,
+    response_body_bytes,
+)
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class App:
+    """ASGI application dispatching HTTP requests to lamina handlers.
+
+    Requests are converted to API Gateway (REST) events and routed by each
+    handler `path` and `methods`. Async handlers run on the server event loop;
+    sync handlers and hooks run in the lamina thread pool.
+
+    Attributes:
+        handlers: Handlers to serve. Defaults to the handlers registered for
+            the OpenAPI spec, read when the first request arrives.
+        timeout: Invocation timeout, in seconds, reported by the context.
+        memory_limit_in_mb: Memory limit reported by the context.
+        offload_sync: Run sync handlers and hooks in the thread pool.
+    """
+
+    handlers: Optional[List[Callable[..., Any]]] = None
+    timeout: Optional[float] = 30.0
+    memory_limit_in_mb: int = 128
+    offload_sync: bool = True
+    _router: Optional[Router] = field(default=None, init=False, repr=False)
+
+    @property
+    def router(self) -> Router:
+        if self._router is None:
+            if self.handlers is None:
+                from lamina.main import LAMINA_REGISTRY
+
+                self._router = Router.from_handlers(LAMINA_REGISTRY)
+            else:
+                self._router = Router.from_handlers(self.handlers)
+        return self._router
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+        elif scope["type"] == "websocket":
+            # Closing before accepting rejects the handshake (HTTP 403)
+            message = await receive()
+            if message["type"] == "websocket.connect":
+                await send({"type": "websocket.close", "code": 1003})
+        else:
+            logger.debug(f"Ignoring unsupported ASGI scope type: {scope['type']}")
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    self.router
+                except Exception as e:
+                    logger.exception("Could not route the lamina handlers")
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                try:
+                    resources.teardown()
+                except Exception as e:
+                    logger.exception("Could not tear down the lamina resources")
+                    await send({"type": "lifespan.shutdown.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope: Scope, receive: Receive, send: Send) -> None:
+        chunks: List[bytes] = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+
+        method = scope["method"]
+        path = scope["path"]
+        route, path_parameters, allowed = self.router.match(method, path)
+        if route is None:
+            if allowed:
+                response = error_response(405, "Method not allowed.", constant=True)
+                response["headers"]["Allow"] = ", ".join(sorted(set(allowed)))
+            else:
+                response = error_response(404, "Not found.", constant=True)
+        else:
+            event = build_event(
+                method=method,
+                path=path,
+                query_string=scope.get("query_string", b"").decode("latin-1"),
+                headers=[
+                    (name.decode("latin-1"), value.decode("latin-1"))
+                    for name, value in scope.get("headers", [])
+                ],
+                body=body,
+                path_parameters=path_parameters,
+                source_ip=(scope.get("client") or ("127.0.0.1", 0))[0],
+            )
+            event["resource"] = route.path
+            context = LocalContext(
+                timeout=self.timeout, memory_limit_in_mb=self.memory_limit_in_mb
+            )
+            response = await route.handler.aio(
+                event, context, offload_sync=self.offload_sync
+            )
+        logger.debug(f"{method} {path} {response['statusCode']}")
+        await self._send_response(response, send, head=method.upper() == "HEAD")
+
+    @staticmethod
+    async def _send_response(
+        response: Dict[str, Any], send: Send, head: bool = False
+    ) -> None:
+        body = response_body_bytes(response)
+        headers = [
+            (str(name).lower().encode("latin-1"), str(value).encode("latin-1"))
+            for name, value in (response.get("headers") or {}).items()
+        ]
+        if not any(name == b"content-length" for name, _ in headers):
+            headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response["statusCode"],
+                "headers": headers,
+            }
+        )
+        if head or not body:
+            await send({"type": "http.response.body", "body": b""})
+            return
+        view = memoryview(body)
+        for start in range(0, len(view), CHUNK_SIZE):
+            chunk = view[start : start + CHUNK_SIZE]
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": bytes(chunk),
+                    "more_body": start + CHUNK_SIZE < len(view),
+                }
+            )
@@ -0,0 +1,162 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple, TypedDict
+
+from pydantic import BaseModel
+
+from lamina.helpers import get_header, get_http_method, get_request_path
+
+CacheKey = Tuple[str, str, str, Tuple[Tuple[str, str], ...]]
+
+# Rough per-entry bookkeeping cost (tuple key, OrderedDict node, dicts).
+_ENTRY_OVERHEAD_BYTES = 256
+
+
+class CacheStats(TypedDict):
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+
+
+@dataclass
+class _CacheEntry:
+    response: Dict[str, Any]
+    expires_at: float
+    size: int
+
+
+@dataclass
+class ResponseCache:
+    """Bounded LRU cache with TTL for fully serialized handler responses.
+
+    The cache lives for the lifetime of the Lambda container. Responses are
+    stored after hooks and serialization ran. A hit is returned after the
+    `pre_execute` hook (so authorization checks still run) and before the
+    handler is executed.
+
+    Attributes:
+        ttl: Time to live, in seconds, of each cached response.
+        max_entries: Maximum number of responses kept in the cache.
+        max_bytes: Approximate memory cap for all cached responses.
+        vary_headers: Request header names which are part of the cache key.
+            Defaults to `Authorization`, so clients never share responses.
+        methods: HTTP methods eligible for caching.
+        hits: Number of requests served from the cache.
+        misses: Number of cacheable requests not found in the cache.
+    """
+
+    ttl: float = 60.0
+    max_entries: int = 256
+    max_bytes: int = 8 * 1024 * 1024
+    vary_headers: list[str] = field(default_factory=lambda: ["Authorization"])
+    methods: tuple[str, ...] = ("GET", "HEAD")
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _entries: "OrderedDict[CacheKey, _CacheEntry]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _size: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def make_key(
+        self,
+        event: Dict[str, Any] | bytes | str,
+        query: Optional[BaseModel],
+        fieldset: str = "",
+    ) -> CacheKey | None:
+        """Build the cache key for the event, or None if it is not cacheable.
+
+        The query is the validated `params_in` model, or the raw query string
+        parameters when the handler has no `params_in`. `fieldset` is the
+        selected response fields, see `lamina.fieldsets`.
+        """
+        if not isinstance(event, dict):
+            return None
+        method = get_http_method(event)
+        if method not in self.methods:
+            return None
+        headers = event.get("headers") or {}
+        vary = tuple(
+            (name.lower(), get_header(headers, name) or "")
+            for name in self.vary_headers
+        )
+        query_key = (
+            query.model_dump_json() if query is not None else _raw_query_key(event)
+        )
+        if fieldset:
+            query_key = f"{query_key}|{fieldset}"
+        return method, get_request_path(event), query_key, vary
+
+    def get(self, key: CacheKey) -> Dict[str, Any] | None:
+        """Return a copy of the cached response, or None on miss/expiration."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at < time.monotonic():
+                self._evict(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            response = entry.response
+        return {**response, "headers": dict(response["headers"])}
+
+    def set(self, key: CacheKey, response: Dict[str, Any]) -> None:
+        """Store the response, evicting least recently used entries if needed."""
+        size = _estimate_size(response)
+        if size > self.max_bytes:
+            return
+        stored = {**response, "headers": dict(response["headers"])}
+        with self._lock:
+            if key in self._entries:
+                self._evict(key)
+            self._entries[key] = _CacheEntry(
+                response=stored, expires_at=time.monotonic() + self.ttl, size=size
+            )
+            self._size += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._size > self.max_bytes
+            ):
+                self._evict(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> CacheStats:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "size_bytes": self._size,
+        }
+
+    def _evict(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+
+def _raw_query_key(event: Dict[str, Any]) -> str:
+    """Normalize the raw query string parameters, ignoring their order."""
+    single = event.get("queryStringParameters") or {}
+    multi = event.get("multiValueQueryStringParameters") or {}
+    if not single and not multi:
+        return ""
+    return json.dumps([single, multi], sort_keys=True, separators=(",", ":"))
+
+
+def _estimate_size(response: Dict[str, Any]) -> int:
+    body = response.get("body") or ""
+    headers_size = sum(len(k) + len(str(v)) for k, v in response["headers"].items())
+    return len(body) + headers_size + _ENTRY_OVERHEAD_BYTES
@@ -0,0 +1,142 @@
+"""Lamina command line interface.
+
+Usage:
+    lamina serve [--host HOST] [--port PORT] [--workers N]
+    lamina replay EVENTS --handler module.handler [--rate N] [--concurrency N]
+    lamina spec build|watch [--output PATH] [--format json|yaml] [--minify]
+        [--split-by-tag] [--descriptions full|summary|none]
+        [--field-tables all|top|none]
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from loguru import logger
+
+
+def _serve(args: argparse.Namespace) -> int:
+    from lamina.main import LAMINA_REGISTRY
+    from lamina.server import serve
+    from lamina.spec import _import_project_modules
+
+    _import_project_modules()
+    if not LAMINA_REGISTRY:
+        logger.error("No lamina handlers found in the current directory.")
+        return 1
+    serve(
+        list(LAMINA_REGISTRY),
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout=args.timeout,
+        memory_limit_in_mb=args.memory,
+    )
+    return 0
+
+
+def _replay(args: argparse.Namespace) -> int:
+    from lamina.helpers import import_string
+    from lamina.replay import load_events, replay
+
+    handler = import_string(args.handler)
+    report = replay(
+        handler,
+        load_events(args.events),
+        rate=args.rate,
+        concurrency=args.concurrency,
+    )
+    print(report.summary())
+    for status, total in sorted(report.status_codes.items()):
+        print(f"  {status}: {total}")
+    if report.exceptions:
+        print(f"  exceptions: {report.exceptions}")
+    return 1 if report.errors else 0
+
+
+def _spec(args: argparse.Namespace) -> int:
+    from lamina.spec_builder import SpecBuilder, SpecConfig, watch
+
+    config = SpecConfig.from_pyproject(
+        output=args.output,
+        format=args.format,
+        minify=args.minify,
+        workers=args.workers,
+        split_by_tag=args.split_by_tag,
+        descriptions=args.descriptions,
+        field_tables=args.field_tables,
+    )
+    if args.action == "watch":
+        try:
+            watch(config, interval=args.interval)
+        except KeyboardInterrupt:
+            pass
+        return 0
+    SpecBuilder(config).build()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="lamina")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Serve handlers over HTTP.")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8000)
+    serve.add_argument("--workers", type=int, default=1)
+    serve.add_argument(
+        "--timeout", type=float, default=30.0, help="Invocation timeout in seconds."
+    )
+    serve.add_argument(
+        "--memory", type=int, default=128, help="Reported memory limit in MB."
+    )
+    serve.set_defaults(func=_serve)
+
+    replay = commands.add_parser(
+        "replay", help="Replay a JSONL file of events against a handler."
+    )
+    replay.add_argument("events", help="Path to the JSONL events file.")
+    replay.add_argument(
+        "--handler", required=True, help="Handler import path (module.handler)."
+    )
+    replay.add_argument(
+        "--rate", type=float, default=None, help="Target invocations per second."
+    )
+    replay.add_argument("--concurrency", type=int, default=8)
+    replay.set_defaults(func=_replay)
+
+    spec = commands.add_parser(
+        "spec", help="Build the OpenAPI document ([tool.lamina.spec] settings)."
+    )
+    spec.add_argument("action", choices=["build", "watch"])
+    spec.add_argument("--output", help="Output path (.json, .yaml or .yml).")
+    spec.add_argument("--format", choices=["json", "yaml"])
+    spec.add_argument("--minify", action="store_true", default=None)
+    spec.add_argument("--workers", type=int, help="Processes building the views.")
+    spec.add_argument(
+        "--split-by-tag",
+        action="store_true",
+        default=None,
+        help="Also write one document per tag.",
+    )
+    spec.add_argument("--descriptions", choices=["full", "summary", "none"])
+    spec.add_argument("--field-tables", choices=["all", "top", "none"])
+    spec.add_argument(
+        "--interval", type=float, default=1.0, help="Seconds between file checks."
+    )
+    spec.set_defaults(func=_spec)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    # Project modules are imported relative to the current directory
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
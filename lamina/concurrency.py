@@ -0,0 +1,96 @@
+"""Concurrent fan-out helpers for async handlers.
+
+Use `request.gather(...)` inside async handlers to call several downstream
+services concurrently, instead of awaiting them one after another.
+"""
+
+import asyncio
+import contextlib
+import inspect
+import time
+from typing import Any, Awaitable, Callable, List, Literal, Optional, TypedDict
+
+from lamina.deadline import Deadline, run_with_deadline
+from lamina.helpers import async_, get_executor
+
+Call = Awaitable[Any] | Callable[[], Any]
+
+
+class CallTiming(TypedDict):
+    name: str
+    elapsed_ms: float
+    status: Literal["ok", "error", "cancelled"]
+
+
+def _call_name(call: Call) -> str:
+    func = getattr(call, "func", call)  # functools.partial
+    return getattr(func, "__qualname__", None) or type(func).__name__
+
+
+async def gather(
+    *calls: Call,
+    limit: Optional[int] = None,
+    deadline: Optional[Deadline] = None,
+    timings: Optional[List[CallTiming]] = None,
+) -> List[Any]:
+    """Run awaitables and callables concurrently and return their results in order.
+
+    Sync callables run in the container-scoped thread pool. If any call fails,
+    the other calls are cancelled and the first error is raised.
+
+    Args:
+        *calls: Awaitables, coroutine functions or sync callables without
+            arguments (use `functools.partial` to bind arguments).
+        limit: Maximum number of calls running at the same time.
+        deadline: Request deadline. When reached, pending calls are cancelled
+            and `DeadlineExceeded` is raised.
+        timings: Optional list where the timing of each call is appended.
+
+    Returns:
+        The results of each call, in the same order of the arguments.
+    """
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def run(call: Call) -> Any:
+        try:
+            return await run_call(call)
+        except asyncio.CancelledError:
+            if inspect.iscoroutine(call):
+                call.close()  # avoid "never awaited" warnings
+            raise
+
+    async def run_call(call: Call) -> Any:
+        async with semaphore or contextlib.nullcontext():
+            start = time.perf_counter()
+            status: Literal["ok", "error", "cancelled"] = "error"
+            try:
+                if inspect.isawaitable(call):
+                    result = await call
+                else:
+                    result = await async_(call, executor=get_executor())()
+                status = "ok"
+                return result
+            except asyncio.CancelledError:
+                status = "cancelled"
+                raise
+            finally:
+                if timings is not None:
+                    timings.append(
+                        {
+                            "name": _call_name(call),
+                            "elapsed_ms": round(
+                                (time.perf_counter() - start) * 1000, 3
+                            ),
+                            "status": status,
+                        }
+                    )
+
+    async def run_all() -> List[Any]:
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(run(call)) for call in calls]
+        except BaseExceptionGroup as errors:
+            raise errors.exceptions[0] from None
+        return [task.result() for task in tasks]
+
+    return await run_with_deadline(run_all(), deadline or Deadline())
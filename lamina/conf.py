@@ -37,13 +37,18 @@ def get_toml_configuration() -> Dict[str, Any]:
 class LaminaSettings:
     settings: Dict[str, Any]
 
-    def _get_setting(self, name: str, default: Any = None) -> Any:
-        full_name = f"LAMINA_{name.upper()}"
+    def _get_raw_setting(self, name: str, default: Any = None) -> Any:
+        """Return the setting value without importing dotted paths."""
         # First, check environment variables
-        value = os.getenv(full_name, None)
+        value = os.getenv(f"LAMINA_{name.upper()}", None)
         if not value:
             # Then check the settings dictionary
             value = self.settings.get(name, default)
+        return value
+
+    def _get_setting(self, name: str, default: Any = None) -> Any:
+        full_name = f"LAMINA_{name.upper()}"
+        value = self._get_raw_setting(name, default)
 
         if "." in str(value) or ":" in str(value):
             module_path = (
@@ -64,6 +69,12 @@ class LaminaSettings:
 
         return value
 
+    def _get_bool_setting(self, name: str, default: bool = False) -> bool:
+        value = self._get_setting(name, default)
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(value)
+
     @property
     def LAMINA_PRE_PARSE_CALLBACK(self) -> HookCallable:
         return self._get_setting("pre_parse_callback", default="lamina.hooks.pre_parse")
@@ -108,8 +119,104 @@ class LaminaSettings:
         return int(self._get_setting("default_success_status_code", 200))
 
     @property
-    def LAMINA_GENERATE_FIELD_TABLES_IN_DOCS(self):
-        return self._get_setting("generate_field_tables_in_docs", True)
+    def LAMINA_DEADLINE_SAFETY_MARGIN_MS(self) -> int:
+        return int(self._get_setting("deadline_safety_margin_ms", 500))
+
+    @property
+    def LAMINA_OFFLOAD_SYNC(self) -> bool:
+        return self._get_bool_setting("offload_sync", False)
+
+    @property
+    def LAMINA_THREAD_POOL_WORKERS(self) -> int:
+        return int(self._get_setting("thread_pool_workers", 0))
+
+    @property
+    def LAMINA_MAX_BODY_BYTES(self) -> int:
+        return int(self._get_raw_setting("max_body_bytes", 0))
+
+    @property
+    def LAMINA_DECODE_BASE64_BODY(self) -> bool:
+        return self._get_bool_setting("decode_base64_body", False)
+
+    @property
+    def LAMINA_CLIENT_ERROR_LOG_LIMIT(self) -> int:
+        return int(self._get_raw_setting("client_error_log_limit", 10))
+
+    @property
+    def LAMINA_TRACK_MEMORY(self) -> bool:
+        return self._get_bool_setting("track_memory", False)
+
+    @property
+    def LAMINA_TRACEMALLOC(self) -> bool:
+        return self._get_bool_setting("tracemalloc", False)
+
+    @property
+    def LAMINA_MEMORY_ALARM_PERCENT(self) -> int:
+        return int(self._get_raw_setting("memory_alarm_percent", 80))
+
+    @property
+    def LAMINA_RECORD_EVENTS(self) -> str | None:
+        return self._get_raw_setting("record_events") or None
+
+    @property
+    def LAMINA_RECORD_SAMPLE_RATE(self) -> float:
+        return float(self._get_raw_setting("record_sample_rate", 1.0))
+
+    @property
+    def LAMINA_RECORD_REDACT(self) -> list[str]:
+        value = self._get_raw_setting(
+            "record_redact",
+            ["authorization", "cookie", "set-cookie", "x-api-key", "password"],
+        )
+        if isinstance(value, str):
+            value = [item.strip() for item in value.split(",") if item.strip()]
+        return list(value)
+
+    @property
+    def LAMINA_RECORD_MAX_BYTES(self) -> int:
+        return int(self._get_raw_setting("record_max_bytes", 10 * 1024 * 1024))
+
+    @property
+    def LAMINA_RECORD_BACKUPS(self) -> int:
+        return int(self._get_raw_setting("record_backups", 3))
+
+    @property
+    def LAMINA_DOCS_SPEC(self) -> str:
+        return self._get_raw_setting("docs_spec", "openapi.json")
+
+    @property
+    def LAMINA_OPENAPI_SCHEMA_CONFLICTS(self) -> str:
+        return self._get_raw_setting("openapi_schema_conflicts", "rename")
+
+    @property
+    def LAMINA_INPUT_VALIDATION(self) -> str:
+        return self._get_raw_setting("input_validation", "full")
+
+    @property
+    def LAMINA_OUTPUT_VALIDATION(self) -> str:
+        return self._get_raw_setting("output_validation", "full")
+
+    @property
+    def LAMINA_VALIDATION_SAMPLE_RATE(self) -> float:
+        return float(self._get_raw_setting("validation_sample_rate", 0.1))
+
+    @property
+    def LAMINA_ROUTE_CONFLICTS(self) -> str:
+        return self._get_raw_setting("route_conflicts", "warn")
+
+    @property
+    def LAMINA_GENERATE_FIELD_TABLES_IN_DOCS(self) -> str:
+        """Field tables in operation descriptions: `all`, `top` or `none`.
+
+        Booleans are accepted: true is `all` and false is `none`.
+        """
+        value = self._get_raw_setting("generate_field_tables_in_docs", True)
+        if isinstance(value, str):
+            value = value.strip().lower()
+            if value in ("all", "top", "none"):
+                return value
+            value = value in ("1", "true", "yes", "on")
+        return "all" if value else "none"
 
 
 # Create a single instance of the settings class
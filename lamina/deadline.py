@@ -0,0 +1,60 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when the request deadline is reached before the handler finishes."""
+
+
+@dataclass
+class Deadline:
+    """Request deadline computed from the Lambda context.
+
+    Attributes:
+        expires_at: `time.monotonic()` value when the request must be answered,
+            or None if there is no deadline (e.g. local tests).
+    """
+
+    expires_at: float | None = None
+
+    @classmethod
+    def from_context(cls, context: Any, safety_margin_ms: int = 0) -> "Deadline":
+        """Build the deadline from `context.get_remaining_time_in_millis()`.
+
+        The safety margin is subtracted, leaving time to return a response
+        before Lambda kills the invocation.
+        """
+        get_remaining = getattr(context, "get_remaining_time_in_millis", None)
+        if not callable(get_remaining):
+            return cls()
+        remaining_ms = get_remaining() - safety_margin_ms
+        return cls(expires_at=time.monotonic() + max(remaining_ms, 0) / 1000)
+
+    def remaining(self) -> float | None:
+        """Seconds until the deadline, or None if there is no deadline."""
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+
+async def run_with_deadline(awaitable: Awaitable[T], deadline: Deadline) -> T:
+    """Await the awaitable, cancelling it when the deadline is reached."""
+    remaining = deadline.remaining()
+    if remaining is None:
+        return await awaitable
+    timeout = asyncio.timeout(remaining)
+    try:
+        async with timeout:
+            return await awaitable
+    except TimeoutError as e:
+        if timeout.expired():
+            raise DeadlineExceeded("Request deadline exceeded.") from e
+        raise
@@ -0,0 +1,225 @@
+"""Serve a prebuilt OpenAPI document and its documentation page.
+
+Generating the spec imports every project module and builds every schema,
+which is too slow for a cold start. Build the document ahead of time (e.g.
+in CI, with `get_openapi_spec`) and ship it next to the code:
+
+Example:
+    # docs.py
+    import lamina
+
+    # GET /docs -> Swagger UI, GET /docs/openapi.json -> the document
+    handler = lamina.docs_handler("openapi.json", ui="swagger")
+
+The document and the HTML page are loaded, compressed and hashed once, when
+the handler is created. Requests are answered with `304 Not Modified` when
+`If-None-Match` matches, and with the gzip body when the client accepts it.
+"""
+
+import base64
+import gzip
+import html
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Literal
+
+from lamina import conf
+from lamina.helpers import (
+    compute_etag,
+    etag_matches,
+    get_header,
+    get_request_path,
+    import_string,
+)
+from lamina.main import ResponseDict
+
+SWAGGER_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui.css">
+</head>
+<body>
+<div id="docs"></div>
+<script src="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui-bundle.js"></script>
+<script>
+SwaggerUIBundle({{url: {spec_url}, dom_id: "#docs"}});
+</script>
+</body>
+</html>
+"""  # noqa: E501
+
+REDOC_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+</head>
+<body>
+<div id="docs"></div>
+<script src="https://cdn.redoc.ly/redoc/latest/bundles/redoc.standalone.js"></script>
+<script>
+Redoc.init({spec_url}, {{}}, document.getElementById("docs"));
+</script>
+</body>
+</html>
+"""
+
+# Relative to the page, so it works behind API Gateway stages and base paths
+PAGE_SPEC_URL = 'window.location.pathname.replace(/\\/$/, "") + "/openapi.json"'
+
+
+@dataclass(frozen=True)
+class StaticContent:
+    """A response body with its precomputed validator and gzip encoding.
+
+    Attributes:
+        body: Uncompressed body.
+        content_type: Value of the `Content-Type` header.
+        etag: Strong ETag of the uncompressed body. The gzip body has its
+            own ETag (`gzip_etag`), so caches ignoring `Vary` never mix up
+            the two encodings.
+        gzip_body: Base64 of the gzip body, or None when gzip doesn't help.
+    """
+
+    body: str
+    content_type: str
+    etag: str
+    gzip_body: str | None
+
+    @classmethod
+    def build(cls, body: str | bytes, content_type: str) -> "StaticContent":
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        # mtime=0 keeps the compressed bytes stable between builds
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        return cls(
+            body=data.decode("utf-8"),
+            content_type=content_type,
+            etag=compute_etag(data),
+            gzip_body=(
+                base64.b64encode(compressed).decode("ascii")
+                if len(compressed) < len(data)
+                else None
+            ),
+        )
+
+    @property
+    def gzip_etag(self) -> str:
+        """Strong ETag of the gzip body."""
+        return f'{self.etag[:-1]}-gzip"'
+
+    def response(self, event: Dict[str, Any], max_age: int) -> ResponseDict:
+        """Build the response for a request, honoring its conditional headers."""
+        request_headers = event.get("headers") or {}
+        use_gzip = self.gzip_body is not None and accepts_gzip(
+            get_header(request_headers, "Accept-Encoding")
+        )
+        etag = self.gzip_etag if use_gzip else self.etag
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={max_age}",
+            "Vary": "Accept-Encoding",
+        }
+        if etag_matches(get_header(request_headers, "If-None-Match"), etag):
+            return {"statusCode": 304, "headers": headers, "body": ""}
+
+        headers["Content-Type"] = self.content_type
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+            return {
+                "statusCode": 200,
+                "headers": headers,
+                "body": self.gzip_body,
+                "isBase64Encoded": True,
+            }
+        return {"statusCode": 200, "headers": headers, "body": self.body}
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Check if an `Accept-Encoding` header allows gzip."""
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().removeprefix("q=")
+        try:
+            return not params or float(quality) > 0
+        except ValueError:
+            return True
+    return False
+
+
+def load_spec(spec: str | os.PathLike | Dict[str, Any] | None = None) -> str:
+    """Return the JSON of a prebuilt OpenAPI document.
+
+    Args:
+        spec: The document, a path to its JSON file, or the import path of a
+            module attribute holding it (`"myapp.openapi:SPEC"`), as a dict
+            or as JSON. Defaults to `LAMINA_DOCS_SPEC` (`openapi.json`).
+
+    Raises:
+        FileNotFoundError: The JSON file doesn't exist.
+    """
+    if spec is None:
+        spec = conf.LAMINA_DOCS_SPEC
+    if isinstance(spec, str) and not spec.lstrip().startswith("{"):
+        if ":" in spec and not spec.endswith(".json"):
+            spec = import_string(spec)
+        else:
+            spec = Path(spec)
+    if isinstance(spec, os.PathLike):
+        return Path(spec).read_text(encoding="utf-8")
+    if isinstance(spec, dict):
+        return json.dumps(spec)
+    if isinstance(spec, bytes):
+        return spec.decode("utf-8")
+    return spec
+
+
+def docs_handler(
+    spec: str | os.PathLike | Dict[str, Any] | None = None,
+    *,
+    ui: Literal["swagger", "redoc"] | None = "swagger",
+    title: str = "API Docs",
+    spec_url: str | None = None,
+    max_age: int = 300,
+) -> Callable[[Dict[str, Any], Any], ResponseDict]:
+    """Create a Lambda handler serving a prebuilt OpenAPI document.
+
+    Requests to paths ending in `.json` get the document; other paths get
+    the documentation page, or the document when `ui` is None. The generator
+    never runs: the document must be built ahead of time.
+
+    Args:
+        spec: The prebuilt document, see `load_spec`.
+        ui: Documentation page: `swagger` (Swagger UI), `redoc` or None.
+        title: Title of the documentation page.
+        spec_url: URL of the document used by the page. Defaults to
+            `openapi.json` under the page path.
+        max_age: `Cache-Control` max age, in seconds.
+
+    Raises:
+        FileNotFoundError: The JSON file of the document doesn't exist.
+    """
+    document = StaticContent.build(load_spec(spec), "application/json; charset=utf-8")
+    page = None
+    if ui is not None:
+        template = {"swagger": SWAGGER_HTML, "redoc": REDOC_HTML}[ui]
+        page = StaticContent.build(
+            template.format(
+                title=html.escape(title),
+                spec_url=json.dumps(spec_url) if spec_url else PAGE_SPEC_URL,
+            ),
+            "text/html; charset=utf-8",
+        )
+
+    def handler(event: Dict[str, Any], context: Any) -> ResponseDict:
+        event = event or {}
+        if page is None or get_request_path(event).endswith(".json"):
+            return document.response(event, max_age)
+        return page.response(event, max_age)
+
+    return handler
@@ -0,0 +1,106 @@
+"""Error responses and error logging helpers.
+
+Error responses are on the hot path when clients send bad requests, so
+bodies of constant messages are serialized once, validation errors are
+formatted in a single pass, and client error logs are rate limited.
+"""
+
+import functools
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from loguru import logger
+from pydantic import ValidationError
+
+from lamina import conf
+
+JSON_HEADERS: Dict[str, str] = {"Content-Type": "application/json; charset=utf-8"}
+
+
+@functools.lru_cache(maxsize=128)
+def _constant_error_body(error_key: str, message: str) -> str:
+    return json.dumps({error_key: message})
+
+
+def error_response(
+    status_code: int, message: Any, *, constant: bool = False, **extra: Any
+) -> Dict[str, Any]:
+    """Build a JSON error response.
+
+    Args:
+        status_code: HTTP status code.
+        message: Error message, stored under the `LAMINA_DEFAULT_ERROR_KEY`.
+        constant: The message never changes, so its body is cached.
+        extra: Additional keys for the body.
+    """
+    error_key = conf.LAMINA_DEFAULT_ERROR_KEY
+    if constant and not extra:
+        body = _constant_error_body(error_key, message)
+    else:
+        body = json.dumps({error_key: message, **extra})
+    return {"statusCode": status_code, "body": body, "headers": JSON_HEADERS.copy()}
+
+
+def format_validation_errors(error: ValidationError) -> List[Dict[str, Any]]:
+    """Format Pydantic validation errors as `{"field", "message"}` items."""
+    return [
+        {
+            "field": item["loc"][0] if item.get("loc") else "ModelValidation",
+            "message": item["msg"],
+        }
+        for item in error.errors(
+            include_url=False, include_context=False, include_input=False
+        )
+    ]
+
+
+@dataclass
+class LogLimiter:
+    """Allow at most `limit` log entries per `interval` seconds.
+
+    Suppressed entries are counted and reported when the next window starts.
+
+    Attributes:
+        limit: Log entries allowed per interval. 0 means no limit.
+        interval: Window size, in seconds.
+    """
+
+    limit: int = 10
+    interval: float = 1.0
+    _window_start: float = field(default=0.0, init=False, repr=False)
+    _count: int = field(default=0, init=False, repr=False)
+    _suppressed: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def allow(self) -> bool:
+        if self.limit <= 0:
+            return True
+        now = time.monotonic()
+        suppressed = 0
+        with self._lock:
+            if now - self._window_start >= self.interval:
+                suppressed, self._suppressed = self._suppressed, 0
+                self._window_start = now
+                self._count = 0
+            allowed = self._count < self.limit
+            if allowed:
+                self._count += 1
+            else:
+                self._suppressed += 1
+        if suppressed:
+            logger.warning(f"{suppressed} client error log entries were suppressed.")
+        return allowed
+
+
+client_error_logs = LogLimiter()
+
+
+def log_client_error(message: str, error: BaseException | None = None) -> None:
+    """Log a client error (4xx), rate limited by `LAMINA_CLIENT_ERROR_LOG_LIMIT`."""
+    client_error_logs.limit = conf.LAMINA_CLIENT_ERROR_LOG_LIMIT
+    if not client_error_logs.allow():
+        return
+    logger.opt(depth=1, exception=error).error(message)
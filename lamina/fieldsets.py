@@ -0,0 +1,149 @@
+"""Sparse fieldsets: let clients choose the response fields.
+
+Handlers decorated with `sparse_fields=True` accept two query parameters:
+
+* `fields`: comma separated fields to return, e.g. `id,lines.sku`.
+* `exclude`: comma separated fields to leave out, e.g. `lines.notes`.
+
+Fields are named as in the response (aliases), and nested fields of models,
+lists and dicts of models are joined by dots. They are checked against the
+`schema_out` fields and compiled into Pydantic `include`/`exclude` trees,
+cached per model and fieldset, so the response is serialized with only the
+requested fields.
+"""
+
+import functools
+import inspect
+from dataclasses import dataclass
+from types import UnionType
+from typing import Any, Dict, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel, RootModel
+
+FIELDS_PARAM = "fields"
+EXCLUDE_PARAM = "exclude"
+
+FieldTree = Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class Projection:
+    """Compiled fieldset of a response model.
+
+    Attributes:
+        include: Pydantic `include` tree, or None for all fields.
+        exclude: Pydantic `exclude` tree, or None.
+        key: Normalized fieldset, part of the response cache key.
+    """
+
+    include: FieldTree | None
+    exclude: FieldTree | None
+    key: str
+
+
+def get_projection(
+    model: Type[BaseModel], query: Dict[str, Any] | None
+) -> Projection | None:
+    """Compile the `fields`/`exclude` query parameters for a response model.
+
+    Returns:
+        The projection, or None when the query selects no fields.
+
+    Raises:
+        ValueError: A field doesn't exist in the model.
+    """
+    query = query or {}
+    fields = _split(query.get(FIELDS_PARAM))
+    exclude = _split(query.get(EXCLUDE_PARAM))
+    if not fields and not exclude:
+        return None
+    return compile_projection(model, fields, exclude)
+
+
+@functools.lru_cache(maxsize=512)
+def compile_projection(
+    model: Type[BaseModel], fields: Tuple[str, ...], exclude: Tuple[str, ...]
+) -> Projection:
+    """Build the Pydantic include/exclude trees of sorted field paths.
+
+    Cached per model and fieldset: the trees are shared and must not be
+    modified.
+    """
+    return Projection(
+        include=_tree(model, fields, FIELDS_PARAM) if fields else None,
+        exclude=_tree(model, exclude, EXCLUDE_PARAM) if exclude else None,
+        key=f"{','.join(fields)}|{','.join(exclude)}",
+    )
+
+
+def field_names(model: Type[BaseModel]) -> Tuple[str, ...]:
+    """Return the response names of the top-level fields of a model."""
+    target, _ = _root_target(model)
+    if target is None:
+        return ()
+    return tuple(field.alias or name for name, field in target.model_fields.items())
+
+
+def _split(value: Any) -> Tuple[str, ...]:
+    if not value:
+        return ()
+    if isinstance(value, (list, tuple)):
+        value = ",".join(value)
+    return tuple(sorted({part.strip() for part in value.split(",") if part.strip()}))
+
+
+@functools.lru_cache(maxsize=512)
+def _names(model: Type[BaseModel]) -> Dict[str, str]:
+    """Map response names (aliases) and attribute names to attribute names."""
+    names: Dict[str, str] = {}
+    for name, field in model.model_fields.items():
+        names[field.alias or name] = name
+        names.setdefault(name, name)
+    return names
+
+
+def _nested_model(annotation: Any) -> Tuple[Type[BaseModel] | None, bool]:
+    """Find the model of a field: returns it and whether it is in a collection."""
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return annotation, False
+    origin = get_origin(annotation)
+    for arg in get_args(annotation):
+        model, many = _nested_model(arg)
+        if model is not None:
+            return model, many or origin not in (Union, UnionType)
+    return None, False
+
+
+def _root_target(model: Type[BaseModel]) -> Tuple[Type[BaseModel] | None, bool]:
+    if issubclass(model, RootModel):
+        return _nested_model(model.model_fields["root"].annotation)
+    return model, False
+
+
+def _tree(model: Type[BaseModel], paths: Tuple[str, ...], param: str) -> FieldTree:
+    target, many = _root_target(model)
+    if target is None:
+        raise ValueError(f"{model.__name__} has no fields to select with {param}")
+    tree: FieldTree = {}
+    for path in paths:
+        current, node = target, tree
+        parts = path.split(".")
+        for index, part in enumerate(parts):
+            name = _names(current).get(part)
+            if name is None:
+                raise ValueError(f"Unknown field in {param}: {path}")
+            if index == len(parts) - 1:
+                # The whole field, even if some of its fields were selected
+                node[name] = True
+                break
+            nested, nested_many = _nested_model(current.model_fields[name].annotation)
+            if nested is None:
+                raise ValueError(f"Field has no nested fields in {param}: {path}")
+            child = node.get(name)
+            if child is True:
+                break
+            if child is None:
+                child = node[name] = {"__all__": {}} if nested_many else {}
+            node = child["__all__"] if nested_many else child
+            current = nested
+    return {"__all__": tree} if many else tree
@@ -0,0 +1,194 @@
+"""API Gateway emulation for running lamina handlers outside AWS Lambda.
+
+Used by the ASGI adapter and the local server to route HTTP requests to
+lamina handlers, using API Gateway (REST, payload v1) shaped events.
+"""
+
+import base64
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from lamina.registry import HandlerRegistry
+
+_PATH_PARAM_RE = re.compile(r"{([^}/]+?)(\+?)}")
+
+
+@dataclass
+class LocalContext:
+    """Minimal stand-in for the AWS Lambda context object.
+
+    Attributes:
+        function_name: Name reported as the Lambda function name.
+        memory_limit_in_mb: Memory limit reported to the handler.
+        timeout: Invocation timeout, in seconds. None means no deadline.
+    """
+
+    function_name: str = "lamina-local"
+    memory_limit_in_mb: int = 128
+    timeout: Optional[float] = 30.0
+    aws_request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    started_at: float = field(default_factory=time.monotonic)
+
+    def get_remaining_time_in_millis(self) -> int:
+        if self.timeout is None:
+            return 2**31 - 1
+        elapsed = time.monotonic() - self.started_at
+        return max(int((self.timeout - elapsed) * 1000), 0)
+
+
+@dataclass
+class Route:
+    method: str
+    path: str
+    handler: Callable[..., Any]
+    pattern: re.Pattern[str]
+
+    @classmethod
+    def build(cls, method: str, path: str, handler: Callable[..., Any]) -> "Route":
+        regex = ""
+        position = 0
+        for match in _PATH_PARAM_RE.finditer(path):
+            regex += re.escape(path[position : match.start()])
+            name, greedy = match.group(1), match.group(2)
+            regex += f"(?P<{name}>.+)" if greedy else f"(?P<{name}>[^/]+)"
+            position = match.end()
+        regex += re.escape(path[position:])
+        return cls(
+            method=method.upper(),
+            path=path,
+            handler=handler,
+            pattern=re.compile(f"^{regex}/?$"),
+        )
+
+    @property
+    def is_static(self) -> bool:
+        return "{" not in self.path
+
+
+@dataclass
+class Router:
+    """Match HTTP method and path to lamina handlers.
+
+    Static paths take precedence over paths with parameters, and are found
+    by a dictionary lookup instead of matching every route.
+    """
+
+    routes: List[Route] = field(default_factory=list)
+    _static: Optional[Dict[Tuple[str, str], Route]] = field(
+        default=None, init=False, repr=False
+    )
+
+    @classmethod
+    def from_handlers(cls, handlers: Iterable[Callable[..., Any]]) -> "Router":
+        """Route handlers by their registry routes.
+
+        Handlers serving the same method and path follow
+        `LAMINA_ROUTE_CONFLICTS`, see `HandlerRegistry.routes`.
+        """
+        if not isinstance(handlers, HandlerRegistry):
+            handlers = HandlerRegistry(handlers)
+        routes = [
+            Route.build(method, path, handler)
+            for (method, path), handler in handlers.routes().items()
+        ]
+        routes.sort(key=lambda r: (not r.is_static, -len(r.path)))
+        return cls(routes=routes)
+
+    def match(
+        self, method: str, path: str
+    ) -> Tuple[Optional[Route], Dict[str, str], List[str]]:
+        """Find the route for the request.
+
+        Returns:
+            A tuple (route, path_parameters, allowed_methods). Route is None
+            if no route matches; allowed methods is not empty if the path
+            exists with other methods.
+        """
+        method = method.upper()
+        if self._static is None:
+            static: Dict[Tuple[str, str], Route] = {}
+            for route in self.routes:
+                if route.is_static:
+                    static.setdefault((route.method, route.path), route)
+            self._static = static
+        for candidate in (method, "GET") if method == "HEAD" else (method,):
+            for route_path in (path, path[:-1]) if path.endswith("/") else (path,):
+                route = self._static.get((candidate, route_path))
+                if route is not None:
+                    return route, {}, []
+
+        allowed: List[str] = []
+        for route in self.routes:
+            found = route.pattern.match(path)
+            if found is None:
+                continue
+            if route.method == method or (route.method == "GET" and method == "HEAD"):
+                return route, found.groupdict(), []
+            allowed.append(route.method)
+        return None, {}, allowed
+
+
+def build_event(
+    *,
+    method: str,
+    path: str,
+    query_string: str = "",
+    headers: Iterable[Tuple[str, str]] = (),
+    body: bytes = b"",
+    path_parameters: Optional[Dict[str, str]] = None,
+    source_ip: str = "127.0.0.1",
+) -> Dict[str, Any]:
+    """Build an API Gateway REST (payload v1) event for an HTTP request."""
+    single_headers: Dict[str, str] = {}
+    multi_headers: Dict[str, List[str]] = {}
+    for name, value in headers:
+        single_headers[name] = value
+        multi_headers.setdefault(name, []).append(value)
+
+    query: Dict[str, str] = {}
+    multi_query: Dict[str, List[str]] = {}
+    for name, value in parse_qsl(query_string, keep_blank_values=True):
+        query[name] = value
+        multi_query.setdefault(name, []).append(value)
+
+    is_base64 = False
+    event_body: Optional[str] = None
+    if body:
+        try:
+            event_body = body.decode("utf-8")
+        except UnicodeDecodeError:
+            event_body = base64.b64encode(body).decode("ascii")
+            is_base64 = True
+
+    return {
+        "resource": path,
+        "path": path,
+        "httpMethod": method.upper(),
+        "headers": single_headers,
+        "multiValueHeaders": multi_headers,
+        "queryStringParameters": query or None,
+        "multiValueQueryStringParameters": multi_query or None,
+        "pathParameters": path_parameters or None,
+        "requestContext": {
+            "httpMethod": method.upper(),
+            "path": path,
+            "requestTimeEpoch": int(time.time() * 1000),
+            "identity": {"sourceIp": source_ip},
+        },
+        "body": event_body,
+        "isBase64Encoded": is_base64,
+    }
+
+
+def response_body_bytes(response: Dict[str, Any]) -> bytes:
+    """Return the raw HTTP body of a lamina response."""
+    body = response.get("body")
+    if not body:
+        return b""
+    if response.get("isBase64Encoded"):
+        return base64.b64decode(body)
+    return body.encode("utf-8") if isinstance(body, str) else bytes(body)
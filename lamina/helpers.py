@@ -1,11 +1,19 @@
 import asyncio
+import binascii
+import hashlib
+import importlib
 import json
+import mmap
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from decimal import Decimal
-from typing import Callable, Coroutine, Union
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Mapping, TypeVar, Union
 
 from asgiref.sync import SyncToAsync, sync_to_async
 
+from lamina import conf
+
 
 class DecimalEncoder(json.JSONEncoder):
     def default(self, o):
@@ -16,6 +24,211 @@ class DecimalEncoder(json.JSONEncoder):
         return super(DecimalEncoder, self).default(o)
 
 
-def async_(func: Callable) -> Union[Coroutine, SyncToAsync, Callable]:
-    """Returns a coroutine function."""
-    return func if asyncio.iscoroutinefunction(func) else sync_to_async(func)
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the container-scoped thread pool used to run sync code concurrently."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=conf.LAMINA_THREAD_POOL_WORKERS or None,
+                    thread_name_prefix="lamina",
+                )
+    return _executor
+
+
+def async_(
+    func: Callable, executor: ThreadPoolExecutor | None = None
+) -> Union[Coroutine, SyncToAsync, Callable]:
+    """Returns a coroutine function.
+
+    If an executor is provided, sync functions run in its threads and can
+    execute concurrently, instead of in the single thread-sensitive thread.
+    """
+    if asyncio.iscoroutinefunction(func):
+        return func
+    if executor is not None:
+        return sync_to_async(func, thread_sensitive=False, executor=executor)
+    return sync_to_async(func)
+
+
+T = TypeVar("T")
+
+_loops = threading.local()
+
+
+def run_coroutine(coro: Awaitable[T]) -> T:
+    """Run a coroutine in the container-scoped event loop of the current thread.
+
+    Unlike `asyncio.run`, the loop is reused between invocations, so async
+    clients created in one invocation (e.g. container resources) remain usable.
+    """
+    loop = getattr(_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _loops.loop = loop
+    return loop.run_until_complete(coro)
+
+
+def run_inline(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine which never suspends, without an event loop."""
+    try:
+        coro.send(None)
+    except StopIteration as result:
+        return result.value
+    coro.close()
+    raise RuntimeError("Coroutine suspended outside of an event loop.")
+
+
+def get_header(headers: Mapping[str, Any] | None, name: str) -> str | None:
+    """Return a header value using a case-insensitive lookup."""
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is not None:
+        return value
+    lower_name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == lower_name:
+            return value
+    return None
+
+
+def get_http_method(event: Dict[str, Any]) -> str:
+    """Return the upper-cased HTTP method of an API Gateway event (v1 or v2)."""
+    method = event.get("httpMethod")
+    if not method:
+        http_context = (event.get("requestContext") or {}).get("http") or {}
+        method = http_context.get("method") or ""
+    return method.upper()
+
+
+def get_request_path(event: Dict[str, Any]) -> str:
+    """Return the requested path of an API Gateway event (v1 or v2)."""
+    return event.get("path") or event.get("rawPath") or ""
+
+
+def compute_etag(body: str | bytes) -> str:
+    """Return a strong ETag for the body, using a BLAKE2b content hash."""
+    data = body.encode("utf-8") if isinstance(body, str) else body
+    return f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str | None) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+# Characters encoded at a time to measure non-ASCII bodies
+_SIZE_CHUNK = 64 * 1024
+
+
+def get_body_size(
+    body: str | bytes | None, is_base64: bool = False, limit: int | None = None
+) -> int:
+    """Return the size in bytes of a request body, without decoding it.
+
+    For base64 encoded bodies, returns the decoded size (an upper bound if
+    the text contains line breaks). Non-ASCII text is measured in UTF-8
+    bytes, a chunk at a time. With a `limit`, text which fits in it even at
+    4 bytes per character is not measured: its length in characters is
+    returned.
+    """
+    if not body:
+        return 0
+    if is_base64:
+        padding = len(body) - len(body.rstrip("=" if isinstance(body, str) else b"="))
+        return len(body) * 3 // 4 - padding
+    if isinstance(body, str) and not body.isascii():
+        if limit is not None and len(body) * 4 <= limit:
+            return len(body)
+        return sum(
+            len(body[start : start + _SIZE_CHUNK].encode("utf-8"))
+            for start in range(0, len(body), _SIZE_CHUNK)
+        )
+    return len(body)
+
+
+def decode_base64(body: str | bytes) -> bytes:
+    """Decode a base64 body into a single buffer of the decoded size."""
+    return binascii.a2b_base64(body, strict_mode=False)
+
+
+BINARY_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+# Multiple of 3, so encoded chunks can be concatenated without padding
+_BASE64_CHUNK_SIZE = 3 * 256 * 1024
+
+
+def is_binary(value: Any) -> bool:
+    """Check if a handler response must be sent as a binary body."""
+    return isinstance(value, BINARY_TYPES) or (
+        hasattr(value, "read") and not isinstance(value, (str, dict, list))
+    )
+
+
+def encode_base64(value: Any, head_size: int = 2048) -> tuple[str, bytes]:
+    """Base64 encode a binary response body.
+
+    Buffers (bytes, bytearray, memoryview, mmap) are encoded in a single
+    pass, without intermediate copies. File-like objects are read and
+    encoded in chunks, then closed.
+
+    Returns:
+        The encoded body and its first `head_size` bytes, used to detect the
+        content type.
+    """
+    if isinstance(value, BINARY_TYPES):
+        view = memoryview(value)
+        head = bytes(view[:head_size])
+        return binascii.b2a_base64(view, newline=False).decode("ascii"), head
+
+    chunks = []
+    head = b""
+    pending = b""
+    try:
+        while True:
+            chunk = value.read(_BASE64_CHUNK_SIZE)
+            if not chunk:
+                break
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            if len(head) < head_size:
+                head += chunk[: head_size - len(head)]
+            # Short reads may break the 3 bytes alignment; keep the remainder
+            data = pending + chunk if pending else chunk
+            cut = len(data) - len(data) % 3
+            chunks.append(binascii.b2a_base64(data[:cut], newline=False))
+            pending = data[cut:]
+    finally:
+        if hasattr(value, "close"):
+            value.close()
+    chunks.append(binascii.b2a_base64(pending, newline=False))
+    return b"".join(chunks).decode("ascii"), head
+
+
+def import_string(path: str) -> Any:
+    """Import an object from a 'module.attr' or 'module:attr' path."""
+    if ":" in path:
+        module_path, attr = path.split(":", 1)
+    else:
+        module_path, _, attr = path.rpartition(".")
+    if not module_path or not attr:
+        raise ImportError(f"'{path}' is not a valid import path")
+    module = importlib.import_module(module_path)
+    try:
+        return getattr(module, attr)
+    except AttributeError as error:
+        raise ImportError(f"Could not import '{path}'") from error
@@ -0,0 +1,333 @@
+"""Idempotency layer for lamina handlers.
+
+Duplicate deliveries of the same request (same idempotency key) receive the
+stored response without executing the handler again. Records are kept in a
+pluggable store: an in-memory and a SQLite store are available for local use
+and tests, and a DynamoDB store for production.
+"""
+
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Mapping, Optional
+
+from pydantic import BaseModel, RootModel
+
+from lamina.helpers import DecimalEncoder, get_header
+
+
+class IdempotencyStatus(str, Enum):
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETED = "COMPLETED"
+
+
+@dataclass
+class IdempotencyRecord:
+    key: str
+    status: IdempotencyStatus
+    expires_at: float
+    response: Optional[Dict[str, Any]] = None
+
+    def is_expired(self, now: float | None = None) -> bool:
+        return self.expires_at < (now or time.time())
+
+
+@dataclass
+class IdempotencyStore(ABC):
+    """Base class for idempotency stores.
+
+    Stores must implement `put_in_progress` atomically: only one caller can
+    create the in-progress record for a given key.
+    """
+
+    @abstractmethod
+    def put_in_progress(
+        self, key: str, expires_at: float
+    ) -> Optional[IdempotencyRecord]:
+        """Create an in-progress record for the key.
+
+        Returns:
+            None only if the record was created, otherwise the existing
+            (non-expired) record for the key.
+        """
+
+    @abstractmethod
+    def complete(self, key: str, response: Dict[str, Any], expires_at: float) -> None:
+        """Mark the key as completed, storing the serialized response."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the key, so the request can be executed again."""
+
+
+@dataclass
+class MemoryIdempotencyStore(IdempotencyStore):
+    """Container-scoped store. Useful for tests and local development."""
+
+    _records: Dict[str, IdempotencyRecord] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def put_in_progress(
+        self, key: str, expires_at: float
+    ) -> Optional[IdempotencyRecord]:
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None and not record.is_expired():
+                return copy.deepcopy(record)
+            self._records[key] = IdempotencyRecord(
+                key=key, status=IdempotencyStatus.IN_PROGRESS, expires_at=expires_at
+            )
+            return None
+
+    def complete(self, key: str, response: Dict[str, Any], expires_at: float) -> None:
+        with self._lock:
+            self._records[key] = IdempotencyRecord(
+                key=key,
+                status=IdempotencyStatus.COMPLETED,
+                expires_at=expires_at,
+                response=copy.deepcopy(response),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._records.pop(key, None)
+
+
+@dataclass
+class SQLiteIdempotencyStore(IdempotencyStore):
+    """File based store using SQLite.
+
+    Attributes:
+        path: Database file path. Use ":memory:" for a private database.
+        table_name: Table used to keep the records.
+    """
+
+    path: str = ":memory:"
+    table_name: str = "lamina_idempotency"
+    _connection: sqlite3.Connection | None = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} "  # nosec B608
+                "(key TEXT PRIMARY KEY, status TEXT, expires_at REAL, response TEXT)"
+            )
+        return self._connection
+
+    def put_in_progress(
+        self, key: str, expires_at: float
+    ) -> Optional[IdempotencyRecord]:
+        with self._lock:
+            cursor = self.connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                row = cursor.execute(
+                    f"SELECT status, expires_at, response "  # nosec B608
+                    f"FROM {self.table_name} WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and row[1] >= time.time():
+                    cursor.execute("COMMIT")
+                    return IdempotencyRecord(
+                        key=key,
+                        status=IdempotencyStatus(row[0]),
+                        expires_at=row[1],
+                        response=json.loads(row[2]) if row[2] else None,
+                    )
+                cursor.execute(
+                    f"INSERT OR REPLACE INTO {self.table_name} "  # nosec B608
+                    "(key, status, expires_at, response) VALUES (?, ?, ?, NULL)",
+                    (key, IdempotencyStatus.IN_PROGRESS.value, expires_at),
+                )
+                cursor.execute("COMMIT")
+                return None
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+
+    def complete(self, key: str, response: Dict[str, Any], expires_at: float) -> None:
+        with self._lock:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} "  # nosec B608
+                "(key, status, expires_at, response) VALUES (?, ?, ?, ?)",
+                (
+                    key,
+                    IdempotencyStatus.COMPLETED.value,
+                    expires_at,
+                    json.dumps(response),
+                ),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self.connection.execute(
+                f"DELETE FROM {self.table_name} WHERE key = ?",  # nosec B608
+                (key,),
+            )
+
+
+@dataclass
+class DynamoDBIdempotencyStore(IdempotencyStore):
+    """Store using a DynamoDB table with `key_attr` as partition key.
+
+    Enable DynamoDB TTL on `expiration_attr` to clean up old records.
+    The boto3 client is created on first use if not provided.
+
+    Attributes:
+        table_name: DynamoDB table name.
+        client: Optional boto3 DynamoDB client.
+        key_attr: Partition key attribute name.
+        expiration_attr: Attribute name with the record expiration (epoch seconds).
+        put_attempts: Conditional puts tried when the existing record is
+            deleted or expires between the failed put and its read. After
+            that, the key is reported as in progress.
+    """
+
+    table_name: str
+    client: Any = None
+    key_attr: str = "id"
+    expiration_attr: str = "expiration"
+    status_attr: str = "status"
+    response_attr: str = "response"
+    put_attempts: int = 3
+
+    def _get_client(self) -> Any:
+        if self.client is None:
+            import boto3
+
+            self.client = boto3.client("dynamodb")
+        return self.client
+
+    def put_in_progress(
+        self, key: str, expires_at: float
+    ) -> Optional[IdempotencyRecord]:
+        client = self._get_client()
+        for _ in range(self.put_attempts):
+            try:
+                client.put_item(
+                    TableName=self.table_name,
+                    Item={
+                        self.key_attr: {"S": key},
+                        self.status_attr: {"S": IdempotencyStatus.IN_PROGRESS.value},
+                        self.expiration_attr: {"N": str(int(expires_at))},
+                    },
+                    ConditionExpression="attribute_not_exists(#key) OR #exp < :now",
+                    ExpressionAttributeNames={
+                        "#key": self.key_attr,
+                        "#exp": self.expiration_attr,
+                    },
+                    ExpressionAttributeValues={":now": {"N": str(int(time.time()))}},
+                )
+                return None
+            except client.exceptions.ConditionalCheckFailedException:
+                record = self._get_record(key)
+                if record is not None and not record.is_expired():
+                    return record
+                # Deleted or expired after the check failed: try again
+        # Never report the lock as acquired without a successful put
+        return IdempotencyRecord(
+            key=key, status=IdempotencyStatus.IN_PROGRESS, expires_at=expires_at
+        )
+
+    def _get_record(self, key: str) -> Optional[IdempotencyRecord]:
+        item = (
+            self._get_client()
+            .get_item(
+                TableName=self.table_name,
+                Key={self.key_attr: {"S": key}},
+                ConsistentRead=True,
+            )
+            .get("Item")
+        )
+        if not item:
+            return None
+        response = item.get(self.response_attr, {}).get("S")
+        return IdempotencyRecord(
+            key=key,
+            status=IdempotencyStatus(item[self.status_attr]["S"]),
+            expires_at=float(item[self.expiration_attr]["N"]),
+            response=json.loads(response) if response else None,
+        )
+
+    def complete(self, key: str, response: Dict[str, Any], expires_at: float) -> None:
+        self._get_client().put_item(
+            TableName=self.table_name,
+            Item={
+                self.key_attr: {"S": key},
+                self.status_attr: {"S": IdempotencyStatus.COMPLETED.value},
+                self.expiration_attr: {"N": str(int(expires_at))},
+                self.response_attr: {"S": json.dumps(response)},
+            },
+        )
+
+    def delete(self, key: str) -> None:
+        self._get_client().delete_item(
+            TableName=self.table_name, Key={self.key_attr: {"S": key}}
+        )
+
+
+@dataclass
+class Idempotency:
+    """Idempotency configuration for a lamina handler.
+
+    The key is read from the `header` request header. If the header is
+    missing and `use_payload_hash` is True, a hash of the validated payload
+    is used instead. A hash of the `vary_headers` values is added to the key,
+    so different callers never receive each other's stored responses.
+
+    Attributes:
+        store: Store used to persist the idempotency records.
+        header: Request header with the idempotency key.
+        use_payload_hash: Derive the key from the payload when header is missing.
+        vary_headers: Request header names identifying the caller, which are
+            part of the key. Defaults to `Authorization`.
+        ttl: Seconds a completed response is kept.
+        in_progress_ttl: Seconds an in-progress record blocks duplicates, after
+            which the request can be executed again (e.g. after a crash).
+    """
+
+    store: IdempotencyStore = field(default_factory=MemoryIdempotencyStore)
+    header: str | None = "Idempotency-Key"
+    use_payload_hash: bool = True
+    vary_headers: tuple[str, ...] = ("Authorization",)
+    ttl: int = 3600
+    in_progress_ttl: int = 60
+
+    def get_key(
+        self, namespace: str, headers: Mapping[str, Any] | None, data: Any
+    ) -> str | None:
+        """Return the idempotency key for the request, or None to skip it."""
+        value = get_header(headers, self.header) if self.header else None
+        if not value and self.use_payload_hash:
+            value = hashlib.blake2b(_payload_bytes(data), digest_size=16).hexdigest()
+        if not value:
+            return None
+        caller = [get_header(headers, name) or "" for name in self.vary_headers]
+        if any(caller):
+            # Hashed, so credentials are never written to the store
+            digest = hashlib.blake2b(
+                json.dumps(caller).encode("utf-8"), digest_size=16
+            ).hexdigest()
+            return f"{namespace}#{digest}#{value}"
+        return f"{namespace}#{value}"
+
+
+def _payload_bytes(data: Any) -> bytes:
+    if isinstance(data, (BaseModel, RootModel)):
+        return data.model_dump_json().encode("utf-8")
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    return json.dumps(data, sort_keys=True, cls=DecimalEncoder).encode("utf-8")
@@ -1,15 +1,20 @@
-import asyncio
+import copy
 import functools
 import inspect
+import io
 import json
 import os
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
+    List,
+    NotRequired,
     Optional,
+    Tuple,
     Type,
     TypedDict,
     TypeVar,
@@ -21,10 +26,39 @@ from loguru import logger
 from pydantic import BaseModel, RootModel, ValidationError
 
 from lamina import conf
-from lamina.helpers import DecimalEncoder
+from lamina.cache import ResponseCache
+from lamina.concurrency import Call, CallTiming, gather
+from lamina.deadline import Deadline, DeadlineExceeded, run_with_deadline
+from lamina.errors import error_response, format_validation_errors, log_client_error
+from lamina.fieldsets import EXCLUDE_PARAM, FIELDS_PARAM, get_projection
+from lamina.helpers import (
+    DecimalEncoder,
+    async_,
+    compute_etag,
+    decode_base64,
+    encode_base64,
+    etag_matches,
+    get_body_size,
+    get_executor,
+    get_header,
+    get_http_method,
+    is_binary,
+    run_coroutine,
+    run_inline,
+)
+from lamina.idempotency import Idempotency, IdempotencyStatus
+from lamina.memory import MemoryTracker
+from lamina.recorder import get_recorder
+from lamina.registry import HandlerRegistry
+from lamina.resources import Resources
+from lamina.resources import bind as bind_resources
+from lamina.timing import PhaseTimer
+from lamina.validation import ValidationPolicy
+from lamina.warmup import is_warmup_event
+from lamina.warmup import warmup as warmup_handlers
 
 # Global registry of lamina-decorated handlers (wrappers)
-LAMINA_REGISTRY: list[Callable[..., Any]] = []
+LAMINA_REGISTRY = HandlerRegistry()
 
 SchemaType = TypeVar("SchemaType", bound=BaseModel | RootModel)
 
@@ -38,6 +72,12 @@ class Request(Generic[SchemaType]):
         event: Original AWS Lambda event.
         context: Lambda context object.
         query: Optional parsed query parameters if params_in schema is provided.
+        resources: Container-scoped resources registered in `lamina.resources`.
+        deadline: Request deadline, computed from the Lambda context.
+        timings: Elapsed milliseconds of each finished phase of the invocation.
+        call_timings: Timing of each call made with `gather`.
+        memory_usage: Memory used by each finished phase, in MB, when memory
+            tracking is enabled.
     """
 
     data: Union[SchemaType, str]
@@ -45,12 +85,93 @@ class Request(Generic[SchemaType]):
     context: Optional[Dict[str, Any]]
     headers: Optional[Dict[str, Any]]
     query: Optional[BaseModel] = None
+    resources: Resources = field(default_factory=bind_resources)
+    deadline: Deadline = field(default_factory=Deadline)
+    timings: Dict[str, float] = field(default_factory=dict)
+    call_timings: List[CallTiming] = field(default_factory=list)
+    memory_usage: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    def remaining_time(self) -> float | None:
+        """Seconds until the request deadline, or None if there is no deadline."""
+        return self.deadline.remaining()
+
+    async def gather(self, *calls: Call, limit: Optional[int] = None) -> List[Any]:
+        """Run calls concurrently, respecting the request deadline.
+
+        See `lamina.concurrency.gather` for details.
+        """
+        return await gather(
+            *calls, limit=limit, deadline=self.deadline, timings=self.call_timings
+        )
 
 
 class ResponseDict(TypedDict):
     statusCode: int
     headers: Dict[str, str]
     body: str
+    isBase64Encoded: NotRequired[bool]
+
+
+def _not_modified(response: ResponseDict) -> ResponseDict:
+    """Build a 304 response keeping the validators of the full response."""
+    headers = {
+        key: value
+        for key, value in response["headers"].items()
+        if key.lower() not in ("content-type", "content-length")
+    }
+    return {"statusCode": 304, "headers": headers, "body": ""}
+
+
+def _warmup_response() -> ResponseDict:
+    return {
+        "statusCode": 200,
+        "headers": {"Content-Type": "application/json; charset=utf-8"},
+        "body": '{"warmup": true}',
+    }
+
+
+@dataclass
+class _Hooks:
+    """Hooks resolved from settings for one invocation."""
+
+    pre_parse: Callable[..., Any]
+    pre_execute: Callable[..., Any]
+    pos_execute: Callable[..., Any]
+    pre_response: Callable[..., Any]
+
+    @classmethod
+    def resolve(cls) -> "_Hooks":
+        return cls(
+            pre_parse=conf.LAMINA_PRE_PARSE_CALLBACK,
+            pre_execute=conf.LAMINA_PRE_EXECUTE_CALLBACK,
+            pos_execute=conf.LAMINA_POS_EXECUTE_CALLBACK,
+            pre_response=conf.LAMINA_PRE_RESPONSE_CALLBACK,
+        )
+
+    @property
+    def is_async(self) -> bool:
+        return any(
+            inspect.iscoroutinefunction(hook)
+            for hook in (
+                self.pre_parse,
+                self.pre_execute,
+                self.pos_execute,
+                self.pre_response,
+            )
+        )
+
+
+async def _call(func: Callable[..., Any], *args: Any, offload: bool = False) -> Any:
+    """Call a sync or async function from the execution pipeline.
+
+    If offload is True, sync functions run in the container-scoped thread
+    pool, so blocking I/O does not block the event loop.
+    """
+    if inspect.iscoroutinefunction(func):
+        return await func(*args)
+    if offload:
+        return await async_(func, executor=get_executor())(*args)
+    return func(*args)
 
 
 def lamina(
@@ -65,14 +186,42 @@ def lamina(
     add_to_spec: bool = True,
     methods: Optional[list[str]] = None,
     tags: Optional[list[str]] = None,
+    cache: ResponseCache | bool | None = None,
+    etag: bool = False,
+    idempotency: Idempotency | None = None,
+    offload_sync: bool | None = None,
+    max_body_bytes: int | None = None,
+    stream_body: bool = False,
+    decode_base64_body: bool | None = None,
+    warmup: bool = False,
+    validation: ValidationPolicy | None = None,
+    sparse_fields: bool = False,
 ) -> Callable[[Callable[..., Any]], Callable[..., ResponseDict]]:
+    if stream_body and schema_in is not None:
+        raise ValueError("stream_body cannot be used with schema_in.")
+    if sparse_fields and schema_out is None:
+        raise ValueError("sparse_fields requires schema_out.")
+    if sparse_fields and params_in is not None:
+        reserved = {FIELDS_PARAM, EXCLUDE_PARAM} & {
+            field.alias or name for name, field in params_in.model_fields.items()
+        }
+        if reserved:
+            raise ValueError(
+                f"params_in cannot declare {', '.join(sorted(reserved))} "
+                "with sparse_fields."
+            )
+    response_cache = ResponseCache() if cache is True else (cache or None)
+
     def decorator(f: Callable[..., Any]) -> Callable[..., ResponseDict]:
-        @functools.wraps(f)
-        def wrapper(
+        # One policy per handler, so outcome counters are per handler
+        validation_policy = validation or ValidationPolicy()
+
+        async def execute(
             event: Dict[str, Any] | bytes | str,
             context: Optional[Dict[str, Any]],
-            *args: Any,
-            **kwargs: Any,
+            hooks: Optional[_Hooks],
+            offload: bool,
+            timer: PhaseTimer,
         ) -> ResponseDict:
             if f.__doc__:
                 title = f.__doc__.split("\n")[0].strip()
@@ -83,14 +232,44 @@ def lamina(
             logger.info(f"******* {title.upper()} *******")
 
             magic_content_type = "application/json"
+            idempotency_key: str | None = None
+            idempotency_completed = False
+            request_resources = bind_resources()
+            deadline = Deadline.from_context(
+                context, conf.LAMINA_DEADLINE_SAFETY_MARGIN_MS
+            )
 
             try:
+                if hooks is None:
+                    hooks = _Hooks.resolve()
+
                 # Run pre-parse hook (may adjust event)
-                pre_parse_hook = conf.LAMINA_PRE_PARSE_CALLBACK
-                if inspect.iscoroutinefunction(pre_parse_hook):
-                    event = asyncio.run(pre_parse_hook(event, context))
-                else:
-                    event = pre_parse_hook(event, context)
+                event = await _call(hooks.pre_parse, event, context, offload=offload)
+                timer.lap("pre_parse")
+
+                # Reject large bodies before decoding them
+                body_limit = (
+                    conf.LAMINA_MAX_BODY_BYTES
+                    if max_body_bytes is None
+                    else max_body_bytes
+                )
+                is_base64 = (
+                    isinstance(event, dict)
+                    and not step_functions
+                    and bool(event.get("isBase64Encoded", False))
+                )
+                if body_limit and isinstance(event, dict) and not step_functions:
+                    body_size = get_body_size(
+                        event.get("body"), is_base64, limit=body_limit
+                    )
+                    if body_size > body_limit:
+                        log_client_error(
+                            f"Request body has {body_size} bytes, "
+                            f"limit is {body_limit} bytes."
+                        )
+                        return error_response(
+                            413, "Request body too large.", constant=True
+                        )
 
                 # Parse Headers
                 headers = event.get("headers", {}) if isinstance(event, dict) else {}
@@ -101,58 +280,95 @@ def lamina(
                 query_info = None
                 if params_in:
                     query_data = (
-                        event.get("queryStringParameters", {})
+                        event.get("queryStringParameters") or {}
                         if isinstance(event, dict)
                         else {}
                     )
+                    if sparse_fields:
+                        # Fieldsets are not query parameters of the handler
+                        query_data = {
+                            key: value
+                            for key, value in query_data.items()
+                            if key not in (FIELDS_PARAM, EXCLUDE_PARAM)
+                        }
                     query_info = params_in(**query_data)
 
+                # Check the requested response fields before running the handler
+                projection = None
+                if sparse_fields and isinstance(event, dict):
+                    projection = get_projection(
+                        schema_out, event.get("queryStringParameters")
+                    )
+
+                # Cached responses are looked up after the pre-execute hook
+                cache_key = None
+                if response_cache is not None:
+                    cache_key = response_cache.make_key(
+                        event, query_info, projection.key if projection else ""
+                    )
+
                 # Parse input (after possible pre-parse modification)
-                if schema_in is None:
-                    data = (
-                        event["body"]
-                        if (isinstance(event, dict) and not step_functions)
-                        else event
+                # Schemas and streams get decoded bytes; handlers without
+                # schema_in get the base64 text unless decoding is enabled
+                decode_body = is_base64 and (
+                    schema_in is not None
+                    or stream_body
+                    or (
+                        conf.LAMINA_DECODE_BASE64_BODY
+                        if decode_base64_body is None
+                        else decode_base64_body
                     )
+                )
+                if decode_body:
+                    # Decode once; handlers and schemas receive raw bytes
+                    logger.debug("Body received is base64 encoded, decoding...")
+                    raw_body: Any = decode_base64(event["body"] or "")
+                elif isinstance(event, dict) and not step_functions:
+                    raw_body = event["body"]
                 else:
-                    # First check if is Base64 encoded
-                    is_base64 = (
-                        event.get("isBase64Encoded", False)
-                        if isinstance(event, dict)
-                        else False
+                    raw_body = event
+
+                if stream_body:
+                    if isinstance(raw_body, str):
+                        raw_body = raw_body.encode("utf-8")
+                    data = io.BytesIO(raw_body or b"")
+                elif schema_in is None:
+                    data = raw_body
+                elif is_base64:
+                    logger.debug(f"Running {schema_in.__name__} on decoded body...")
+                    data = (
+                        validation_policy.load(
+                            "input", schema_in, raw_body, unpack=False
+                        )
+                        if issubclass(schema_in, RootModel)
+                        else validation_policy.load_json("input", schema_in, raw_body)
                     )
-                    if is_base64:
+                else:
+                    try:
+                        # Try to parse body as JSON first
+                        is_json = isinstance(event, dict) and not step_functions
+                        request_body = json.loads(raw_body) if is_json else raw_body
                         logger.debug(
-                            f"Body received is base64 encoded, "
-                            f"passing raw and run {schema_in.__name__}..."
+                            f"Body received is JSON, "
+                            f"parsing and run {schema_in.__name__}..."
                         )
-                        decoded_body = (
-                            event["body"]
-                            if (isinstance(event, dict) and not step_functions)
-                            else event
+                        data = validation_policy.load(
+                            "input",
+                            schema_in,
+                            request_body,
+                            unpack=True,
+                            json_text=raw_body if is_json else None,
                         )
-                        data = schema_in(decoded_body)
-                    else:
-                        try:
-                            # Try to parse body as JSON first
-                            request_body = (
-                                json.loads(event["body"])
-                                if (isinstance(event, dict) and not step_functions)
-                                else event
-                            )
-                            logger.debug(
-                                f"Body received is JSON, "
-                                f"parsing and run {schema_in.__name__}..."
-                            )
-                            data = schema_in(**request_body)
-                        except (json.JSONDecodeError, TypeError):
-                            # Fallback: pass raw body to schema
-                            logger.debug(
-                                f"Body received is not JSON, "
-                                f"passing raw and run {schema_in.__name__}..."
-                            )
-                            request_body = event
-                            data = schema_in(request_body)
+                    except (json.JSONDecodeError, TypeError):
+                        # Fallback: pass raw body to schema
+                        logger.debug(
+                            f"Body received is not JSON, "
+                            f"passing raw and run {schema_in.__name__}..."
+                        )
+                        request_body = event
+                        data = schema_in(request_body)
+
+                timer.lap("parse")
 
                 # Build initial Request and run pre-execute hook
                 request = Request(
@@ -161,29 +377,73 @@ def lamina(
                     context=context,
                     query=query_info,
                     headers=headers,
+                    resources=request_resources,
+                    deadline=deadline,
+                    timings=timer.timings,
+                    memory_usage=timer.memory.usage if timer.memory else {},
                 )
-                pre_execute_hook = conf.LAMINA_PRE_EXECUTE_CALLBACK
-                if inspect.iscoroutinefunction(pre_execute_hook):
-                    request = asyncio.run(pre_execute_hook(request, event, context))
-                else:
-                    request = pre_execute_hook(request, event, context)
+                request = await _call(
+                    hooks.pre_execute, request, event, context, offload=offload
+                )
+
+                # Return cached response before running handler and serialization
+                if response_cache is not None and cache_key is not None:
+                    cached_response = response_cache.get(cache_key)
+                    if cached_response is not None:
+                        logger.debug("Returning cached response.")
+                        if etag and etag_matches(
+                            get_header(headers, "If-None-Match"),
+                            get_header(cached_response["headers"], "ETag"),
+                        ):
+                            return _not_modified(cached_response)
+                        return cached_response  # type: ignore[return-value]
+
+                # Return stored response for duplicate deliveries
+                if idempotency is not None:
+                    idempotency_key = idempotency.get_key(
+                        wrapper.import_path, headers, request.data
+                    )
+                if idempotency_key is not None:
+                    record = idempotency.store.put_in_progress(
+                        idempotency_key, time.time() + idempotency.in_progress_ttl
+                    )
+                    if record is not None:
+                        # Key belongs to another execution: never release it here
+                        idempotency_key = None
+                        if record.status == IdempotencyStatus.COMPLETED:
+                            logger.info("Returning stored idempotent response.")
+                            return record.response  # type: ignore[return-value]
+                        return error_response(
+                            409,
+                            "A request with the same idempotency key "
+                            "is already in progress.",
+                            constant=True,
+                        )
 
+                timer.lap("pre_execute")
                 status_code = 200
 
+                request_headers = headers
                 headers: Dict[str, str] = {}
 
                 # check if function is a coroutine
-                if inspect.iscoroutinefunction(f):
-                    response: Any = asyncio.run(f(request))
+                if deadline.expired:
+                    raise DeadlineExceeded("Request deadline exceeded.")
+                if is_async or offload or hooks.is_async:
+                    # In the event loop: sync handlers run in the thread pool,
+                    # so they can start their own loop and never block it
+                    response: Any = await run_with_deadline(
+                        _call(f, request, offload=True), deadline
+                    )
                 else:
                     response = f(request)
+                timer.lap("handler")
 
                 # Execute post-execution hook on raw response (before schema_out)
-                pos_execute_hook = conf.LAMINA_POS_EXECUTE_CALLBACK
-                if inspect.iscoroutinefunction(pos_execute_hook):
-                    response = asyncio.run(pos_execute_hook(response, request))
-                else:
-                    response = pos_execute_hook(response, request)
+                response = await _call(
+                    hooks.pos_execute, response, request, offload=offload
+                )
+                timer.lap("pos_execute")
 
                 if isinstance(response, tuple):
                     status_code = response[1]
@@ -191,32 +451,32 @@ def lamina(
                         headers = response[2]
                     response = response[0]
 
+                is_binary_body = is_binary(response)
                 try:
                     body: str | Any = response
-                    if body:
+                    if is_binary_body:
+                        body, head = encode_base64(response)
+                        magic_content_type = (
+                            magic.from_buffer(head, mime=True)
+                            if head
+                            else "application/octet-stream"
+                        )
+                    elif body:
                         if schema_out:
-                            if issubclass(schema_out, RootModel):
-                                root = schema_out(response).root
-                                if root is not None:
-                                    body = (
-                                        schema_out(response).model_dump_json(
-                                            by_alias=True
-                                        )
-                                        if not isinstance(root, str)
-                                        else root
-                                    )
-                            else:
-                                body = schema_out(**response).model_dump_json(
-                                    by_alias=True
-                                )
+                            body = validation_policy.dump_json(
+                                schema_out,
+                                response,
+                                include=projection and projection.include,
+                                exclude=projection and projection.exclude,
+                            )
                         body = (
                             json.dumps(body, cls=DecimalEncoder)
                             if not isinstance(body, str)
                             else body
                         )
-                    magic_content_type = (
-                        magic.from_buffer(body, mime=True) if body else "text/html"
-                    )
+                        magic_content_type = magic.from_buffer(body, mime=True)
+                    else:
+                        magic_content_type = "text/html"
                 except Exception as e:
                     # This is an Internal Server Error
                     logger.error(f"Error when attempt to serialize response: {e}")
@@ -233,65 +493,159 @@ def lamina(
                         cls=DecimalEncoder,
                     )
 
-                full_headers: Dict[str, str] = {
-                    "Content-Type": produces or f"{magic_content_type}; charset=utf-8",
-                }
+                timer.lap("serialize")
+
+                if produces:
+                    content_type = produces
+                elif is_binary_body:
+                    content_type = magic_content_type
+                else:
+                    content_type = f"{magic_content_type}; charset=utf-8"
+                full_headers: Dict[str, str] = {"Content-Type": content_type}
                 if headers:
                     full_headers.update(headers)
 
                 # Run pre-response hook just before returning
-                pre_response_hook = conf.LAMINA_PRE_RESPONSE_CALLBACK
-                if inspect.iscoroutinefunction(pre_response_hook):
-                    body = asyncio.run(pre_response_hook(body))  # type: ignore[misc]
-                else:
-                    body = pre_response_hook(body)
+                body = await _call(hooks.pre_response, body, offload=offload)
+                timer.lap("pre_response")
+                logger.debug(f"Phase timings (ms): {timer.timings}")
+                if timer.memory is not None:
+                    logger.debug(f"Phase memory (MB): {timer.memory.usage}")
+
+                # Add validator for conditional GET requests
+                conditional = (
+                    etag
+                    and 200 <= status_code < 300
+                    and isinstance(body, str)
+                    and isinstance(event, dict)
+                    and get_http_method(event) in ("GET", "HEAD")
+                )
+                if conditional and get_header(full_headers, "ETag") is None:
+                    full_headers["ETag"] = compute_etag(body)
 
-                return {
+                lambda_response: ResponseDict = {
                     "statusCode": status_code,
                     "headers": full_headers,
-                    "body": body,  # type: ignore[return-value]
+                    "body": body,  # type: ignore[typeddict-item]
                 }
+                if is_binary_body and status_code < 500:
+                    lambda_response["isBase64Encoded"] = True
+                if cache_key is not None and 200 <= status_code < 300:
+                    response_cache.set(cache_key, lambda_response)
+                if idempotency_key is not None and status_code < 500:
+                    idempotency.store.complete(
+                        idempotency_key, lambda_response, time.time() + idempotency.ttl
+                    )
+                    idempotency_completed = True
+                if conditional and etag_matches(
+                    get_header(request_headers, "If-None-Match"),
+                    get_header(full_headers, "ETag"),
+                ):
+                    return _not_modified(lambda_response)
+                return lambda_response
             except ValidationError as e:
-                messages = [
-                    {
-                        "field": (
-                            error["loc"][0] if error.get("loc") else "ModelValidation"
-                        ),
-                        "message": error["msg"],
-                    }
-                    for error in e.errors()
-                ]
-                logger.error(messages)
-                body = json.dumps({conf.LAMINA_DEFAULT_ERROR_KEY: messages})
-                return {
-                    "statusCode": 422,
-                    "body": body,
-                    "headers": {
-                        "Content-Type": "application/json; charset=utf-8",
-                    },
-                }
+                messages = format_validation_errors(e)
+                log_client_error(f"Validation error: {messages}")
+                return error_response(422, messages)
+            except DeadlineExceeded as e:
+                timer.lap("timeout")
+                logger.error(f"{e} Phase timings (ms): {timer.timings}")
+                return error_response(504, str(e), timings=timer.timings)
             except (ValueError, TypeError) as e:
-                message = f"Error when attempt to read received event: {e}."
-                logger.error(str(e))
-                logger.exception(e)
-                body = json.dumps({conf.LAMINA_DEFAULT_ERROR_KEY: message})
-                return {
-                    "statusCode": 400,
-                    "body": body,
-                    "headers": {
-                        "Content-Type": "application/json; charset=utf-8",
-                    },
-                }
+                request_resources.reset_on_error(e)
+                log_client_error(str(e), e)
+                return error_response(
+                    400, f"Error when attempt to read received event: {e}."
+                )
             except Exception as e:
+                request_resources.reset_on_error(e)
                 logger.exception(e)
-                body = json.dumps({conf.LAMINA_DEFAULT_ERROR_KEY: str(e)})
-                return {
-                    "statusCode": 500,
-                    "body": body,
-                    "headers": {
-                        "Content-Type": "application/json; charset=utf-8",
-                    },
-                }
+                return error_response(500, str(e))
+            finally:
+                # Release the key so a retry can execute the handler again
+                if idempotency_key is not None and not idempotency_completed:
+                    idempotency.store.delete(idempotency_key)
+
+        async def invoke(
+            event: Dict[str, Any] | bytes | str,
+            context: Optional[Dict[str, Any]],
+            hooks: Optional[_Hooks],
+            offload: bool,
+        ) -> ResponseDict:
+            if not step_functions and is_warmup_event(event):
+                logger.debug("Warm-up ping received.")
+                return _warmup_response()
+
+            timer = PhaseTimer(memory=MemoryTracker.from_settings())
+            recorder = get_recorder()
+            if recorder is None or not recorder.should_record():
+                response = await execute(event, context, hooks, offload, timer)
+                if timer.memory is not None:
+                    timer.memory.check(context)
+                return response
+
+            # Keep the received event, as hooks may change it
+            received = copy.deepcopy(event)
+            response = await execute(event, context, hooks, offload, timer)
+            if timer.memory is not None:
+                timer.memory.check(context)
+            recorder.record(
+                wrapper.import_path,
+                received,
+                context,
+                response,
+                {**timer.timings, "total": timer.total},
+            )
+            return response
+
+        is_async = inspect.iscoroutinefunction(f)
+
+        def _prepare(
+            offload_override: bool | None = None,
+        ) -> Tuple[Optional[_Hooks], bool]:
+            try:
+                hooks = _Hooks.resolve()
+            except Exception:
+                # Resolved again inside execute, to build the error response
+                hooks = None
+            if offload_override is not None:
+                offload = offload_override
+            elif offload_sync is not None:
+                offload = offload_sync
+            else:
+                offload = conf.LAMINA_OFFLOAD_SYNC
+            return hooks, offload
+
+        @functools.wraps(f)
+        def wrapper(
+            event: Dict[str, Any] | bytes | str,
+            context: Optional[Dict[str, Any]],
+            *args: Any,
+            **kwargs: Any,
+        ) -> ResponseDict:
+            hooks, offload = _prepare()
+            if hooks is not None and not (is_async or offload or hooks.is_async):
+                # Fully sync pipeline: run inline, without an event loop
+                return run_inline(invoke(event, context, hooks, offload))
+            return run_coroutine(invoke(event, context, hooks, offload))
+
+        async def aio(
+            event: Dict[str, Any] | bytes | str,
+            context: Optional[Dict[str, Any]],
+            *,
+            offload_sync: bool | None = None,
+        ) -> ResponseDict:
+            """Run the handler in the running event loop (e.g. ASGI servers).
+
+            Args:
+                event: The Lambda event.
+                context: The Lambda context.
+                offload_sync: Overrides the handler setting for running sync
+                    code in the thread pool. Servers should offload, so sync
+                    handlers do not block the event loop.
+            """
+            hooks, offload = _prepare(offload_sync)
+            return await invoke(event, context, hooks, offload)
 
         # We need to find the python file which contains the decorated function
         # and get the last update time to include in the description.
@@ -312,14 +666,19 @@ def lamina(
         wrapper.methods = methods
         wrapper.tags = tags
         wrapper.import_path = f"{f.__module__}.{f.__name__}"
+        wrapper.cache = response_cache
+        wrapper.etag = etag
+        wrapper.idempotency = idempotency
+        wrapper.aio = aio
+        wrapper.validation = validation_policy
+        wrapper.sparse_fields = sparse_fields
 
         # Register wrapper for OpenAPI generation
         if add_to_spec:
-            try:
-                LAMINA_REGISTRY.append(wrapper)
-            except Exception:
-                # Fallback: do not break if registry fails for some reason
-                logger.debug("Unable to register lamina wrapper in registry.")
+            LAMINA_REGISTRY.register(wrapper)
+
+        if warmup:
+            warmup_handlers([wrapper])
 
         return wrapper
 
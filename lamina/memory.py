@@ -0,0 +1,113 @@
+"""Per-invocation memory usage tracking.
+
+Enabled with `LAMINA_TRACK_MEMORY=true` (or `track_memory = true` in
+`[tool.lamina]`). For each phase, records how much the peak RSS of the
+process grew and, with `LAMINA_TRACEMALLOC=true`, the peak of memory
+allocated by Python (tracemalloc slows down allocations, use it to
+investigate, not in production).
+"""
+
+import sys
+import threading
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from lamina import conf
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+_MB = 1024 * 1024
+
+# Peak RSS of the last alarm. The peak never decreases, so warm containers
+# only warn again when it grows further.
+_alarm_peak_mb: Optional[float] = None
+_alarm_lock = threading.Lock()
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Return the peak resident set size of the process, in MB."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return max_rss / _MB if sys.platform == "darwin" else max_rss / 1024
+
+
+@dataclass
+class MemoryTracker:
+    """Record memory growth of each phase of an invocation.
+
+    Attributes:
+        use_tracemalloc: Also record the tracemalloc peak of each phase.
+        alarm_percent: Percent of the Lambda memory limit which, when crossed
+            by the process peak RSS, logs a warning.
+        usage: Memory usage per phase, in MB.
+    """
+
+    use_tracemalloc: bool = False
+    alarm_percent: int = 80
+    usage: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    _last_rss: Optional[float] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._last_rss = peak_rss_mb()
+        if self.use_tracemalloc:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+
+    @classmethod
+    def from_settings(cls) -> Optional["MemoryTracker"]:
+        """Return a tracker if memory tracking is enabled in the settings."""
+        if not conf.LAMINA_TRACK_MEMORY:
+            return None
+        return cls(
+            use_tracemalloc=conf.LAMINA_TRACEMALLOC,
+            alarm_percent=conf.LAMINA_MEMORY_ALARM_PERCENT,
+        )
+
+    def lap(self, phase: str) -> None:
+        entry: Dict[str, float] = {}
+        rss = peak_rss_mb()
+        if rss is not None and self._last_rss is not None:
+            entry["peak_rss_delta_mb"] = round(rss - self._last_rss, 3)
+            self._last_rss = rss
+        if self.use_tracemalloc and tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            entry["traced_peak_mb"] = round(peak / _MB, 3)
+            tracemalloc.reset_peak()
+        self.usage[phase] = entry
+
+    def check(self, context: Any) -> bool:
+        """Log a warning if the memory alarm threshold was crossed.
+
+        The peak RSS of the process only grows, so the warning is logged once
+        per container, and again only when the peak grows further.
+
+        Returns:
+            True if the warning was logged.
+        """
+        global _alarm_peak_mb
+
+        limit = getattr(context, "memory_limit_in_mb", None)
+        rss = peak_rss_mb()
+        if not limit or rss is None:
+            return False
+        threshold = int(limit) * self.alarm_percent / 100
+        if rss < threshold:
+            return False
+        with _alarm_lock:
+            if _alarm_peak_mb is not None and rss <= _alarm_peak_mb:
+                return False
+            _alarm_peak_mb = rss
+        logger.warning(
+            f"Peak memory {rss:.1f} MB crossed {self.alarm_percent}% of the "
+            f"{limit} MB limit. Memory per phase (MB): {self.usage}"
+        )
+        return True
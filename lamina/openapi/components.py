@@ -0,0 +1,198 @@
+"""Component schemas registry for the OpenAPI document.
+
+Schemas are identified by a hash of their canonical JSON, so:
+
+* identical schemas registered under different names (e.g. a generic model
+  as a top-level schema and as a nested `$defs` entry) are stored once, and
+  references to the other names are rewritten;
+* different schemas sharing a name (e.g. two `Item` models in different
+  modules) are detected, and the later one is renamed with a hash suffix or
+  an error is raised, depending on `LAMINA_OPENAPI_SCHEMA_CONFLICTS`.
+"""
+
+import copy
+import functools
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Set, Type
+
+from loguru import logger
+from pydantic import BaseModel, RootModel
+
+from lamina import conf
+
+REF_PREFIX = "#/components/schemas/"
+REF_TEMPLATE = REF_PREFIX + "{model}"
+CONFLICT_POLICIES = ("rename", "raise")
+
+
+@functools.lru_cache(maxsize=1024)
+def _model_schema(
+    model: Type[BaseModel | RootModel], ref_template: str
+) -> Dict[str, Any]:
+    return model.model_json_schema(ref_template=ref_template)
+
+
+def model_schema(
+    model: Type[BaseModel | RootModel], ref_template: str = REF_TEMPLATE
+) -> Dict[str, Any]:
+    """Return the JSON schema of a model, cached per model.
+
+    The same models are used by many handlers and getters, so their schemas
+    are generated once. A copy is returned, so specs built from it can be
+    modified by the caller without changing later ones.
+    """
+    return copy.deepcopy(_model_schema(model, ref_template))
+
+
+def schema_digest(schema: Dict[str, Any]) -> str:
+    """Hash the canonical JSON of a schema."""
+    canonical = json.dumps(
+        schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def collect_refs(value: Any, refs: Set[str]) -> None:
+    """Add the names of the components referenced by `value` to `refs`."""
+    if isinstance(value, dict):
+        ref = value.get("$ref")
+        if isinstance(ref, str) and ref.startswith(REF_PREFIX):
+            refs.add(ref[len(REF_PREFIX) :])
+        for item in value.values():
+            collect_refs(item, refs)
+    elif isinstance(value, list):
+        for item in value:
+            collect_refs(item, refs)
+
+
+def rewrite_refs(value: Any, names: Dict[str, str]) -> Any:
+    """Return a copy of `value` with component references renamed."""
+    if not names:
+        return value
+    if isinstance(value, dict):
+        ref = value.get("$ref")
+        if isinstance(ref, str) and ref.startswith(REF_PREFIX):
+            name = names.get(ref[len(REF_PREFIX) :])
+            if name is not None:
+                value = {**value, "$ref": REF_PREFIX + name}
+        return {key: rewrite_refs(item, names) for key, item in value.items()}
+    if isinstance(value, list):
+        return [rewrite_refs(item, names) for item in value]
+    return value
+
+
+@dataclass
+class ComponentRegistry:
+    """Component schemas of a document, deduplicated by content.
+
+    Attributes:
+        on_conflict: `rename` or `raise`, for different schemas sharing a name.
+            Defaults to `LAMINA_OPENAPI_SCHEMA_CONFLICTS`.
+        schemas: Registered schemas, in registration order.
+    """
+
+    on_conflict: str | None = None
+    schemas: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    _digests: Dict[str, str] = field(default_factory=dict, repr=False)
+    _names: Dict[str, str] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        if self.on_conflict is None:
+            self.on_conflict = conf.LAMINA_OPENAPI_SCHEMA_CONFLICTS
+        if self.on_conflict not in CONFLICT_POLICIES:
+            raise ValueError(
+                "Invalid value for LAMINA_OPENAPI_SCHEMA_CONFLICTS. "
+                f"Expected one of: {', '.join(CONFLICT_POLICIES)}."
+            )
+
+    def _conflict(self, name: str) -> None:
+        message = f"Different OpenAPI schemas are named {name!r}"
+        if self.on_conflict == "raise":
+            raise ValueError(message)
+        logger.warning(message)
+
+    def register(
+        self, name: str, schema: Dict[str, Any], *, rename: bool = True
+    ) -> str:
+        """Register a schema without `$defs` and return its component name.
+
+        Args:
+            name: Preferred component name.
+            schema: Schema, with references to other components.
+            rename: Rename the schema if the name is taken by a different
+                schema. Otherwise the first schema is kept.
+
+        Returns:
+            The name of the component holding the schema.
+        """
+        digest = schema_digest(schema)
+        if self._digests.get(name) == digest:
+            return name
+        if digest in self._names:
+            return self._names[digest]
+        if name in self.schemas:
+            self._conflict(name)
+            if not rename:
+                return name
+            name = f"{name}_{digest[:8]}"
+        self.schemas[name] = schema
+        self._digests[name] = digest
+        self._names[digest] = name
+        return name
+
+    def add(
+        self, schemas: Dict[str, Dict[str, Any]], *, rename: bool = True
+    ) -> Dict[str, str]:
+        """Register model schemas and their `$defs`.
+
+        Nested `$defs` are promoted to components. Schemas are registered
+        after the schemas they reference, with the references rewritten to
+        their final names, so same-named schemas whose nested schemas differ
+        are told apart.
+
+        Args:
+            schemas: Model schemas by preferred component name.
+            rename: See `register`.
+
+        Returns:
+            Component names that differ from the preferred ones, to rewrite
+            the references pointing to these schemas.
+        """
+        entries: Dict[str, Dict[str, Any]] = {}
+        for name, schema in schemas.items():
+            schema = dict(schema)
+            defs = schema.pop("$defs", {})
+            entries.setdefault(name, schema)
+            for def_name, def_schema in defs.items():
+                entries.setdefault(def_name, def_schema)
+
+        names: Dict[str, str] = {}
+        added: List[str] = []
+        visited: Set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            visited.add(name)
+            refs: Set[str] = set()
+            collect_refs(entries[name], refs)
+            for ref in sorted(refs & entries.keys()):
+                visit(ref)
+            count = len(self.schemas)
+            final_name = self.register(
+                name, rewrite_refs(entries[name], names), rename=rename
+            )
+            if final_name != name:
+                names[name] = final_name
+            if len(self.schemas) > count:
+                added.append(final_name)
+
+        for name in entries:
+            visit(name)
+
+        # References within cycles (recursive models) are renamed last
+        for name in added:
+            self.schemas[name] = rewrite_refs(self.schemas[name], names)
+        return names
@@ -1,11 +1,12 @@
 import datetime
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Type
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type
 
 from pydantic import BaseModel, Field, RootModel
 
 from lamina import conf
 from lamina.openapi import ExtraResponsesDict
+from lamina.openapi.components import ComponentRegistry, model_schema, rewrite_refs
 from lamina.openapi.markdown import markdown_to_html
 from lamina.openapi.types import (
     ComponentsObject,
@@ -74,6 +75,23 @@ class InternalServerError500(BaseModel):
     )
 
 
+@dataclass
+class ViewFragment:
+    """OpenAPI output of a single view, merged by `SwaggerGenerator`.
+
+    Attributes:
+        path: Path of the view.
+        methods: Lower-case HTTP methods of the view.
+        operation: Operation object, shared by all methods.
+        schemas: Component schemas used by the view, with nested `$defs`.
+    """
+
+    path: str
+    methods: List[str]
+    operation: OperationObject
+    schemas: Dict[str, Any]
+
+
 @dataclass
 class SwaggerGenerator:
     """OpenAPI 3.1 generator for lamina-decorated handlers.
@@ -88,6 +106,12 @@ class SwaggerGenerator:
         json_schema_dialect: Optional custom JSON Schema dialect URI.
         view_docstring: Optional docstring to extract title/description when
             generating an info object for a single-view use case.
+        workers: Number of processes used to build the view fragments.
+        descriptions: Operation descriptions: `full`, `summary` (first
+            paragraph of the docstring) or `none`.
+        field_tables: Field tables in `full` descriptions: `all`, `top` or
+            `none`. Defaults to LAMINA_GENERATE_FIELD_TABLES_IN_DOCS.
+        fragment_cache: Fragments of a previous build, by view. Updated in place.
     """
 
     view_data: List[ViewData]
@@ -95,13 +119,29 @@ class SwaggerGenerator:
     openapi_version: str = "3.1.0"
     json_schema_dialect: str | None = None
     extra_responses: Optional[Dict[str, ExtraResponsesDict]] = None
+    workers: int = 1
+    descriptions: Literal["full", "summary", "none"] = "full"
+    field_tables: Literal["all", "top", "none"] | None = None
+    fragment_cache: (
+        Dict[Tuple[str | None, str | None], Tuple[ViewData, ViewFragment]] | None
+    ) = None
+    _fragments: List[ViewFragment] | None = field(default=None, init=False, repr=False)
+    _merged: Tuple[Dict[str, Dict[str, OperationObject]], ComponentRegistry] | None = (
+        field(default=None, init=False, repr=False)
+    )
+
+    def __post_init__(self):
+        if self.descriptions not in ("full", "summary", "none"):
+            raise ValueError(f"Invalid descriptions option: {self.descriptions}")
+        if self.field_tables not in ("all", "top", "none", None):
+            raise ValueError(f"Invalid field_tables option: {self.field_tables}")
 
     @staticmethod
     def _get_model_schema_ref(
         model: Type[BaseModel | RootModel],
     ) -> Tuple[str, Dict[str, Any]]:
         """Return the JSON Schema reference name and full schema for the  model."""
-        schema = model.model_json_schema(ref_template="#/components/schemas/{model}")
+        schema = model_schema(model)
         name = schema.get("title") or model.__name__
         return name, schema
 
@@ -181,7 +221,7 @@ class SwaggerGenerator:
         response_content = self._content_for_model(view.response)
         responses[str(conf.LAMINA_DEFAULT_SUCCESS_STATUS_CODE)] = ResponseObject(
             **{
-                "description": view.extract_extras().get(
+                "description": view.extras.get(
                     "response_description", "Successful Response"
                 ),
                 "content": (
@@ -207,7 +247,7 @@ class SwaggerGenerator:
                 }
             )
 
-        extra_responses = self.extra_responses or {}
+        extra_responses = dict(self.extra_responses or {})
         extra_responses |= view.extra_responses or {}
 
         for status_code, cfg in extra_responses.items():
@@ -228,36 +268,113 @@ class SwaggerGenerator:
             responses[code_str] = response_obj
         return responses
 
-    def get_paths(self) -> Dict[str, Dict[str, OperationObject]] | None:
-        """Assemble the OpenAPI paths and operations from LAMINA_REGISTRY."""
-        paths: Dict[str, Dict[str, OperationObject]] = {}
+    def build_fragment(self, view: ViewData) -> ViewFragment:
+        """Build the operation and component schemas of a single view."""
+        request_body_content = self._content_for_model(view.request)
+        operation: OperationObject = {
+            "summary": view.summary,
+            "description": view.get_description(self.descriptions, self.field_tables),
+            "operationId": view.operation_id,
+            "parameters": view.get_parameters(),
+            "responses": self.get_responses(view),
+            "tags": view.get_tags(),
+        }
+        if self.descriptions == "none":
+            del operation["description"]
+        if request_body_content:
+            operation["requestBody"] = RequestBodyObject(
+                **{
+                    "content": {view.accept_media_type: request_body_content},
+                    "required": True,
+                }
+            )
+        return ViewFragment(
+            path=view.path,
+            methods=view.get_methods(),
+            operation=operation,
+            schemas=view.resolve_schemas(),
+        )
 
-        for view in self.view_data:
-            request_body_content = self._content_for_model(view.request)
-            path = view.get_path()
-            methods = view.get_methods()
-
-            operation: OperationObject = {
-                "summary": view.get_summary(),
-                "description": view.get_description(),
-                "operationId": view.get_operation_id(),
-                "parameters": view.get_parameters(),
-                "responses": self.get_responses(view),
-                "tags": view.get_tags(),
-            }
-            if request_body_content:
-                operation["requestBody"] = RequestBodyObject(
-                    **{
-                        "content": {view.accept_media_type: request_body_content},
-                        "required": True,
-                    }
-                )
+    def get_fragments(self) -> List[ViewFragment]:
+        """Return the fragments of all views, in view order.
+
+        Fragments are built once; with `workers` above 1 they are built in a
+        process pool (see `lamina.openapi.parallel`). With a `fragment_cache`,
+        only views that changed since the previous build are built again.
+        """
+        if self._fragments is not None:
+            return self._fragments
+
+        cache = self.fragment_cache if self.fragment_cache is not None else {}
+        fragments: List[ViewFragment | None] = []
+        pending: List[int] = []
+        for index, view in enumerate(self.view_data):
+            cached = cache.get(self._cache_key(view))
+            if cached is not None and cached[0] == view:
+                fragments.append(cached[1])
+            else:
+                fragments.append(None)
+                pending.append(index)
+
+        views = [self.view_data[index] for index in pending]
+        if self.workers > 1 and len(views) > 1:
+            from lamina.openapi.parallel import build_fragments
+
+            built = build_fragments(self, views, self.workers)
+        else:
+            built = [self.build_fragment(view) for view in views]
+        for index, view, fragment in zip(pending, views, built):
+            fragments[index] = fragment
+            cache[self._cache_key(view)] = (view, fragment)
+
+        # Forget the views that are gone
+        keys = {self._cache_key(view) for view in self.view_data}
+        for key in set(cache) - keys:
+            del cache[key]
+
+        self._fragments = fragments
+        return self._fragments
+
+    @staticmethod
+    def _cache_key(view: ViewData) -> Tuple[str | None, str | None]:
+        return view.import_path, view.path
+
+    def _merge(
+        self,
+    ) -> Tuple[Dict[str, Dict[str, OperationObject]], ComponentRegistry]:
+        """Merge the view fragments into paths and component schemas.
+
+        Collects schemas from request/response/params models and from any custom
+        response schemas declared via the decorator. References of each view
+        follow the renames of its schemas in the component registry.
+        """
+        if self._merged is not None:
+            return self._merged
+
+        registry = ComponentRegistry()
+        extra_response_models = [
+            resp_cfg["schema"] for resp_cfg in (self.extra_responses or {}).values()
+        ] + [BadRequest400, UnprocessableEntity422, InternalServerError500]
+        for model in extra_response_models:
+            # Referenced by every view, so the first schema of a name is kept
+            name, schema = self._get_model_schema_ref(model)
+            registry.add({name: schema}, rename=False)
 
-            if path not in paths:
-                paths[path] = {}
-            for method in methods:
-                paths[path][method] = operation
+        paths: Dict[str, Dict[str, OperationObject]] = {}
+        for fragment in self.get_fragments():
+            names = registry.add(fragment.schemas)
+            operation = rewrite_refs(fragment.operation, names)
+            if fragment.path not in paths:
+                paths[fragment.path] = {}
+            for method in fragment.methods:
+                paths[fragment.path][method] = operation
+
+        self._merged = paths, registry
+        return self._merged
 
+    def get_paths(self) -> Dict[str, Dict[str, OperationObject]] | None:
+        """Assemble the OpenAPI paths and operations from LAMINA_REGISTRY."""
+        paths, _ = self._merge()
         return paths
 
     @staticmethod
@@ -265,52 +382,28 @@ class SwaggerGenerator:
         """No webhooks currently generated."""
         return None
 
+    @staticmethod
+    def _default_security_schemes() -> Dict[str, Any]:
+        return {
+            "ApiKeyAuth": {
+                "type": "apiKey",
+                "in": "header",
+                "name": conf.LAMINA_DEFAULT_AUTH_HEADER_NAME,
+            }
+        }
+
     def get_components(
         self, security_schemes: Optional[Dict[str, Any]] | None = None
     ) -> ComponentsObject | None:
         """Build the Components object (schemas and securitySchemes).
 
-        Collects schemas from request/response/params models and from any custom
-        response schemas declared via the decorator.
+        Schemas are deduplicated by content, see `ComponentRegistry`.
         """
-        schemas: Dict[str, Any] = {}
-
-        extra_response_models = [
-            resp_cfg["schema"] for resp_cfg in (self.extra_responses or {}).values()
-        ] + [BadRequest400, UnprocessableEntity422, InternalServerError500]
-
-        for model in extra_response_models:
-            name, schema = self._get_model_schema_ref(model)
-            if name not in schemas:
-                schemas[name] = schema
-                if "$defs" in schema:
-                    defs = schema.pop("$defs")
-                    for def_name, def_schema in defs.items():
-                        if def_name not in schemas:
-                            schemas[def_name] = def_schema
-
-        for view in self.view_data:
-            view_schemas = view.resolve_schemas()
-
-            # Process each schema to extract $defs
-            for name, schema in view_schemas.items():
-                schemas[name] = schema
-
-                # Extract and promote $defs to global schemas
-                if "$defs" in schema:
-                    defs = schema.pop("$defs")  # Remove $defs from original schema
-                    for def_name, def_schema in defs.items():
-                        if def_name not in schemas:
-                            schemas[def_name] = def_schema
+        _, registry = self._merge()
+        schemas = registry.schemas
 
         if security_schemes is None:
-            security_schemes = {
-                "ApiKeyAuth": {
-                    "type": "apiKey",
-                    "in": "header",
-                    "name": conf.LAMINA_DEFAULT_AUTH_HEADER_NAME,
-                }
-            }
+            security_schemes = self._default_security_schemes()
 
         if not schemas and not security_schemes:
             return None
@@ -326,12 +419,8 @@ class SwaggerGenerator:
         if security:
             return security
 
-        components = self.get_components()
-        security_schemes = components.get("securitySchemes")
-
-        if security_schemes:
-            return [{name: []} for name in security_schemes.keys()]
-        return None
+        security_schemes = self._default_security_schemes()
+        return [{name: []} for name in security_schemes.keys()]
 
     def generate(
         self,
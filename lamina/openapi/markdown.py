@@ -10,9 +10,11 @@ callable that transforms Mermaid code into final HTML.
 
 Python 3.11 compatible.
 """
+
 from __future__ import annotations
 
 import datetime
+import functools
 import re
 from typing import Callable, Final, Optional
 
@@ -52,6 +54,16 @@ def _inject_mermaid_blocks(text: str, mermaid_to_html: Callable[[str], str]) ->
     return _MERMAID_FENCE_RE.sub(_repl, text)
 
 
+@functools.lru_cache(maxsize=1024)
+def render_markdown(text: str) -> str:
+    """Convert Markdown to HTML, caching the result by the Markdown content.
+
+    Shared models and docstrings produce the same Markdown in many views, so
+    each distinct text is rendered only once.
+    """
+    return _markdown(text)
+
+
 def markdown_to_html(
     text: str,
     last_updated: Optional[datetime] = None,
@@ -69,7 +81,7 @@ def markdown_to_html(
     """
     # Convert Markdown to HTML.
     html_out = "<hr>" if add_line_before else ""
-    html_out += _markdown(text)
+    html_out += render_markdown(text)
 
     # At the end of the HTML, add the Last Updated info
     text_exists = text is not None and text.strip() != ""
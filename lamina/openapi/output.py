@@ -0,0 +1,112 @@
+"""Split and write large OpenAPI documents.
+
+`split_by_tag` cuts a document into one self-contained document per tag,
+keeping only the component schemas its operations reference. `write_json`
+streams a document to a file section by section, instead of building the
+whole JSON string in memory.
+"""
+
+import json
+from typing import Any, Dict, Iterator, Set, TextIO
+
+from lamina.openapi.components import collect_refs
+from lamina.openapi.types import OpenAPIObject
+
+
+def referenced_schemas(value: Any, schemas: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the schemas referenced by a value, directly or through others.
+
+    Schemas keep their order in `schemas`.
+    """
+    found: Set[str] = set()
+    pending: Set[str] = set()
+    collect_refs(value, pending)
+    while pending:
+        name = pending.pop()
+        if name in found or name not in schemas:
+            continue
+        found.add(name)
+        collect_refs(schemas[name], pending)
+    return {name: schema for name, schema in schemas.items() if name in found}
+
+
+def split_by_tag(
+    spec: OpenAPIObject, untagged: str = "default"
+) -> Dict[str, OpenAPIObject]:
+    """Split a document into one document per operation tag.
+
+    Operations with several tags appear in each of their documents. Each
+    document keeps the top-level objects of the original (info, servers,
+    security, ...) and the component schemas its operations reference.
+
+    Args:
+        spec: The OpenAPI document.
+        untagged: Name of the document of operations without tags.
+
+    Returns:
+        The documents by tag, in order of first appearance.
+    """
+    paths_by_tag: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for path, item in spec.get("paths", {}).items():
+        for method, operation in item.items():
+            for tag in operation.get("tags") or [untagged]:
+                paths = paths_by_tag.setdefault(tag, {})
+                paths.setdefault(path, {})[method] = operation
+
+    documents: Dict[str, OpenAPIObject] = {}
+    for tag, paths in paths_by_tag.items():
+        document: OpenAPIObject = {}
+        for key, value in spec.items():
+            if key == "paths":
+                value = paths
+            elif key == "components":
+                value = {
+                    **value,
+                    "schemas": referenced_schemas(paths, value.get("schemas", {})),
+                }
+            elif key == "tags":
+                value = [item for item in value if item.get("name") == tag]
+                if not value:
+                    continue
+            document[key] = value
+        documents[tag] = document
+    return documents
+
+
+def iter_json(
+    value: Any, *, minify: bool = False, indent: int = 2, depth: int = 2
+) -> Iterator[str]:
+    """Encode a document as JSON chunks.
+
+    The first `depth` levels of objects are written key by key, so each chunk
+    is the size of one path or schema. Joined, the chunks equal
+    `json.dumps(value, indent=indent)`, or the compact JSON when `minify`.
+    """
+    separators = (",", ":") if minify else (",", ": ")
+
+    def encode(item: Any, level: int) -> Iterator[str]:
+        if level >= depth or not isinstance(item, dict) or not item:
+            text = json.dumps(
+                item, indent=None if minify else indent, separators=separators
+            )
+            if not minify:
+                text = text.replace("\n", "\n" + " " * (indent * level))
+            yield text
+            return
+        inner = "" if minify else "\n" + " " * (indent * (level + 1))
+        yield "{"
+        for position, (key, child) in enumerate(item.items()):
+            prefix = separators[0] if position else ""
+            yield f"{prefix}{inner}{json.dumps(str(key))}{separators[1]}"
+            yield from encode(child, level + 1)
+        yield ("" if minify else "\n" + " " * (indent * level)) + "}"
+
+    yield from encode(value, 0)
+
+
+def write_json(
+    spec: OpenAPIObject, file: TextIO, *, minify: bool = False, indent: int = 2
+) -> None:
+    """Stream a document to a text file, see `iter_json`."""
+    for chunk in iter_json(spec, minify=minify, indent=indent):
+        file.write(chunk)
@@ -0,0 +1,108 @@
+"""Build OpenAPI view fragments in a process pool.
+
+JSON schema generation, docstring parsing, Markdown rendering and field
+tables are independent per view, so large APIs build their fragments in
+worker processes. Each task imports only the module of its handlers and
+returns plain dicts; fragments are merged by `SwaggerGenerator` in view
+order, so the document is identical to a sequential build.
+
+Views whose handler cannot be imported by module and name (handlers defined
+in functions, redefined names, ...) are built in the calling process.
+"""
+
+import importlib
+import math
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from loguru import logger
+
+from lamina.openapi.generator import SwaggerGenerator, ViewFragment
+from lamina.openapi.view_data import ViewData
+
+# Tasks per worker, so slow modules don't leave other workers idle
+TASKS_PER_WORKER = 4
+
+
+def _split_import_path(view: ViewData) -> Tuple[str, str]:
+    module_name, _, name = (view.import_path or "").rpartition(".")
+    return module_name, name
+
+
+def _is_importable(view: ViewData) -> bool:
+    """Check that the view handler is found again by importing its module."""
+    module_name, name = _split_import_path(view)
+    wrapper = getattr(sys.modules.get(module_name), name, None)
+    return wrapper is not None and ViewData.from_wrapper(wrapper) == view
+
+
+def _build_module_fragments(
+    module_name: str, names: List[str], options: Dict[str, Any]
+) -> List[ViewFragment]:
+    module = importlib.import_module(module_name)
+    generator = SwaggerGenerator(view_data=[], **options)
+    return [
+        generator.build_fragment(ViewData.from_wrapper(getattr(module, name)))
+        for name in names
+    ]
+
+
+def build_fragments(
+    generator: SwaggerGenerator, views: List[ViewData], workers: int
+) -> List[ViewFragment]:
+    """Build the fragments of views using `workers` processes.
+
+    Falls back to a sequential build when fewer than two views can be imported
+    by the workers or when the global extra responses can't be pickled.
+    """
+    fragments: List[ViewFragment | None] = [None] * len(views)
+    options = {
+        "extra_responses": generator.extra_responses,
+        "descriptions": generator.descriptions,
+        "field_tables": generator.field_tables,
+    }
+
+    importable = [index for index, view in enumerate(views) if _is_importable(view)]
+    try:
+        pickle.dumps(generator.extra_responses)
+    except Exception:
+        logger.debug("Extra responses can't be pickled, building spec sequentially")
+        importable = []
+
+    if len(importable) > 1:
+        # Group views by module, then split modules into similar sized tasks
+        by_module: Dict[str, List[int]] = {}
+        for index in importable:
+            module_name, _ = _split_import_path(views[index])
+            by_module.setdefault(module_name, []).append(index)
+        chunk_size = math.ceil(len(importable) / (workers * TASKS_PER_WORKER))
+        tasks = [
+            (module_name, indexes[start : start + chunk_size])
+            for module_name, indexes in by_module.items()
+            for start in range(0, len(indexes), chunk_size)
+        ]
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            futures = [
+                executor.submit(
+                    _build_module_fragments,
+                    module_name,
+                    [_split_import_path(views[index])[1] for index in indexes],
+                    options,
+                )
+                for module_name, indexes in tasks
+            ]
+            for (_, indexes), future in zip(tasks, futures):
+                for index, fragment in zip(indexes, future.result()):
+                    fragments[index] = fragment
+        logger.debug(
+            f"Built {len(importable)} of {len(views)} OpenAPI views "
+            f"in {len(tasks)} tasks"
+        )
+
+    return [
+        fragment if fragment is not None else generator.build_fragment(view)
+        for view, fragment in zip(views, fragments)
+    ]
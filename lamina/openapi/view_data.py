@@ -1,17 +1,34 @@
+import dataclasses
 import datetime
+import functools
 import inspect
+import re
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
 from types import UnionType
-from typing import Any, Dict, List, Literal, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from caseconverter import camelcase, kebabcase, titlecase
 from loguru import logger
 from pydantic import BaseModel, RootModel
+from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefined
 
 from lamina import conf
+from lamina.fieldsets import EXCLUDE_PARAM, FIELDS_PARAM, field_names
+from lamina.openapi.components import model_schema
 from lamina.openapi.markdown import markdown_to_html
 from lamina.openapi.types import ParameterObject
 
@@ -19,20 +36,78 @@ from lamina.openapi.types import ParameterObject
 def extract_schema_info(
     model: Type[BaseModel | RootModel],
 ) -> Tuple[str, Dict[str, Any]]:
-    """Return the JSON Schema reference name and full schema for a Pydantic model."""
-    schema = model.model_json_schema(ref_template="#/components/schemas/{model}")
+    """Return the JSON Schema reference name and full schema for a Pydantic model.
+
+    The schema is cached and shared, so it must not be modified.
+    """
+    schema = model_schema(model)
     name = schema.get("title") or model.__name__
     return name, schema
 
 
-@dataclass
+_DOCSTRING_STOP_TOKENS = frozenset(
+    {
+        "args:",
+        "arguments:",
+        "parameters:",
+        "returns:",
+        "return:",
+        "raises:",
+        "examples:",
+    }
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_docstring(docstring: Optional[str]) -> Tuple[str | None, str]:
+    """Split a docstring into a summary and a Markdown description.
+
+    The description stops at the first Google style section (Args, Returns,
+    ...). Results are cached by the docstring content.
+
+    Returns:
+        A tuple of (summary, description). Summary is None for empty docstrings.
+    """
+    if not docstring:
+        return None, ""
+
+    lines = inspect.cleandoc(docstring).splitlines()
+
+    # Remove leading empty lines
+    while lines and not lines[0].strip():
+        lines.pop(0)
+    if not lines:
+        return None, ""
+
+    desc_lines: list[str] = []
+    for ln in lines[1:]:
+        if ln.strip().lower() in _DOCSTRING_STOP_TOKENS:
+            break
+        desc_lines.append(ln)
+    return lines[0].strip(), "\n".join(desc_lines).strip()
+
+
+@dataclass(frozen=True, slots=True)
 class ViewData:
-    """Helper structure to hold collected Pydantic models.
+    """Resolved OpenAPI data of a lamina handler.
+
+    Path, methods, tags, summary, operation id, query parameters and schemas
+    are resolved once, on creation, so generator stages read plain fields.
+    The getters are kept as accessors. Views are equal when their inputs
+    are equal.
 
     Attributes:
         request: Optional type for request body.
         response: Optional type for response body.
         params: Optional type for query parameters.
+        path: Path of the view, from the decorator or the import path.
+        methods: Lower-case HTTP methods.
+        tags: Operation tags.
+        extras: Merged json_schema_extra of the models.
+        summary: Operation summary.
+        operation_id: Operation id.
+        parameters: Query parameters.
+        schemas: Component schemas of the view models, by name.
     """
 
     request: Optional[Type[BaseModel | RootModel]]
@@ -40,21 +115,68 @@ class ViewData:
     params: Optional[Type[BaseModel | RootModel]]
     import_path: Optional[str]
     path: Optional[str] = None
-    methods: Optional[List[str]] = None
-    extra_responses: Dict[int, Any] = None
+    methods: Optional[Tuple[str, ...]] = None
+    extra_responses: Dict[int, Any] = dataclasses.field(default=None, hash=False)
     view_docstring: Optional[str] = None
-    tags: Optional[List[str]] = None
+    tags: Optional[Tuple[str, ...]] = None
     file_last_update: Optional[datetime] = None
     accept_media_type: str | None = None
     produce_media_type: str | None = None
+    sparse_fields: bool = False
+    extras: Dict[str, Any] = dataclasses.field(init=False, compare=False, repr=False)
+    summary: str = dataclasses.field(init=False, compare=False)
+    operation_id: str = dataclasses.field(init=False, compare=False)
+    parameters: Tuple[ParameterObject, ...] = dataclasses.field(
+        init=False, compare=False, repr=False
+    )
+    schemas: Dict[str, Any] = dataclasses.field(init=False, compare=False, repr=False)
+
+    def __post_init__(self):
+        resolve = functools.partial(object.__setattr__, self)
+        resolve("extra_responses", self.extra_responses or {})
+        resolve("extras", self._merge_extras())
+        resolve("path", self._resolve_path())
+        resolve("methods", self._resolve_methods())
+        resolve("tags", self._resolve_tags())
+        resolve("summary", self._resolve_summary())
+        resolve("operation_id", self._resolve_operation_id())
+        resolve("parameters", self._resolve_parameters())
+        resolve("schemas", self._resolve_schemas())
+
+    @classmethod
+    def from_wrapper(cls, wrapper: Callable[..., Any]) -> "ViewData":
+        """Build the view data from the attributes of a lamina-decorated handler."""
+        return cls(
+            request=getattr(wrapper, "schema_in", None),
+            response=getattr(wrapper, "schema_out", None),
+            params=getattr(wrapper, "params_in", None),
+            methods=_as_tuple(getattr(wrapper, "methods", None)),
+            tags=_as_tuple(getattr(wrapper, "tags", None)),
+            extra_responses=getattr(wrapper, "responses", {}) or {},
+            view_docstring=getattr(wrapper, "__doc__", None),
+            import_path=getattr(wrapper, "import_path", None),
+            path=getattr(wrapper, "path", None),
+            file_last_update=getattr(wrapper, "last_updated", None),
+            accept_media_type=getattr(
+                wrapper, "request_content_type", "application/json"
+            ),
+            produce_media_type=getattr(
+                wrapper, "response_content_type", "application/json"
+            ),
+            sparse_fields=getattr(wrapper, "sparse_fields", False),
+        )
 
     def extract_extras(self) -> Dict[str, Any]:
+        """Return the merged json_schema_extra of the models."""
+        return self.extras
+
+    def _merge_extras(self) -> Dict[str, Any]:
         """Merge json_schema_extra from provided models."""
         extra_info: Dict[str, Any] = {}
         for m in (self.request, self.response, self.params):
             if m is None:
                 continue
-            schema = m.model_json_schema()
+            schema = model_schema(m)
             # json_schema_extra lands as top-level unknown keys in Pydantic v2
             for key, value in schema.items():
                 if key in {
@@ -70,7 +192,11 @@ class ViewData:
                 extra_info[key] = value
         return extra_info
 
-    def resolve_schemas(self):
+    def resolve_schemas(self) -> Dict[str, Any]:
+        """Return the component schemas of the view models, by name."""
+        return dict(self.schemas)
+
+    def _resolve_schemas(self) -> Dict[str, Any]:
         schemas: Dict[str, Any] = {}
         for m in (self.request, self.response, self.params):
             if m is None:
@@ -86,33 +212,18 @@ class ViewData:
                 schemas[name] = schema_def
         return schemas
 
-    def get_methods(self):
-        # Methods resolution
-        wrapper_methods = self.methods
-        extras = self.extract_extras()
+    def get_methods(self) -> List[str]:
+        return list(self.methods)
 
-        if wrapper_methods:
-            methods_list = [m.lower() for m in wrapper_methods]
-        else:
-            m_from_extra = (
-                extras.get("methods")
-                or extras.get("method")
-                or extras.get("http_method")
-            )
-            if isinstance(m_from_extra, str):
-                methods_list = [m_from_extra.lower()]
-            elif isinstance(m_from_extra, (list, tuple)):
-                methods_list = [str(m).lower() for m in m_from_extra]
-            else:
-                methods_list = ["post"]
-        return methods_list
+    def _resolve_methods(self) -> Tuple[str, ...]:
+        return resolve_methods(self.methods, self.extras)
 
     def _parse_docstring(
         self,
         *,
         docstring: str,
         last_updated: Optional[datetime] = None,
-        add_field_tables: bool = False,
+        field_tables: Literal["all", "top", "none"] = "none",
         return_html: bool = True,
         add_line_before: bool = False,
     ) -> Tuple[str | None, str | None]:
@@ -123,71 +234,69 @@ class ViewData:
             both values will be None to avoid injecting empty fields in the
             top-level info object.
         """
-
-        if not docstring:
+        summary, view_doc = parse_docstring(docstring)
+        if summary is None:
             return None, None
 
-        doc = inspect.cleandoc(docstring)
-        lines = doc.splitlines()
-
-        # Remove leading empty lines
-        while lines and not lines[0].strip():
-            lines.pop(0)
-        if not lines:
-            return None, None
-
-        summary = lines[0].strip()
-        rest = lines[1:]
-        stop_tokens = {
-            "args:",
-            "arguments:",
-            "parameters:",
-            "returns:",
-            "return:",
-            "raises:",
-            "examples:",
-        }
-        desc_lines: list[str] = []
-        for ln in rest:
-            if ln.strip().lower() in stop_tokens:
-                break
-            desc_lines.append(ln)
-
-        view_doc = "\n".join(desc_lines).strip()
-        if add_field_tables and conf.LAMINA_GENERATE_FIELD_TABLES_IN_DOCS:
-            field_tables = self.get_field_tables()
-            if field_tables:
+        if field_tables != "none":
+            tables = self.get_field_tables(field_tables)
+            if tables:
                 if view_doc:
                     view_doc += "\n\n"
-                view_doc += field_tables
+                view_doc += tables
         if return_html:
             description = markdown_to_html(view_doc, last_updated, add_line_before)
         else:
             description = view_doc
         return summary, description
 
-    def get_summary(self):
-        extras = self.extract_extras()
-        default_name = titlecase(self.get_path().replace("/", ""))
+    def get_summary(self) -> str:
+        return self.summary
+
+    def _resolve_summary(self) -> str:
+        default_name = titlecase(self.path.replace("/", ""))
         return (
-            self._parse_docstring(docstring=self.view_docstring)[0]
-            or extras.get("summary")
+            parse_docstring(self.view_docstring)[0]
+            or self.extras.get("summary")
             or default_name
         )
 
-    def get_description(self):
-        extras = self.extract_extras()
+    def get_description(
+        self,
+        descriptions: Literal["full", "summary", "none"] = "full",
+        field_tables: Literal["all", "top", "none"] | None = None,
+    ) -> str:
+        """Return the HTML description of the operation.
+
+        Args:
+            descriptions: `full` renders the docstring with the field tables and
+                the last update, `summary` only the first paragraph of the
+                docstring, `none` nothing.
+            field_tables: Field tables of `full` descriptions, see
+                `get_field_tables`. Defaults to LAMINA_GENERATE_FIELD_TABLES_IN_DOCS.
+        """
+        if descriptions == "none":
+            return ""
+        extras = self.extras
+        if descriptions == "summary":
+            paragraph = re.split(r"\n\s*\n", parse_docstring(self.view_docstring)[1])[0]
+            if paragraph:
+                return markdown_to_html(paragraph)
+            return extras.get("description") or ""
+        if field_tables is None:
+            field_tables = conf.LAMINA_GENERATE_FIELD_TABLES_IN_DOCS
         return (
             self._parse_docstring(
                 docstring=self.view_docstring,
                 last_updated=self.file_last_update,
-                add_field_tables=True,
+                field_tables=field_tables,
             )[1]
             or extras.get("description")
             or ""
         )
 
-    def _python_to_openapi_type(self, annotation: Any) -> str:
+    @staticmethod
+    def _python_to_openapi_type(annotation: Any) -> str:
         """Map Python types to OpenAPI types."""
         if annotation in (int,):
             return "integer"
@@ -202,7 +311,7 @@ class ViewData:
             array_item_type = "string"
             args = getattr(annotation, "__args__", [])
             if args:
-                all_types = set(self._python_to_openapi_type(arg) for arg in args)
+                all_types = set(ViewData._python_to_openapi_type(arg) for arg in args)
                 if len(all_types) == 1:
                     array_item_type = all_types.pop()
                 else:
@@ -227,9 +336,9 @@ class ViewData:
             args = annotation.__args__
             non_none_args = [arg for arg in args if arg is not type(None)]
             if len(non_none_args) == 1:
-                return self._python_to_openapi_type(non_none_args[0])
+                return ViewData._python_to_openapi_type(non_none_args[0])
             return ", ".join(
-                [self._python_to_openapi_type(arg) for arg in non_none_args]
+                [ViewData._python_to_openapi_type(arg) for arg in non_none_args]
             )
 
         name = getattr(annotation, "__origin__", None)
@@ -239,8 +348,14 @@ class ViewData:
             name = getattr(annotation, "__name__", str(annotation))
         return name.lower().replace("|", ", ")
 
-    def _get_all_models(self) -> List[Tuple[Type[BaseModel | RootModel], str]]:
-        """Recursively collect all Pydantic models used in the view."""
+    def _get_all_models(
+        self, nested: bool = True
+    ) -> List[Tuple[Type[BaseModel | RootModel], str]]:
+        """Recursively collect all Pydantic models used in the view.
+
+        Args:
+            nested: Also collect models of fields and extra responses.
+        """
         models: List[Tuple[Type[BaseModel | RootModel], str]] = []
         seen: set[Type[BaseModel | RootModel]] = set()
 
@@ -256,7 +371,7 @@ class ViewData:
             models.append((model, default_title))
 
             # Recurse into fields
-            if hasattr(model, "model_fields"):
+            if nested and hasattr(model, "model_fields"):
                 for field in model.model_fields.values():
                     annotation = field.annotation
                     # Handle Optional, List, etc.
@@ -282,7 +397,7 @@ class ViewData:
         collect(self.response, "\n\n---\n\n## Response Body Fields\n\n")
 
         # Add models from extra responses
-        if self.extra_responses:
+        if nested and self.extra_responses:
             for _code, cfg in self.extra_responses.items():
                 schema_model = cfg.get("schema") if isinstance(cfg, dict) else None
                 if schema_model:
@@ -290,153 +405,42 @@ class ViewData:
 
         return models
 
-    def get_field_tables(self) -> str:
-        description = ""
+    def get_field_tables(self, mode: Literal["all", "top"] = "all") -> str:
+        """Build the Markdown field tables of the view models.
 
-        for model, default_title in self._get_all_models():
-            if model.__name__ == "RootModel":
-                continue
-            model_name, _ = extract_schema_info(model)
-            fields = model.model_fields
-            if fields:
-                # Get Model Docstring
-                model_docstring = model.__doc__
-                doc_title, doc_description = self._parse_docstring(
-                    docstring=model_docstring,
-                    add_field_tables=False,
-                    return_html=False,
-                    add_line_before=True,
-                )
-                separator = default_title.split(" ")[0]
-                title = f"{separator} {doc_title}\n\n" if doc_title else default_title
-                if not title:
-                    title = f"{separator} {titlecase(model.__name__)}\n\n"
-                model_table = title
-                if doc_description:
-                    model_table += f"{doc_description}\n\n"
-                model_table += (
-                    "| Field | Type | Required | Default Value "
-                    "| Description | Examples |\n"
-                )
-                model_table += (
-                    "|-------|------|----------|---------------"
-                    "|-------------|----------|\n"
-                )
-                model_fields = []
-                for name, field in fields.items():
-                    annotation = field.annotation
-                    table_t = self._python_to_openapi_type(annotation)
-                    is_required = field.is_required()
-                    default_value = (
-                        field.default
-                        if field.default is not None
-                        and field.default is not PydanticUndefined
-                        else "--"
-                    )
-                    if isinstance(default_value, Enum):
-                        default_value = default_value.value
-                    elif isinstance(default_value, (datetime.date, datetime.datetime)):
-                        default_value = default_value.isoformat()
-                    elif isinstance(default_value, Decimal):
-                        default_value = str(default_value)
-
-                    desc = field.description or "--"
-
-                    # Pydantic v2 examples can be in field.examples
-                    # or json_schema_extra `examples` or `doc_examples` field
-                    # Use `doc_examples` when you want to show examples only in docs
-                    # and not in the generated JSON Schema.
-                    examples = (
-                        getattr(field, "examples", None)
-                        or (field.json_schema_extra or {}).get("examples")
-                        or (field.json_schema_extra or {}).get("doc_examples")
-                        or []
-                    )
-                    examples_str = (
-                        ", ".join(str(ex) for ex in examples) if examples else "--"
-                    )
-                    model_fields.append(
-                        {
-                            "name": field.alias or name,
-                            "type": table_t,
-                            "required": is_required,
-                            "default": default_value,
-                            "description": desc,
-                            "examples": examples_str,
-                        }
-                    )
+        Args:
+            mode: `all` models, or only the `top` models (query parameters,
+                request and response), without nested and extra response models.
+        """
+        return "".join(
+            model_field_table(model, default_title)
+            for model, default_title in self._get_all_models(nested=mode == "all")
+        )
 
-                # Sort fields by required first, then by name
-                model_fields.sort(key=lambda f: (not f["required"], f["name"].lower()))
+    def get_path(self) -> str:
+        return self.path
 
-                for field in model_fields:
-                    name = (
-                        f"**{field['name']}**" if field["required"] else field["name"]
-                    )
-                    model_table += (
-                        f"| {name} | {field['type']} | "
-                        f"{'**Yes**' if field['required'] else 'No'} | "
-                        f"{field['default']} | {field['description']} | "
-                        f"{field['examples']} |\n"
-                    )
-                description += model_table
-        return description
-
-    def get_path(self):
-        # Check for path in view first
-        path = None
-        if self.path:
-            path = self.path
-        if not path:
-            # Example: foo.bar.baz.handler
-            import_parts = self.import_path.split(".")
-            index = None
-            use_name = conf.LAMINA_USE_OBJECT_NAME
-            # check if value is a integer
-            if use_name.isdigit() or (
-                use_name.startswith("-") and use_name[1:].isdigit()
-            ):
-                index = int(use_name)
-            else:
-                match conf.LAMINA_USE_OBJECT_NAME:
-                    case "package":
-                        index = -3  # bar
-                    case "module":
-                        index = -2  # baz
-                    case "function":
-                        index = -1  # handler
-                    case _:
-                        raise ValueError(
-                            "Invalid value for LAMINA_USE_OBJECT_NAME. "
-                            "Expected one of: package, module, function. "
-                            "Or an integer index.",
-                        )
-            # Get part using index or default to first part if index out of range
-            path = (
-                import_parts[index]
-                if -len(import_parts) <= index < len(import_parts)
-                else import_parts[0]
-            )
-            path = kebabcase(path)
-            logger.debug(
-                f"Path: {path} found from import path: "
-                f"{self.import_path} and index: {index}/{use_name}"
-            )
-        return f"/{path}" if not path.startswith("/") else path
+    def _resolve_path(self) -> str:
+        return resolve_path(self.path, self.import_path)
 
-    def get_operation_id(self):
-        extras = self.extract_extras()
-        fallback_name = camelcase(self.get_path().replace("/", ""))
-        return extras.get("operationId", fallback_name)
+    def get_operation_id(self) -> str:
+        return self.operation_id
+
+    def _resolve_operation_id(self) -> str:
+        fallback_name = camelcase(self.path.replace("/", ""))
+        return self.extras.get("operationId", fallback_name)
 
     def get_parameters(self) -> List[ParameterObject]:
+        """Return the OpenAPI query parameters of the view."""
+        return list(self.parameters)
+
+    def _resolve_parameters(self) -> Tuple[ParameterObject, ...]:
         """Convert a Pydantic model into OpenAPI query parameters."""
         params: List[ParameterObject] = []
-        if self.params is None:
-            return params
 
         # Only handle BaseModel subclasses for parameters
         if inspect.isclass(self.params) and issubclass(self.params, BaseModel):
+            required_fields = model_schema(self.params).get("required") or []
             for name, field in self.params.model_fields.items():
                 annotation = field.annotation
                 # Minimal type mapping
@@ -446,7 +450,6 @@ class ViewData:
                 elif annotation is bool:
                     t = "boolean"
 
-                required_fields = self.params.model_json_schema().get("required") or []
                 is_required = name in required_fields or field.alias in required_fields
                 desc = field.description or ""
                 params.append(
@@ -460,7 +463,29 @@ class ViewData:
                         }
                     )
                 )
-        return params
+        params.extend(self._fieldset_parameters())
+        return tuple(params)
+
+    def _fieldset_parameters(self) -> List[ParameterObject]:
+        """Document the `fields`/`exclude` query parameters of sparse fieldsets."""
+        if not self.sparse_fields or self.response is None:
+            return []
+        names = ", ".join(f"`{name}`" for name in field_names(self.response))
+        return [
+            ParameterObject(
+                **{
+                    "name": name,
+                    "in": "query",
+                    "required": False,
+                    "schema": {"type": "string"},
+                    "description": (
+                        f"Comma separated response fields to {action}, with "
+                        f"nested fields joined by dots. Fields: {names}."
+                    ),
+                }
+            )
+            for name, action in ((FIELDS_PARAM, "return"), (EXCLUDE_PARAM, "omit"))
+        ]
 
     @staticmethod
     def get_model_schema(
@@ -474,8 +499,212 @@ class ViewData:
         }
 
     def get_tags(self) -> List[str]:
-        extras = self.extract_extras()
-        tags = self.tags or extras.get("tags") or []
-        if isinstance(tags, str):
-            tags = [tags]
-        return tags
+        return list(self.tags)
+
+    def _resolve_tags(self) -> Tuple[str, ...]:
+        return resolve_tags(self.tags, self.extras)
+
+
+ROUTE_EXTRAS = ("methods", "method", "http_method", "tags")
+
+
+@dataclass(frozen=True, slots=True)
+class RouteData:
+    """Routing data of a lamina handler: path, methods and tags.
+
+    Resolved like `ViewData`, but without generating the JSON schemas of the
+    models, so routers and the handler registry stay cheap at cold start.
+
+    Attributes:
+        import_path: Import path of the handler.
+        path: Path of the view, from the decorator or the import path.
+        methods: Lower-case HTTP methods.
+        tags: Operation tags.
+    """
+
+    import_path: Optional[str]
+    path: str
+    methods: Tuple[str, ...]
+    tags: Tuple[str, ...]
+
+    @classmethod
+    def from_wrapper(cls, wrapper: Callable[..., Any]) -> "RouteData":
+        """Build the routing data from the attributes of a lamina handler."""
+        extras = route_extras(
+            getattr(wrapper, "schema_in", None),
+            getattr(wrapper, "schema_out", None),
+            getattr(wrapper, "params_in", None),
+        )
+        import_path = getattr(wrapper, "import_path", None)
+        return cls(
+            import_path=import_path,
+            path=resolve_path(getattr(wrapper, "path", None), import_path),
+            methods=resolve_methods(getattr(wrapper, "methods", None), extras),
+            tags=resolve_tags(getattr(wrapper, "tags", None), extras),
+        )
+
+
+def route_extras(*models: Optional[Type[BaseModel | RootModel]]) -> Dict[str, Any]:
+    """Return the routing keys of the models json_schema_extra.
+
+    Dict extras are read from the model config. Callable extras edit the
+    generated schema, so the schema is generated for them.
+    """
+    extras: Dict[str, Any] = {}
+    for model in models:
+        if model is None:
+            continue
+        extra = getattr(model, "model_config", {}).get("json_schema_extra")
+        if callable(extra):
+            extra = model_schema(model)
+        if extra:
+            extras.update({key: extra[key] for key in ROUTE_EXTRAS if key in extra})
+    return extras
+
+
+def resolve_path(path: Optional[str], import_path: Optional[str]) -> str:
+    """Return the decorator path, or a path from the import path."""
+    if not path:
+        # Example: foo.bar.baz.handler
+        import_parts = import_path.split(".")
+        index = None
+        use_name = conf.LAMINA_USE_OBJECT_NAME
+        # check if value is a integer
+        if use_name.isdigit() or (use_name.startswith("-") and use_name[1:].isdigit()):
+            index = int(use_name)
+        else:
+            match conf.LAMINA_USE_OBJECT_NAME:
+                case "package":
+                    index = -3  # bar
+                case "module":
+                    index = -2  # baz
+                case "function":
+                    index = -1  # handler
+                case _:
+                    raise ValueError(
+                        "Invalid value for LAMINA_USE_OBJECT_NAME. "
+                        "Expected one of: package, module, function. "
+                        "Or an integer index.",
+                    )
+        # Get part using index or default to first part if index out of range
+        path = (
+            import_parts[index]
+            if -len(import_parts) <= index < len(import_parts)
+            else import_parts[0]
+        )
+        path = kebabcase(path)
+        logger.debug(
+            f"Path: {path} found from import path: "
+            f"{import_path} and index: {index}/{use_name}"
+        )
+    return f"/{path}" if not path.startswith("/") else path
+
+
+def resolve_methods(
+    methods: Optional[Iterable[str]], extras: Dict[str, Any]
+) -> Tuple[str, ...]:
+    """Return the lower-case methods of the decorator, the extras or `post`."""
+    if methods:
+        return tuple(m.lower() for m in methods)
+    m_from_extra = (
+        extras.get("methods") or extras.get("method") or extras.get("http_method")
+    )
+    if isinstance(m_from_extra, str):
+        return (m_from_extra.lower(),)
+    if isinstance(m_from_extra, (list, tuple)):
+        return tuple(str(m).lower() for m in m_from_extra)
+    return ("post",)
+
+
+def resolve_tags(
+    tags: Optional[Iterable[str] | str], extras: Dict[str, Any]
+) -> Tuple[str, ...]:
+    """Return the tags of the decorator or the extras."""
+    tags = tags or extras.get("tags") or []
+    if isinstance(tags, str):
+        tags = [tags]
+    return tuple(tags)
+
+
+def _as_tuple(value: Any) -> Any:
+    """Freeze decorator lists, so views stay hashable."""
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _format_default(field: FieldInfo) -> Any:
+    default_value = (
+        field.default
+        if field.default is not None and field.default is not PydanticUndefined
+        else "--"
+    )
+    if isinstance(default_value, Enum):
+        return default_value.value
+    if isinstance(default_value, (datetime.date, datetime.datetime)):
+        return default_value.isoformat()
+    if isinstance(default_value, Decimal):
+        return str(default_value)
+    return default_value
+
+
+@functools.lru_cache(maxsize=1024)
+def model_field_table(model: Type[BaseModel | RootModel], default_title: str) -> str:
+    """Build the Markdown field table of a model.
+
+    Shared models (errors, pagination, ...) appear in many views, so tables
+    are cached per model and title.
+    """
+    if model.__name__ == "RootModel":
+        return ""
+    fields = model.model_fields
+    if not fields:
+        return ""
+
+    # Get Model Docstring
+    doc_title, doc_description = parse_docstring(model.__doc__)
+    separator = default_title.split(" ")[0]
+    title = f"{separator} {doc_title}\n\n" if doc_title else default_title
+    if not title:
+        title = f"{separator} {titlecase(model.__name__)}\n\n"
+    parts = [title]
+    if doc_description:
+        parts.append(f"{doc_description}\n\n")
+    parts.append(
+        "| Field | Type | Required | Default Value | Description | Examples |\n"
+    )
+    parts.append(
+        "|-------|------|----------|---------------|-------------|----------|\n"
+    )
+
+    model_fields = []
+    for name, field in fields.items():
+        # Pydantic v2 examples can be in field.examples
+        # or json_schema_extra `examples` or `doc_examples` field
+        # Use `doc_examples` when you want to show examples only in docs
+        # and not in the generated JSON Schema.
+        examples = (
+            getattr(field, "examples", None)
+            or (field.json_schema_extra or {}).get("examples")
+            or (field.json_schema_extra or {}).get("doc_examples")
+            or []
+        )
+        model_fields.append(
+            (
+                field.alias or name,
+                ViewData._python_to_openapi_type(field.annotation),
+                field.is_required(),
+                _format_default(field),
+                field.description or "--",
+                ", ".join(str(ex) for ex in examples) if examples else "--",
+            )
+        )
+
+    # Sort fields by required first, then by name
+    model_fields.sort(key=lambda f: (not f[2], f[0].lower()))
+
+    for name, table_type, required, default, description, examples in model_fields:
+        parts.append(
+            f"| {f'**{name}**' if required else name} | {table_type} | "
+            f"{'**Yes**' if required else 'No'} | "
+            f"{default} | {description} | {examples} |\n"
+        )
+    return "".join(parts)
@@ -0,0 +1,224 @@
+"""Record sampled invocations to a local JSONL file for later replay.
+
+Enable with the `record_events` setting (`LAMINA_RECORD_EVENTS` or
+`record_events` in `[tool.lamina]`) pointing to the output file. Files ending
+in `.zst` are compressed with zstandard (`pip install py-lamina[record]`).
+
+Each line holds the handler import path, the received event, context
+metadata, the response and the phase timings, with sensitive headers and
+fields redacted.
+"""
+
+import io
+import json
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from loguru import logger
+
+from lamina import conf
+from lamina.helpers import DecimalEncoder
+
+REDACTED = "***"
+
+
+def _is_compressed(path: str | Path) -> bool:
+    return str(path).endswith(".zst")
+
+
+def _import_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as error:
+        raise ImportError(
+            "Compressed (.zst) recordings need zstandard. "
+            "Install it with: pip install py-lamina[record]"
+        ) from error
+    return zstandard
+
+
+def read_records(path: str | Path) -> Iterator[Dict[str, Any]]:
+    """Read JSON lines from a plain or zstandard compressed file."""
+    if _is_compressed(path):
+        zstandard = _import_zstandard()
+        with open(path, "rb") as raw:
+            reader = zstandard.ZstdDecompressor().stream_reader(
+                raw, read_across_frames=True
+            )
+            lines: Iterable[str] = io.TextIOWrapper(reader, encoding="utf-8")
+            yield from _parse_lines(lines)
+    else:
+        with open(path, encoding="utf-8") as file:
+            yield from _parse_lines(file)
+
+
+def _parse_lines(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+@dataclass
+class EventRecorder:
+    """Append sampled invocations to a rotating JSONL file.
+
+    Attributes:
+        path: Output file. A `.zst` suffix enables zstandard compression.
+        sample_rate: Fraction of invocations recorded, from 0 to 1.
+        redact: Header, query string and JSON field names (case-insensitive)
+            whose values are replaced before writing.
+        max_bytes: Rotate the file when it grows past this size.
+        backups: Number of rotated files kept (`path.1`, `path.2`, ...).
+    """
+
+    path: str
+    sample_rate: float = 1.0
+    redact: Iterable[str] = ()
+    max_bytes: int = 10 * 1024 * 1024
+    backups: int = 3
+    _redact: frozenset[str] = field(init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _compressor: Any = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._redact = frozenset(name.lower() for name in self.redact)
+        if _is_compressed(self.path):
+            self._compressor = _import_zstandard().ZstdCompressor()
+
+    def should_record(self) -> bool:
+        return self.sample_rate >= 1 or random.random() < self.sample_rate  # nosec
+
+    def record(
+        self,
+        handler: str,
+        event: Any,
+        context: Any,
+        response: Dict[str, Any],
+        timings: Dict[str, float],
+    ) -> None:
+        """Write one invocation. Errors are logged and never raised."""
+        try:
+            line = json.dumps(
+                {
+                    "handler": handler,
+                    "recorded_at": time.time(),
+                    "event": self._redact_event(event),
+                    "context": self._context_metadata(context),
+                    "response": self._redact_response(response),
+                    "timings": timings,
+                },
+                cls=DecimalEncoder,
+                default=str,
+            )
+            data = (line + "\n").encode("utf-8")
+            if self._compressor is not None:
+                data = self._compressor.compress(data)
+            with self._lock:
+                self._rotate(len(data))
+                with open(self.path, "ab") as file:
+                    file.write(data)
+        except Exception as e:
+            logger.warning(f"Could not record event to {self.path}: {e}")
+
+    def _rotate(self, incoming: int) -> None:
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size + incoming <= self.max_bytes:
+            return
+        if self.backups <= 0:
+            os.remove(self.path)
+            return
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    @staticmethod
+    def _context_metadata(context: Any) -> Dict[str, Any]:
+        if context is None or isinstance(context, dict):
+            return dict(context or {})
+        metadata = {
+            name: getattr(context, name, None)
+            for name in ("function_name", "memory_limit_in_mb", "aws_request_id")
+        }
+        if hasattr(context, "get_remaining_time_in_millis"):
+            metadata["remaining_time_in_millis"] = (
+                context.get_remaining_time_in_millis()
+            )
+        return metadata
+
+    def _redact_value(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                key: (
+                    REDACTED
+                    if str(key).lower() in self._redact
+                    else self._redact_value(item)
+                )
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [self._redact_value(item) for item in value]
+        return value
+
+    def _redact_body(self, body: Any) -> Any:
+        if not isinstance(body, str) or not self._redact:
+            return body
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return body
+        return json.dumps(self._redact_value(data), cls=DecimalEncoder)
+
+    def _redact_event(self, event: Any) -> Any:
+        if not isinstance(event, dict):
+            return event
+        redacted = self._redact_value(
+            {key: value for key, value in event.items() if key != "body"}
+        )
+        if "body" in event:
+            redacted["body"] = (
+                event["body"]
+                if event.get("isBase64Encoded")
+                else self._redact_body(event["body"])
+            )
+        return redacted
+
+    def _redact_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        redacted = dict(response)
+        redacted["headers"] = self._redact_value(response.get("headers") or {})
+        if not response.get("isBase64Encoded"):
+            redacted["body"] = self._redact_body(response.get("body"))
+        return redacted
+
+
+_recorder: Optional[Tuple[Tuple[Any, ...], EventRecorder]] = None
+_recorder_lock = threading.Lock()
+
+
+def get_recorder() -> Optional[EventRecorder]:
+    """Return the recorder configured by the settings, or None if disabled."""
+    global _recorder
+    path = conf.LAMINA_RECORD_EVENTS
+    if not path:
+        return None
+    options = (
+        path,
+        conf.LAMINA_RECORD_SAMPLE_RATE,
+        tuple(conf.LAMINA_RECORD_REDACT),
+        conf.LAMINA_RECORD_MAX_BYTES,
+        conf.LAMINA_RECORD_BACKUPS,
+    )
+    with _recorder_lock:
+        if _recorder is None or _recorder[0] != options:
+            _recorder = (options, EventRecorder(*options))
+        return _recorder[1]
@@ -0,0 +1,207 @@
+"""Registry of lamina-decorated handlers.
+
+Handlers are kept in registration order and indexed by import path, by route
+(HTTP method and path) and by tag. Registering a handler again (module
+reloads, spec discovery after the runtime imported the handlers) replaces the
+previous one in place instead of adding a duplicate.
+
+Routes and tags are resolved from the handler `RouteData` (without the model
+JSON schemas), and these indexes are built by the first lookup after a
+change: decorating handlers stays cheap at cold start.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Tuple
+
+from loguru import logger
+
+from lamina import conf
+
+CONFLICT_POLICIES = ("warn", "raise")
+
+Handler = Callable[..., Any]
+RouteKey = Tuple[str, str]
+
+
+class RouteConflictError(ValueError):
+    """Different handlers serve the same method and path."""
+
+
+def handler_key(wrapper: Handler) -> Tuple[Hashable, str | None]:
+    """Identify a handler by import path and decorator path.
+
+    Handlers made by a factory share the import path, and are told apart by
+    their path. Callables without import path are identified by object.
+    """
+    return (
+        getattr(wrapper, "import_path", None) or id(wrapper),
+        getattr(wrapper, "path", None),
+    )
+
+
+class HandlerRegistry:
+    """Thread-safe registry of handlers, with constant time lookups.
+
+    Behaves as the list it replaces (iteration, `len`, indexing, `append`,
+    `clear` and slice assignment), so code using `LAMINA_REGISTRY` as a list
+    keeps working. Iteration uses a snapshot, so handlers can be registered
+    while other threads iterate.
+
+    Args:
+        handlers: Handlers to register.
+        on_conflict: `warn` or `raise`, for different handlers serving the
+            same method and path. Defaults to `LAMINA_ROUTE_CONFLICTS`.
+    """
+
+    def __init__(
+        self, handlers: Iterable[Handler] = (), on_conflict: str | None = None
+    ):
+        self.on_conflict = on_conflict
+        self._lock = threading.RLock()
+        self._handlers: Dict[Tuple[Hashable, str | None], Handler] = {}
+        self._by_import_path: Dict[str, Handler] = {}
+        self._snapshot: Tuple[Handler, ...] | None = None
+        self._routes: Dict[RouteKey, Handler] | None = None
+        self._tags: Dict[str, List[Handler]] | None = None
+        self.extend(handlers)
+
+    def register(self, wrapper: Handler) -> Handler:
+        """Add a handler, replacing a previous handler with the same identity."""
+        key = handler_key(wrapper)
+        with self._lock:
+            previous = self._handlers.get(key)
+            if previous is wrapper:
+                return wrapper
+            self._handlers[key] = wrapper
+            import_path = getattr(wrapper, "import_path", None)
+            if import_path:
+                self._by_import_path[import_path] = wrapper
+            self._changed()
+        if previous is not None:
+            logger.debug(f"Replaced lamina handler {key[0]}")
+        return wrapper
+
+    append = register
+
+    def extend(self, handlers: Iterable[Handler]) -> None:
+        with self._lock:
+            for wrapper in handlers:
+                self.register(wrapper)
+
+    def remove(self, wrapper: Handler) -> None:
+        with self._lock:
+            if self._handlers.get(handler_key(wrapper)) is not wrapper:
+                raise ValueError(f"Handler is not registered: {wrapper!r}")
+            self._replace([item for item in self if item is not wrapper])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._handlers.clear()
+            self._by_import_path.clear()
+            self._changed()
+
+    def get(self, import_path: str) -> Handler | None:
+        """Return the last registered handler with the import path."""
+        return self._by_import_path.get(import_path)
+
+    def get_route(self, method: str, path: str) -> Handler | None:
+        """Return the handler of a method and path, as declared (`/items/{id}`)."""
+        return self.routes().get((method.upper(), path))
+
+    def routes(self) -> Dict[RouteKey, Handler]:
+        """Return the handlers by (upper-case method, path).
+
+        Raises:
+            RouteConflictError: Two handlers serve the same route and
+                `on_conflict` is `raise`.
+        """
+        return self._indexes()[0]
+
+    def by_tag(self, tag: str) -> List[Handler]:
+        """Return the handlers with the tag, in registration order."""
+        return list(self._indexes()[1].get(tag, ()))
+
+    def _indexes(self) -> Tuple[Dict[RouteKey, Handler], Dict[str, List[Handler]]]:
+        with self._lock:
+            if self._routes is None or self._tags is None:
+                from lamina.openapi.view_data import RouteData
+
+                routes: Dict[RouteKey, Handler] = {}
+                tags: Dict[str, List[Handler]] = {}
+                for wrapper in self:
+                    if not (
+                        getattr(wrapper, "import_path", None)
+                        or getattr(wrapper, "path", None)
+                    ):
+                        continue
+                    view = RouteData.from_wrapper(wrapper)
+                    for method in view.methods:
+                        route = (method.upper(), view.path)
+                        first = routes.setdefault(route, wrapper)
+                        if first is not wrapper:
+                            self._conflict(route, first, wrapper)
+                    for tag in view.tags:
+                        tags.setdefault(tag, []).append(wrapper)
+                self._routes, self._tags = routes, tags
+            return self._routes, self._tags
+
+    def _conflict(self, route: RouteKey, first: Handler, other: Handler) -> None:
+        on_conflict = self.on_conflict or conf.LAMINA_ROUTE_CONFLICTS
+        if on_conflict not in CONFLICT_POLICIES:
+            raise ValueError(
+                "Invalid value for LAMINA_ROUTE_CONFLICTS. "
+                f"Expected one of: {', '.join(CONFLICT_POLICIES)}."
+            )
+        message = (
+            f"Route {route[0]} {route[1]} of {handler_key(other)[0]} is already "
+            f"served by {handler_key(first)[0]}"
+        )
+        if on_conflict == "raise":
+            raise RouteConflictError(message)
+        logger.warning(message)
+
+    def _changed(self) -> None:
+        self._snapshot = None
+        self._routes = None
+        self._tags = None
+
+    def _replace(self, handlers: Iterable[Handler]) -> None:
+        with self._lock:
+            handlers = list(handlers)
+            self.clear()
+            self.extend(handlers)
+
+    def _items(self) -> Tuple[Handler, ...]:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot = tuple(self._handlers.values())
+        return snapshot
+
+    def __iter__(self) -> Iterator[Handler]:
+        return iter(self._items())
+
+    def __len__(self) -> int:
+        return len(self._handlers)
+
+    def __contains__(self, wrapper: object) -> bool:
+        return self._handlers.get(handler_key(wrapper)) is wrapper
+
+    def __getitem__(self, index: int | slice) -> Handler | List[Handler]:
+        items = self._items()[index]
+        return list(items) if isinstance(index, slice) else items
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        with self._lock:
+            items = list(self)
+            items[index] = value
+            self._replace(items)
+
+    def __delitem__(self, index: int | slice) -> None:
+        with self._lock:
+            items = list(self)
+            del items[index]
+            self._replace(items)
+
+    def __repr__(self) -> str:
+        return f"HandlerRegistry({list(self)!r})"
@@ -0,0 +1,287 @@
+"""Replay recorded events against a handler and report latency statistics.
+
+Example:
+    from lamina.replay import compare, load_events, load_records, replay
+
+    report = replay(create_item, load_events("events.jsonl"), rate=200)
+    print(report.summary())
+
+    # Re-run events captured with `record_events` and diff the results
+    diff = compare(create_item, load_records("recorded.jsonl.zst"))
+    print(diff.summary())
+"""
+
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from lamina.gateway import LocalContext
+from lamina.recorder import read_records
+
+
+def load_events(path: str | Path) -> Iterator[Dict[str, Any]]:
+    """Read events from a JSONL file (`.zst` compressed files are supported).
+
+    Each line is either the event itself or an object with an `event` key,
+    as written by the event recorder.
+    """
+    for data in read_records(path):
+        if isinstance(data, dict) and isinstance(data.get("event"), dict):
+            data = data["event"]
+        yield data
+
+
+def load_records(
+    path: str | Path, handler: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """Read records written by the event recorder.
+
+    Args:
+        path: Recording file.
+        handler: Only return records of this handler import path.
+    """
+    for record in read_records(path):
+        if handler is None or record.get("handler") == handler:
+            yield record
+
+
+# Distinct exceptions listed in the replay summary
+_SUMMARY_FAILURES = 5
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Return the nearest-rank percentile of the values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass
+class ReplayReport:
+    """Latency (in milliseconds) and error counts of a replay.
+
+    Attributes:
+        latencies: Milliseconds from the intended start of each invocation
+            (its slot in the target rate) to its end, so time spent waiting
+            for a free worker counts as latency.
+        status_codes: Responses per status code.
+        exceptions: Invocations which raised instead of returning a response.
+        failures: Exceptions raised by invocations, by type and message.
+        duration: Seconds from the first to the last invocation.
+    """
+
+    latencies: List[float] = field(default_factory=list)
+    status_codes: Dict[int, int] = field(default_factory=dict)
+    exceptions: int = 0
+    failures: Dict[str, int] = field(default_factory=dict)
+    duration: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def errors(self) -> int:
+        server_errors = sum(
+            total for status, total in self.status_codes.items() if status >= 500
+        )
+        return server_errors + self.exceptions
+
+    @property
+    def throughput(self) -> float:
+        return self.count / self.duration if self.duration else 0.0
+
+    def percentile(self, percent: float) -> float:
+        return percentile(self.latencies, percent)
+
+    def summary(self) -> str:
+        summary = (
+            f"requests={self.count} errors={self.errors} "
+            f"exceptions={self.exceptions} "
+            f"throughput={self.throughput:.1f}/s "
+            f"p50={self.percentile(50):.2f}ms p95={self.percentile(95):.2f}ms "
+            f"p99={self.percentile(99):.2f}ms"
+        )
+        failures = sorted(self.failures.items(), key=lambda item: -item[1])
+        for failure, total in failures[:_SUMMARY_FAILURES]:
+            summary += f"\n  {total}x {failure}"
+        return summary
+
+
+def replay(
+    handler: Callable[..., Any],
+    events: Iterable[Dict[str, Any]],
+    *,
+    rate: Optional[float] = None,
+    concurrency: int = 8,
+    context_factory: Callable[[], Any] = LocalContext,
+) -> ReplayReport:
+    """Invoke the handler with each event and measure its latency.
+
+    With a `rate`, latencies are measured from the intended start of each
+    invocation, so queueing behind slow invocations is not hidden
+    (coordinated omission).
+
+    Args:
+        handler: A lamina decorated handler.
+        events: Events to replay, in order.
+        rate: Target invocations per second. None replays as fast as possible,
+            and latencies are measured from the start of each invocation.
+        concurrency: Maximum number of invocations in flight.
+        context_factory: Builds the Lambda context for each invocation.
+
+    Returns:
+        The replay report.
+    """
+    report = ReplayReport()
+    lock = threading.Lock()
+
+    def invoke(event: Dict[str, Any], intended_start: Optional[float]) -> None:
+        start = time.perf_counter() if intended_start is None else intended_start
+        status: Optional[int] = None
+        failure: Optional[str] = None
+        try:
+            status = handler(event, context_factory())["statusCode"]
+        except Exception as e:
+            failure = f"{type(e).__name__}: {e}"
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            report.latencies.append(elapsed)
+            if failure is not None:
+                report.exceptions += 1
+                report.failures[failure] = report.failures.get(failure, 0) + 1
+            elif status is not None:
+                report.status_codes[status] = report.status_codes.get(status, 0) + 1
+
+    interval = 1 / rate if rate else 0.0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for index, event in enumerate(events):
+            intended_start = None
+            if interval:
+                # Measured from the schedule, not from when a worker is free
+                intended_start = started + index * interval
+                delay = intended_start - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            executor.submit(invoke, event, intended_start)
+    report.duration = time.perf_counter() - started
+    return report
+
+
+def _parse_body(body: Any) -> Any:
+    if isinstance(body, str):
+        try:
+            return json.loads(body)
+        except ValueError:
+            pass
+    return body
+
+
+@dataclass
+class RecordDiff:
+    """Result of replaying one recorded invocation."""
+
+    index: int
+    expected: Dict[str, Any]
+    actual: Optional[Dict[str, Any]]
+    recorded_ms: Optional[float]
+    latency_ms: float
+    error: Optional[str] = None
+
+    @property
+    def status_changed(self) -> bool:
+        if self.actual is None:
+            return True
+        return self.expected.get("statusCode") != self.actual.get("statusCode")
+
+    @property
+    def body_changed(self) -> bool:
+        if self.actual is None:
+            return True
+        return _parse_body(self.expected.get("body")) != _parse_body(
+            self.actual.get("body")
+        )
+
+    @property
+    def changed(self) -> bool:
+        return self.status_changed or self.body_changed
+
+
+@dataclass
+class CompareReport:
+    """Differences between recorded and replayed invocations."""
+
+    results: List[RecordDiff] = field(default_factory=list)
+
+    @property
+    def changed(self) -> List[RecordDiff]:
+        return [result for result in self.results if result.changed]
+
+    def latency_percentile(self, percent: float, recorded: bool = False) -> float:
+        if recorded:
+            values = [r.recorded_ms for r in self.results if r.recorded_ms is not None]
+        else:
+            values = [r.latency_ms for r in self.results]
+        return percentile(values, percent)
+
+    def summary(self) -> str:
+        parts = [f"records={len(self.results)} changed={len(self.changed)}"]
+        for percent in (50, 95, 99):
+            parts.append(
+                f"p{percent}={self.latency_percentile(percent):.2f}ms"
+                f" (recorded {self.latency_percentile(percent, recorded=True):.2f}ms)"
+            )
+        return " ".join(parts)
+
+
+def compare(
+    handler: Callable[..., Any],
+    records: Iterable[Dict[str, Any]],
+    *,
+    concurrency: int = 8,
+    context_factory: Callable[[], Any] = LocalContext,
+) -> CompareReport:
+    """Re-run recorded invocations in parallel and diff responses and latencies.
+
+    Redacted values are replayed as recorded, so handlers depending on them
+    (e.g. authorization headers) may answer differently.
+
+    Args:
+        handler: A lamina decorated handler.
+        records: Records written by the event recorder.
+        concurrency: Maximum number of invocations in flight.
+        context_factory: Builds the Lambda context for each invocation.
+
+    Returns:
+        The comparison report, in the order of the records.
+    """
+
+    def invoke(item: Tuple[int, Dict[str, Any]]) -> RecordDiff:
+        index, record = item
+        timings = record.get("timings") or {}
+        start = time.perf_counter()
+        actual, error = None, None
+        try:
+            actual = handler(record["event"], context_factory())
+        except Exception as e:
+            error = str(e)
+        return RecordDiff(
+            index=index,
+            expected=record.get("response") or {},
+            actual=actual,
+            recorded_ms=timings.get("total"),
+            latency_ms=(time.perf_counter() - start) * 1000,
+            error=error,
+        )
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(invoke, enumerate(records)))
+    return CompareReport(results=results)
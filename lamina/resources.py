@@ -0,0 +1,310 @@
+"""Container-scoped resources for lamina handlers.
+
+Expensive clients (database pools, HTTP sessions, boto3 clients) are registered
+once and lazily created on first use. The same instance is reused by every
+invocation served by the container, and is available in handlers through
+`request.resources`:
+
+    from lamina import resources
+
+    resources.register("db", create_pool, teardown=lambda pool: pool.close())
+
+    @lamina()
+    def handler(request: Request):
+        request.resources.db.execute(...)
+
+Async factories are supported: use `await request.resources.aget("name")`
+inside async handlers.
+"""
+
+import asyncio
+import inspect
+import os
+import signal
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type
+
+from loguru import logger
+
+from lamina.helpers import run_coroutine
+
+_MISSING = object()
+
+
+@dataclass
+class Resource:
+    """A registered container-scoped resource.
+
+    Attributes:
+        name: Resource name, used as attribute in `request.resources`.
+        factory: Sync or async callable which creates the resource.
+        health_check: Optional callable which receives the instance and returns
+            False if it must be recreated.
+        teardown: Optional callable which receives the instance to dispose it.
+        reset_on: Exception types which, raised by a handler which used the
+            resource, dispose it so the next access creates a new one.
+        health_check_interval: Minimum seconds between health checks.
+    """
+
+    name: str
+    factory: Callable[[], Any]
+    health_check: Optional[Callable[[Any], Any]] = None
+    teardown: Optional[Callable[[Any], Any]] = None
+    reset_on: Tuple[Type[BaseException], ...] = ()
+    health_check_interval: float = 0.0
+    instance: Any = field(default=_MISSING, init=False, repr=False)
+    checked_at: float = field(default=0.0, init=False, repr=False)
+
+    @property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.factory)
+
+    @property
+    def created(self) -> bool:
+        return self.instance is not _MISSING
+
+    def needs_check(self) -> bool:
+        return (
+            self.health_check is not None
+            and time.monotonic() - self.checked_at >= self.health_check_interval
+        )
+
+
+@dataclass
+class ResourceRegistry:
+    """Registry of lazily created, container-scoped resources."""
+
+    _resources: Dict[str, Resource] = field(default_factory=dict, repr=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+    _signal_installed: bool = field(default=False, repr=False)
+
+    def register(
+        self,
+        name: str,
+        factory: Optional[Callable[[], Any]] = None,
+        *,
+        health_check: Optional[Callable[[Any], Any]] = None,
+        teardown: Optional[Callable[[Any], Any]] = None,
+        reset_on: Tuple[Type[BaseException], ...] = (),
+        health_check_interval: float = 0.0,
+    ) -> Any:
+        """Register a resource factory. Can be used as a decorator.
+
+        Registering an existing name disposes the previous instance.
+        """
+
+        def decorator(func: Callable[[], Any]) -> Callable[[], Any]:
+            with self._lock:
+                if name in self._resources:
+                    self.reset(name)
+                self._resources[name] = Resource(
+                    name=name,
+                    factory=func,
+                    health_check=health_check,
+                    teardown=teardown,
+                    reset_on=reset_on,
+                    health_check_interval=health_check_interval,
+                )
+            return func
+
+        if factory is None:
+            return decorator
+        return decorator(factory)
+
+    def _get_resource(self, name: str) -> Resource:
+        try:
+            return self._resources[name]
+        except KeyError:
+            raise AttributeError(f"Resource '{name}' is not registered.") from None
+
+    def get(self, name: str) -> Any:
+        """Return the resource instance, creating it on first use."""
+        resource = self._get_resource(name)
+        with self._lock:
+            if resource.created and resource.needs_check():
+                if inspect.iscoroutinefunction(resource.health_check):
+                    self._check(resource, run_coroutine(self._acheck(resource)))
+                else:
+                    self._check(resource, self._run_check(resource))
+            if not resource.created:
+                if resource.is_async:
+                    resource.instance = run_coroutine(resource.factory())
+                else:
+                    resource.instance = resource.factory()
+                self._created(resource)
+            return resource.instance
+
+    async def aget(self, name: str) -> Any:
+        """Return the resource instance, awaiting async factories and checks."""
+        resource = self._get_resource(name)
+        if resource.created and resource.needs_check():
+            self._check(resource, await self._acheck(resource))
+        if not resource.created:
+            if resource.is_async:
+                instance = await resource.factory()
+            else:
+                instance = resource.factory()
+            with self._lock:
+                if resource.created:
+                    # Created concurrently: keep the first instance
+                    self._dispose(resource.name, instance, resource.teardown)
+                else:
+                    resource.instance = instance
+                    self._created(resource)
+        return resource.instance
+
+    @staticmethod
+    def _run_check(resource: Resource) -> bool:
+        try:
+            return bool(resource.health_check(resource.instance))
+        except Exception as e:
+            logger.warning(f"Health check for resource '{resource.name}' failed: {e}")
+            return False
+
+    @staticmethod
+    async def _acheck(resource: Resource) -> bool:
+        try:
+            result = resource.health_check(resource.instance)
+            if inspect.isawaitable(result):
+                result = await result
+            return bool(result)
+        except Exception as e:
+            logger.warning(f"Health check for resource '{resource.name}' failed: {e}")
+            return False
+
+    def _check(self, resource: Resource, healthy: bool) -> None:
+        resource.checked_at = time.monotonic()
+        if not healthy:
+            logger.info(f"Resource '{resource.name}' is unhealthy. Recreating it.")
+            self.reset(resource.name)
+
+    def _created(self, resource: Resource) -> None:
+        resource.checked_at = time.monotonic()
+        logger.debug(f"Resource '{resource.name}' created.")
+        self._install_signal_handler()
+
+    def reset(self, name: str) -> None:
+        """Dispose the instance. The next access creates a new one."""
+        resource = self._get_resource(name)
+        with self._lock:
+            if not resource.created:
+                return
+            instance = resource.instance
+            resource.instance = _MISSING
+        self._dispose(name, instance, resource.teardown)
+
+    @staticmethod
+    def _dispose(
+        name: str, instance: Any, teardown: Callable[[Any], Any] | None
+    ) -> None:
+        if teardown is None:
+            return
+        try:
+            result = teardown(instance)
+            if inspect.isawaitable(result):
+                try:
+                    asyncio.get_running_loop().create_task(result)
+                except RuntimeError:
+                    run_coroutine(result)
+        except Exception as e:
+            logger.warning(f"Error when tearing down resource '{name}': {e}")
+
+    def reset_on_error(self, names: Set[str], error: BaseException) -> None:
+        """Dispose used resources configured to be reset for this error."""
+        for name in names:
+            resource = self._resources.get(name)
+            if resource and resource.reset_on and isinstance(error, resource.reset_on):
+                logger.info(f"Resetting resource '{name}' after error: {error!r}")
+                self.reset(name)
+
+    def teardown(self) -> None:
+        """Dispose all created resources."""
+        for name in list(self._resources):
+            self.reset(name)
+
+    def clear(self) -> None:
+        """Dispose all resources and unregister them."""
+        self.teardown()
+        self._resources.clear()
+
+    def _install_signal_handler(self) -> None:
+        if self._signal_installed:
+            return
+        if threading.current_thread() is not threading.main_thread():
+            return
+        previous = signal.getsignal(signal.SIGTERM)
+
+        def on_sigterm(signum: int, frame: Any) -> None:
+            logger.info("SIGTERM received. Tearing down lamina resources.")
+            self.teardown()
+            if callable(previous):
+                previous(signum, frame)
+            elif previous == signal.SIG_DFL:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                os.kill(os.getpid(), signal.SIGTERM)
+
+        signal.signal(signal.SIGTERM, on_sigterm)
+        self._signal_installed = True
+
+
+@dataclass
+class Resources:
+    """Per-request view of the registry, available as `request.resources`.
+
+    Tracks which resources the request used, so they can be reset if the
+    handler fails with one of their `reset_on` exceptions.
+    """
+
+    registry: ResourceRegistry
+    used: Set[str] = field(default_factory=set)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        self.used.add(name)
+        return self.registry.get(name)
+
+    def __getitem__(self, name: str) -> Any:
+        return self.__getattr__(name)
+
+    async def aget(self, name: str) -> Any:
+        self.used.add(name)
+        return await self.registry.aget(name)
+
+    def reset_on_error(self, error: BaseException) -> None:
+        self.registry.reset_on_error(self.used, error)
+
+
+registry = ResourceRegistry()
+
+
+def register(name: str, factory: Optional[Callable[[], Any]] = None, **kwargs: Any):
+    """Register a resource in the default registry."""
+    return registry.register(name, factory, **kwargs)
+
+
+def get(name: str) -> Any:
+    """Return a resource from the default registry."""
+    return registry.get(name)
+
+
+async def aget(name: str) -> Any:
+    """Return a resource from the default registry, awaiting async factories."""
+    return await registry.aget(name)
+
+
+def reset(name: str) -> None:
+    """Dispose a resource from the default registry."""
+    registry.reset(name)
+
+
+def teardown() -> None:
+    """Dispose all resources from the default registry."""
+    registry.teardown()
+
+
+def bind() -> Resources:
+    """Return a per-request view of the default registry."""
+    return Resources(registry=registry)
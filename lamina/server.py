@@ -0,0 +1,199 @@
+"""Multi-process HTTP server for local development and load tests.
+
+Uses only the standard library: each worker process runs a threaded HTTP
+server and one event loop, where handlers run as in the ASGI adapter. With
+more than one worker, the listening socket is bound by the parent process
+and shared by forked workers (prefork model).
+"""
+
+import asyncio
+import os
+import signal
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from loguru import logger
+
+from lamina import resources
+from lamina.errors import error_response
+from lamina.gateway import (
+    LocalContext,
+    Router,
+    build_event,
+    response_body_bytes,
+)
+
+
+class LaminaRequestHandler(BaseHTTPRequestHandler):
+    """Dispatch HTTP requests to lamina handlers through the server router."""
+
+    server: "LaminaHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def _dispatch(self) -> None:
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        route, path_parameters, allowed = self.server.router.match(
+            self.command, url.path
+        )
+        if route is None:
+            if allowed:
+                response = error_response(405, "Method not allowed.", constant=True)
+                response["headers"]["Allow"] = ", ".join(sorted(set(allowed)))
+            else:
+                response = error_response(404, "Not found.", constant=True)
+        else:
+            event = build_event(
+                method=self.command,
+                path=url.path,
+                query_string=url.query,
+                headers=self.headers.items(),
+                body=body,
+                path_parameters=path_parameters,
+                source_ip=self.client_address[0],
+            )
+            event["resource"] = route.path
+            response = self.server.invoke(route.handler, event)
+
+        content = response_body_bytes(response)
+        self.send_response(response["statusCode"])
+        for name, value in (response.get("headers") or {}).items():
+            if name.lower() != "content-length":
+                self.send_header(name, str(value))
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = do_OPTIONS = _dispatch
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class LaminaHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        router: Router,
+        timeout: Optional[float] = 30.0,
+        memory_limit_in_mb: int = 128,
+        bind_and_activate: bool = True,
+    ):
+        self.router = router
+        self.invocation_timeout = timeout
+        self.memory_limit_in_mb = memory_limit_in_mb
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        super().__init__(address, LaminaRequestHandler, bind_and_activate)
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop of the worker process, started on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever, name="lamina-loop", daemon=True
+                ).start()
+        return self._loop
+
+    def invoke(self, handler: Callable[..., Any], event: Dict[str, Any]) -> Any:
+        context = LocalContext(
+            timeout=self.invocation_timeout,
+            memory_limit_in_mb=self.memory_limit_in_mb,
+        )
+        future = asyncio.run_coroutine_threadsafe(
+            handler.aio(event, context, offload_sync=True), self.loop
+        )
+        return future.result()
+
+    def server_close(self) -> None:
+        super().server_close()
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+def _run_worker(server: LaminaHTTPServer) -> None:
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        resources.teardown()
+
+
+def serve(
+    handlers: List[Callable[..., Any]],
+    *,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1,
+    timeout: Optional[float] = 30.0,
+    memory_limit_in_mb: int = 128,
+) -> None:
+    """Serve lamina handlers over HTTP until interrupted.
+
+    Args:
+        handlers: Handlers to serve.
+        host: Interface to bind.
+        port: Port to bind.
+        workers: Number of worker processes. Values above 1 need `os.fork`.
+        timeout: Invocation timeout, in seconds, reported by the context.
+        memory_limit_in_mb: Memory limit reported by the context.
+    """
+    router = Router.from_handlers(handlers)
+    server = LaminaHTTPServer(
+        (host, port), router, timeout=timeout, memory_limit_in_mb=memory_limit_in_mb
+    )
+    for route in router.routes:
+        logger.info(f"{route.method} {route.path} -> {route.handler.import_path}")
+    logger.info(f"Serving on http://{host}:{server.server_port} ({workers} workers)")
+
+    if workers <= 1 or not hasattr(os, "fork"):
+        try:
+            _run_worker(server)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    children: List[int] = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the worker process
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+            try:
+                _run_worker(server)
+            finally:
+                os._exit(0)
+        children.append(pid)
+
+    def stop(signum: int, frame: Any) -> None:
+        for child in children:
+            try:
+                os.kill(child, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def wait() -> None:
+        for child in children:
+            try:
+                os.waitpid(child, 0)
+            except ChildProcessError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        wait()
+    except KeyboardInterrupt:
+        stop(signal.SIGINT, None)
+        wait()
+    finally:
+        server.server_close()
@@ -2,7 +2,7 @@ import ast
 import importlib
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple
 
 from loguru import logger
 
@@ -49,20 +49,8 @@ def _module_imports_lamina(py_file: Path) -> bool:
         return False
 
 
-def _import_project_modules() -> None:
-    """Import all modules from the user's project that import lamina.
-
-    Walks through the current working directory to find Python modules
-    that import lamina, then imports them to trigger decorator registration
-    in LAMINA_REGISTRY. Only imports modules that haven't been loaded yet.
-    """
-    global _modules_imported
-    if _modules_imported:
-        logger.debug("Already imported project modules")
-        return
-
-    project_root = Path.cwd()
-
+def iter_project_modules(project_root: Path) -> Iterator[Tuple[str, Path]]:
+    """Yield the module name and file of project modules that import lamina."""
     # Find all Python files in the project that import lamina
     for py_file in project_root.rglob("*.py"):
         # Skip __pycache__ and other non-module files
@@ -81,8 +69,22 @@ def _import_project_modules() -> None:
         if relative_path.stem == "__init__":
             continue
 
-        module_name = ".".join(module_parts)
+        yield ".".join(module_parts), py_file
 
+
+def _import_project_modules() -> None:
+    """Import all modules from the user's project that import lamina.
+
+    Walks through the current working directory to find Python modules
+    that import lamina, then imports them to trigger decorator registration
+    in LAMINA_REGISTRY. Only imports modules that haven't been loaded yet.
+    """
+    global _modules_imported
+    if _modules_imported:
+        logger.debug("Already imported project modules")
+        return
+
+    for module_name, _ in iter_project_modules(Path.cwd()):
         # Skip if already imported
         if module_name in sys.modules:
             logger.debug(f"{module_name} already imported.")
@@ -95,6 +97,28 @@ def _import_project_modules() -> None:
     _modules_imported = True
 
 
+def get_view_data() -> List[ViewData]:
+    """Return the view data of the handlers in the spec, sorted by path."""
+    # Import project modules that use lamina to populate LAMINA_REGISTRY
+    _import_project_modules()
+    # Same route conflict policy as the runtime router
+    LAMINA_REGISTRY.routes()
+
+    view_data = []
+    for wrapper in LAMINA_REGISTRY:
+        view = ViewData.from_wrapper(wrapper)
+
+        if view.request is None and view.response is None and view.params is None:
+            logger.warning(f"Skipping handler with no schemas: {view.import_path}")
+            continue
+
+        view_data.append(view)
+
+    # Sort List based on path
+    view_data.sort(key=lambda v: v.path)
+    return view_data
+
+
 def get_openapi_spec(
     *,
     title: str = "Lamina API",
@@ -112,53 +136,28 @@ def get_openapi_spec(
     external_docs: Optional[OpenAPIExternalDocumentationObject] = None,
     tags: Optional[OpenAPITagsObject] = None,
     extra_responses: Optional[Dict[str, ExtraResponsesDict]] = None,
+    workers: int = 1,
+    descriptions: Literal["full", "summary", "none"] = "full",
+    field_tables: Literal["all", "top", "none"] | None = None,
 ) -> OpenAPIObject:
-    """Generate an OpenAPI 3.1 specification from all lamina-decorated handlers."""
-
-    # Import project modules that use lamina to populate LAMINA_REGISTRY
-    _import_project_modules()
+    """Generate an OpenAPI 3.1 specification from all lamina-decorated handlers.
 
-    view_data = []
-    for wrapper in LAMINA_REGISTRY:
-        request_content_type = getattr(
-            wrapper, "request_content_type", "application/json"
-        )
-        response_content_type = getattr(
-            wrapper, "response_content_type", "application/json"
-        )
-
-        payload = {
-            "request": getattr(wrapper, "schema_in", None),
-            "response": getattr(wrapper, "schema_out", None),
-            "params": getattr(wrapper, "params_in", None),
-            "methods": getattr(wrapper, "methods", None),
-            "tags": getattr(wrapper, "tags", None),
-            "extra_responses": getattr(wrapper, "responses", {}) or {},
-            "view_docstring": getattr(wrapper, "__doc__", None),
-            "import_path": getattr(wrapper, "import_path", None),
-            "path": getattr(wrapper, "path", None),
-            "file_last_update": getattr(wrapper, "last_updated", None),
-            "accept_media_type": request_content_type,
-            "produce_media_type": response_content_type,
-        }
-
-        if (
-            payload["request"] is None
-            and payload["response"] is None
-            and payload["params"] is None
-        ):
-            logger.warning(
-                f"Skipping handler with no schemas: {payload['import_path']}"
-            )
-            continue
+    With `workers` above 1, the operations and schemas of each handler are
+    built in a process pool. The document is the same as a sequential build.
 
-        view = ViewData(**payload)
-        view_data.append(view)
+    `descriptions` and `field_tables` shrink large documents, see
+    `SwaggerGenerator`.
+    """
 
-    # Sort List based on path
-    view_data.sort(key=lambda v: v.get_path())
+    view_data = get_view_data()
 
-    gen = SwaggerGenerator(view_data=view_data, extra_responses=extra_responses or {})
+    gen = SwaggerGenerator(
+        view_data=view_data,
+        extra_responses=extra_responses or {},
+        workers=workers,
+        descriptions=descriptions,
+        field_tables=field_tables,
+    )
 
     return gen.generate(
         title=title,
@@ -0,0 +1,332 @@
+"""Build the OpenAPI document from the command line.
+
+Configured in pyproject.toml, all keys optional:
+
+    [tool.lamina.spec]
+    output = "openapi.json"      # .yaml/.yml outputs YAML (needs the spec extra)
+    minify = false
+    workers = 1
+    split_by_tag = false         # also write openapi.<tag>.json per tag
+    descriptions = "full"        # full, summary or none
+    field_tables = "all"         # all, top or none
+    title = "My API"
+    version = "1.0.0"
+    servers = [{url = "https://api.example.com"}]
+
+Other keys are passed to the generator (`summary`, `description`, `host`,
+`base_path`, `security_schemes`, `security`, `contact`, `license_info`,
+`terms_of_service`, `external_docs`, `tags`).
+
+`lamina spec build` writes the document once. `lamina spec watch` keeps the
+project modules and models loaded: when files change, it reloads their
+modules (and the modules using them) and only rebuilds the changed views.
+"""
+
+import filecmp
+import inspect
+import os
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from importlib import reload
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Literal, Set, TextIO, Tuple
+
+from caseconverter import kebabcase
+from loguru import logger
+
+from lamina.conf import get_toml_configuration
+from lamina.main import LAMINA_REGISTRY
+from lamina.openapi.generator import SwaggerGenerator, ViewFragment
+from lamina.openapi.output import split_by_tag, write_json
+from lamina.openapi.view_data import ViewData
+from lamina.spec import _import_project_modules, get_view_data
+
+SPEC_DEFAULTS = {"title": "Lamina API", "version": "1.0.0"}
+
+
+@dataclass
+class SpecConfig:
+    """Output settings and generator options of `lamina spec`.
+
+    Attributes:
+        output: Path of the document.
+        format: `json` or `yaml`. Defaults to the output extension.
+        minify: Write JSON without whitespace.
+        workers: Processes used to build the views.
+        split_by_tag: Also write one document per tag next to the output.
+        descriptions: Operation descriptions, see `SwaggerGenerator`.
+        field_tables: Field tables in descriptions, see `SwaggerGenerator`.
+        options: Keyword arguments of `SwaggerGenerator.generate`.
+    """
+
+    output: str = "openapi.json"
+    format: Literal["json", "yaml"] | None = None
+    minify: bool = False
+    workers: int = 1
+    split_by_tag: bool = False
+    descriptions: Literal["full", "summary", "none"] = "full"
+    field_tables: Literal["all", "top", "none"] | None = None
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.format is None:
+            self.format = "yaml" if self.output.endswith((".yaml", ".yml")) else "json"
+        if self.format not in ("json", "yaml"):
+            raise ValueError(f"Invalid spec format: {self.format}")
+        accepted = set(inspect.signature(SwaggerGenerator.generate).parameters)
+        unknown = set(self.options) - accepted
+        if unknown:
+            raise ValueError(f"Unknown spec options: {', '.join(sorted(unknown))}")
+
+    @classmethod
+    def from_pyproject(cls, **overrides: Any) -> "SpecConfig":
+        """Read `[tool.lamina.spec]`, with overrides from the command line."""
+        values = dict(get_toml_configuration().get("spec", {}))
+        values.update(
+            {key: value for key, value in overrides.items() if value is not None}
+        )
+        settings = {
+            name: values.pop(name)
+            for name in (
+                "output",
+                "format",
+                "minify",
+                "workers",
+                "split_by_tag",
+                "descriptions",
+                "field_tables",
+            )
+            if name in values
+        }
+        return cls(**settings, options=values)
+
+    @staticmethod
+    def dump_yaml(spec: Dict[str, Any]) -> bytes:
+        yaml = _import_yaml()
+        return yaml.safe_dump(spec, sort_keys=False, allow_unicode=True).encode()
+
+    def write(self, spec: Dict[str, Any], path: str | os.PathLike) -> bool:
+        """Write a document in the output format. Returns False if unchanged.
+
+        JSON is streamed to the file, without building the whole string.
+        """
+        if self.format == "yaml":
+            return write_atomic(path, self.dump_yaml(spec))
+        return write_atomic(
+            path, lambda file: write_json(spec, file, minify=self.minify)
+        )
+
+    def tag_output(self, tag: str) -> Path:
+        """Path of the document of a tag: `openapi.<tag>.json`."""
+        path = Path(self.output)
+        return path.with_name(f"{path.stem}.{kebabcase(tag) or 'tag'}{path.suffix}")
+
+
+def _import_yaml() -> Any:
+    try:
+        import yaml
+    except ImportError as error:
+        raise ImportError(
+            "YAML (.yaml/.yml) documents need PyYAML. "
+            "Install it with: pip install py-lamina[spec]"
+        ) from error
+    return yaml
+
+
+def write_atomic(
+    path: str | os.PathLike, data: bytes | Callable[[TextIO], None]
+) -> bool:
+    """Replace a file in one step, so readers never see a partial document.
+
+    Args:
+        path: Path of the file.
+        data: The content, or a function writing it to a text file.
+
+    Returns:
+        False if the file already had this content and was left untouched.
+    """
+    path = Path(path)
+    if isinstance(data, bytes):
+        try:
+            if path.read_bytes() == data:
+                return False
+        except FileNotFoundError:
+            pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        if isinstance(data, bytes):
+            file = os.fdopen(descriptor, "wb")
+        else:
+            file = os.fdopen(descriptor, "w", encoding="utf-8", newline="")
+        with file:
+            if isinstance(data, bytes):
+                file.write(data)
+            else:
+                data(file)
+            file.flush()
+            os.fsync(file.fileno())
+        if path.is_file() and filecmp.cmp(temp_path, path, shallow=False):
+            os.unlink(temp_path)
+            return False
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return True
+
+
+@dataclass
+class SpecBuilder:
+    """Build the document, reusing the fragments of unchanged views.
+
+    A view is unchanged if its models, docstring and file modification time
+    (`wrapper.last_updated`) are the same as in the previous build.
+    """
+
+    config: SpecConfig
+    fragment_cache: Dict[
+        Tuple[str | None, str | None], Tuple[ViewData, ViewFragment]
+    ] = field(default_factory=dict)
+
+    def build(self) -> bool:
+        """Build and write the document. Returns False if it didn't change."""
+        start = time.perf_counter()
+        cached = len(self.fragment_cache)
+        generator = SwaggerGenerator(
+            view_data=get_view_data(),
+            extra_responses={},
+            workers=self.config.workers,
+            descriptions=self.config.descriptions,
+            field_tables=self.config.field_tables,
+            fragment_cache=self.fragment_cache,
+        )
+        spec = generator.generate(**{**SPEC_DEFAULTS, **self.config.options})
+        written = self.config.write(spec, self.config.output)
+        if self.config.split_by_tag:
+            for tag, document in split_by_tag(spec).items():
+                written |= self.config.write(document, self.config.tag_output(tag))
+        elapsed = (time.perf_counter() - start) * 1000
+        logger.info(
+            f"{'Wrote' if written else 'Unchanged'} {self.config.output}: "
+            f"{len(generator.view_data)} views ({cached} cached) in {elapsed:.0f} ms"
+        )
+        return written
+
+
+def project_modules(root: Path | None = None) -> Dict[str, int]:
+    """Return the modification time (ns) of loaded modules under the root."""
+    root = (root or Path.cwd()).resolve()
+    mtimes: Dict[str, int] = {}
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, "__file__", None)
+        if not file or name.split(".")[0] == "lamina":
+            continue
+        try:
+            path = Path(file).resolve()
+            relative = path.relative_to(root)
+        except (OSError, ValueError):
+            continue
+        if any(p.startswith(".") or p == "site-packages" for p in relative.parts):
+            continue
+        try:
+            mtimes[name] = path.stat().st_mtime_ns
+        except OSError:
+            continue
+    return mtimes
+
+
+def _uses(module: ModuleType, names: Set[str]) -> bool:
+    for value in vars(module).values():
+        source = (
+            value.__name__
+            if isinstance(value, ModuleType)
+            else getattr(value, "__module__", None)
+        )
+        if isinstance(source, str) and source in names:
+            return True
+    return False
+
+
+def reload_modules(changed: Iterable[str], candidates: Iterable[str]) -> List[str]:
+    """Reload changed modules and the candidate modules using them.
+
+    Handlers of the reloaded modules are removed from LAMINA_REGISTRY, and
+    registered again by the reload.
+
+    Returns:
+        Names of the reloaded modules, in reload order.
+    """
+    names = set(changed)
+    candidates = [name for name in candidates if name in sys.modules]
+    grew = True
+    while grew:
+        grew = False
+        for name in candidates:
+            if name not in names and _uses(sys.modules[name], names):
+                names.add(name)
+                grew = True
+
+    # Reload modules after the modules they use (in any order for cycles)
+    ordered: List[str] = []
+    pending = [name for name in list(sys.modules) if name in names]
+    while pending:
+        ready = [
+            name
+            for name in pending
+            if not _uses(sys.modules[name], set(pending) - {name})
+        ] or pending[:1]
+        ordered.extend(ready)
+        pending = [name for name in pending if name not in ready]
+    LAMINA_REGISTRY[:] = [
+        wrapper
+        for wrapper in LAMINA_REGISTRY
+        if getattr(wrapper, "import_path", "").rpartition(".")[0] not in names
+    ]
+    for name in ordered:
+        reload(sys.modules[name])
+    return ordered
+
+
+def watch(
+    config: SpecConfig,
+    interval: float = 1.0,
+    stop: threading.Event | None = None,
+) -> None:
+    """Build the document, then rebuild it when project files change.
+
+    New modules are picked up when imported by a changed module, or on
+    restart.
+
+    Args:
+        config: Output settings and generator options.
+        interval: Seconds between checks for changed files.
+        stop: Event to stop watching. Defaults to running until interrupted.
+    """
+    stop = stop or threading.Event()
+    builder = SpecBuilder(config)
+    _import_project_modules()
+    # Taken before building, so changes made during a build are not missed
+    mtimes = project_modules()
+    builder.build()
+    while not stop.wait(interval):
+        current = project_modules()
+        changed = [
+            name
+            for name, mtime in current.items()
+            if name in mtimes and mtimes[name] != mtime
+        ]
+        mtimes = current
+        if not changed:
+            continue
+        logger.info(f"Changed: {', '.join(changed)}")
+        try:
+            reload_modules(changed, current)
+            builder.build()
+        except Exception:
+            logger.exception("Could not rebuild the OpenAPI document")
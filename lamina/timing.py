@@ -0,0 +1,42 @@
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from lamina.memory import MemoryTracker
+
+
+@dataclass
+class PhaseTimer:
+    """Record the elapsed time of each phase of a lamina invocation.
+
+    Each call to `lap` stores, in milliseconds, the time elapsed since the
+    previous lap (or since the timer was created) under the phase name.
+
+    Attributes:
+        timings: Elapsed milliseconds per phase, in execution order.
+        memory: Optional tracker recording the memory used by each phase.
+    """
+
+    timings: Dict[str, float] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.perf_counter)
+    memory: Optional[MemoryTracker] = None
+    _last: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._last = self.started_at
+
+    def lap(self, phase: str) -> float:
+        """Close the current phase and return its duration in milliseconds."""
+        now = time.perf_counter()
+        elapsed = round((now - self._last) * 1000, 3)
+        self.timings[phase] = self.timings.get(phase, 0.0) + elapsed
+        if self.memory is not None:
+            self.memory.lap(phase)
+            # Do not count the tracking overhead in the next phase
+            now = time.perf_counter()
+        self._last = now
+        return elapsed
+
+    @property
+    def total(self) -> float:
+        return round((time.perf_counter() - self.started_at) * 1000, 3)
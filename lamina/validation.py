@@ -0,0 +1,243 @@
+"""Validation policies for handler input and output.
+
+Each direction (`input` for `schema_in`, `output` for `schema_out`) runs in
+one of these modes:
+
+* `full`: Pydantic validation, as plain `schema(**data)` (the default).
+* `strict`: Pydantic strict mode, no type coercion. JSON bodies are
+  validated from the JSON text, so ISO dates and UUID strings still parse.
+* `sampled`: a fraction (`sample_rate`) of the calls is validated; the rest
+  are trusted. Sampled failures are logged as drift and counted, and the
+  data is trusted instead of rejected: sampling monitors, it doesn't enforce.
+* `trusted`: models are built with `model_construct`, without validation.
+  For trusted callers (e.g. Step Functions) or outputs known to be correct.
+
+Handler outputs that already are `schema_out` instances are never validated
+again.
+"""
+
+import json
+import random
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Literal, Tuple, Type, TypedDict, TypeVar
+
+from loguru import logger
+from pydantic import BaseModel, RootModel, ValidationError
+
+from lamina import conf
+
+Direction = Literal["input", "output"]
+ValidationMode = Literal["full", "strict", "sampled", "trusted"]
+
+VALIDATION_MODES = ("full", "strict", "sampled", "trusted")
+OUTCOMES = ("validated", "skipped", "failed", "drift")
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+class ValidationStats(TypedDict):
+    input: Dict[str, int]
+    output: Dict[str, int]
+
+
+@dataclass
+class ValidationPolicy:
+    """Validation modes of a handler input and output, with outcome counters.
+
+    Attributes:
+        input: Mode for `schema_in`. Defaults to `LAMINA_INPUT_VALIDATION`.
+        output: Mode for `schema_out`. Defaults to `LAMINA_OUTPUT_VALIDATION`.
+        sample_rate: Fraction of `sampled` calls validated, from 0 to 1.
+            Defaults to `LAMINA_VALIDATION_SAMPLE_RATE`.
+    """
+
+    input: ValidationMode | None = None
+    output: ValidationMode | None = None
+    sample_rate: float | None = None
+    _counters: Dict[Tuple[str, str], int] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        for mode in (self.input, self.output):
+            if mode is not None and mode not in VALIDATION_MODES:
+                raise ValueError(
+                    f"Invalid validation mode: {mode}. "
+                    f"Expected one of: {', '.join(VALIDATION_MODES)}."
+                )
+
+    def mode(self, direction: Direction) -> ValidationMode:
+        """Return the mode of a direction, falling back to the settings."""
+        mode = getattr(self, direction) or (
+            conf.LAMINA_INPUT_VALIDATION
+            if direction == "input"
+            else conf.LAMINA_OUTPUT_VALIDATION
+        )
+        if mode not in VALIDATION_MODES:
+            raise ValueError(
+                f"Invalid value for LAMINA_{direction.upper()}_VALIDATION. "
+                f"Expected one of: {', '.join(VALIDATION_MODES)}."
+            )
+        return mode
+
+    def load(
+        self,
+        direction: Direction,
+        schema: Type[Model],
+        value: Any,
+        *,
+        unpack: bool | None = None,
+        json_text: str | bytes | None = None,
+    ) -> Model:
+        """Build a model from a handler value, validating it per the mode.
+
+        Args:
+            direction: `input` or `output`.
+            schema: The model.
+            value: The decoded value.
+            unpack: Pass the value as keyword arguments (`schema(**value)`)
+                instead of as the root. Defaults to True for `BaseModel`.
+            json_text: The JSON text of the value, used by `strict` mode.
+
+        Raises:
+            ValidationError: The value is invalid in `full` or `strict` mode.
+            TypeError: The value must be unpacked and is not a mapping.
+        """
+        return self._load(direction, schema, value, unpack, json_text)[0]
+
+    def load_json(
+        self, direction: Direction, schema: Type[Model], json_text: str | bytes
+    ) -> Model:
+        """Build a `BaseModel` from JSON text, validating it per the mode."""
+        if self.mode(direction) == "full":
+            return self._count(direction, schema.model_validate_json, json_text)
+        return self.load(direction, schema, json.loads(json_text), json_text=json_text)
+
+    def dump_json(
+        self,
+        schema: Type[BaseModel],
+        response: Any,
+        include: Dict[str, Any] | None = None,
+        exclude: Dict[str, Any] | None = None,
+    ) -> Any:
+        """Return the JSON body of a handler response, per the output mode.
+
+        RootModel responses with a `None` root are returned as they are, and
+        with a string root as the string. `include` and `exclude` are Pydantic
+        field trees, see `lamina.fieldsets`.
+        """
+        model, validated = self._load("output", schema, response, None, None)
+        if isinstance(model, RootModel):
+            if model.root is None:
+                return response
+            if isinstance(model.root, str):
+                return model.root
+        # Trusted models may hold plain dicts for nested models
+        return model.model_dump_json(
+            by_alias=True, warnings=validated, include=include, exclude=exclude
+        )
+
+    def stats(self) -> ValidationStats:
+        """Return the outcome counters of each direction."""
+        with self._lock:
+            return {
+                direction: {
+                    outcome: self._counters.get((direction, outcome), 0)
+                    for outcome in OUTCOMES
+                }
+                for direction in ("input", "output")
+            }  # type: ignore[return-value]
+
+    def reset(self) -> None:
+        """Reset the outcome counters."""
+        with self._lock:
+            self._counters.clear()
+
+    def _load(
+        self,
+        direction: Direction,
+        schema: Type[Model],
+        value: Any,
+        unpack: bool | None,
+        json_text: str | bytes | None,
+    ) -> Tuple[Model, bool]:
+        """Build the model. Returns it, and whether it was validated."""
+        if isinstance(value, schema):
+            self._increment(direction, "skipped")
+            return value, True
+        if unpack is None:
+            unpack = not issubclass(schema, RootModel)
+
+        mode = self.mode(direction)
+        if mode == "sampled":
+            rate = (
+                conf.LAMINA_VALIDATION_SAMPLE_RATE
+                if self.sample_rate is None
+                else self.sample_rate
+            )
+            if random.random() >= rate:  # nosec
+                mode = "trusted"
+            else:
+                try:
+                    model = _validate(schema, value, unpack)
+                except ValidationError as e:
+                    self._increment(direction, "drift")
+                    logger.warning(
+                        f"Validation drift in {direction} of {schema.__name__} "
+                        f"({e.error_count()} errors): {e.errors(include_input=False)}"
+                    )
+                    return _construct(schema, value, unpack), False
+                self._increment(direction, "validated")
+                return model, True
+
+        if mode == "trusted":
+            model = _construct(schema, value, unpack)
+            self._increment(direction, "skipped")
+            return model, False
+        if mode == "strict":
+            if json_text is not None:
+                return (
+                    self._count(
+                        direction, schema.model_validate_json, json_text, strict=True
+                    ),
+                    True,
+                )
+            data = dict(**value) if unpack else value
+            return (
+                self._count(direction, schema.model_validate, data, strict=True),
+                True,
+            )
+        return self._count(direction, _validate, schema, value, unpack), True
+
+    def _count(
+        self, direction: Direction, validate: Callable[..., Model], *args, **kwargs
+    ) -> Model:
+        try:
+            model = validate(*args, **kwargs)
+        except ValidationError:
+            self._increment(direction, "failed")
+            raise
+        self._increment(direction, "validated")
+        return model
+
+    def _increment(self, direction: Direction, outcome: str) -> None:
+        with self._lock:
+            key = (direction, outcome)
+            self._counters[key] = self._counters.get(key, 0) + 1
+
+
+def _validate(schema: Type[Model], value: Any, unpack: bool) -> Model:
+    return schema(**value) if unpack else schema(value)
+
+
+def _construct(schema: Type[Model], value: Any, unpack: bool) -> Model:
+    if unpack:
+        # Same TypeError as `schema(**value)` for values that are not mappings
+        value = dict(**value)
+    if issubclass(schema, RootModel):
+        return schema.model_construct(value)
+    return schema.model_construct(**value)
@@ -0,0 +1,101 @@
+"""Warm-up helpers for provisioned concurrency, SnapStart and warm-up pings.
+
+Example:
+    # handlers.py
+    import lamina
+
+    @lamina.lamina(schema_in=Input, schema_out=Output)
+    def handler(request):
+        ...
+
+    # At module level, after the handlers: runs once, at init time
+    lamina.warmup()
+"""
+
+import json
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import magic
+from loguru import logger
+from pydantic import BaseModel
+
+from lamina import conf
+from lamina.helpers import DecimalEncoder, get_executor, run_coroutine
+from lamina.timing import PhaseTimer
+
+WARMUP_SOURCES = ("serverless-plugin-warmup", "lamina.warmup")
+
+
+def is_warmup_event(event: Any) -> bool:
+    """Check if the event is a warm-up ping.
+
+    Recognizes `{"warmup": true}` and events with `source` set to
+    `serverless-plugin-warmup` or `lamina.warmup`.
+    """
+    return isinstance(event, dict) and (
+        event.get("warmup") is True or event.get("source") in WARMUP_SOURCES
+    )
+
+
+def _warm_schema(schema: Optional[type]) -> None:
+    if not (isinstance(schema, type) and issubclass(schema, BaseModel)):
+        return
+    # Builds deferred models; validator and serializer are then ready
+    schema.model_rebuild()
+    _ = schema.__pydantic_validator__, schema.__pydantic_serializer__
+
+
+def warm_handler(wrapper: Callable[..., Any]) -> None:
+    """Compile the schemas of a lamina handler."""
+    for attribute in ("schema_in", "schema_out", "params_in"):
+        _warm_schema(getattr(wrapper, attribute, None))
+
+
+def warmup(handlers: Optional[Iterable[Callable[..., Any]]] = None) -> Dict[str, float]:
+    """Run first-request initialization costs ahead of time.
+
+    Resolves the hooks, compiles the handler schemas, loads the libmagic
+    database, and creates the event loop and thread pool used by the
+    execution pipeline.
+
+    Args:
+        handlers: Handlers to warm. Defaults to all registered handlers.
+
+    Returns:
+        Elapsed milliseconds of each warm-up step.
+    """
+    from lamina.main import LAMINA_REGISTRY
+
+    timer = PhaseTimer()
+    for name in (
+        "LAMINA_PRE_PARSE_CALLBACK",
+        "LAMINA_PRE_EXECUTE_CALLBACK",
+        "LAMINA_POS_EXECUTE_CALLBACK",
+        "LAMINA_PRE_RESPONSE_CALLBACK",
+    ):
+        getattr(conf, name)
+    timer.lap("hooks")
+
+    for wrapper in LAMINA_REGISTRY if handlers is None else handlers:
+        warm_handler(wrapper)
+    timer.lap("schemas")
+
+    if handlers is None:
+        # Index the routes, applying LAMINA_ROUTE_CONFLICTS
+        LAMINA_REGISTRY.routes()
+        timer.lap("routes")
+
+    magic.from_buffer(json.dumps({"warmup": True}, cls=DecimalEncoder), mime=True)
+    timer.lap("magic")
+
+    run_coroutine(_noop())
+    if conf.LAMINA_OFFLOAD_SYNC:
+        get_executor()
+    timer.lap("runtime")
+
+    logger.debug(f"Warm-up timings (ms): {timer.timings}")
+    return timer.timings
+
+
+async def _noop() -> None:
+    return None
@@ -0,0 +1,43 @@
+from typing import Any, Callable
+
+import pytest
+
+import lamina.main as lamina_main
+from lamina import Request, lamina
+
+
+@pytest.fixture
+def clear_registry():
+    """Empty LAMINA_REGISTRY before and after the test."""
+    lamina_main.LAMINA_REGISTRY.clear()
+    yield lamina_main.LAMINA_REGISTRY
+    lamina_main.LAMINA_REGISTRY.clear()
+
+
+@pytest.fixture
+def make_handler(clear_registry) -> Callable[..., Any]:
+    """Return a factory of lamina handlers, registered in LAMINA_REGISTRY.
+
+    Handlers share one import path, so they are told apart by their path.
+    Keyword arguments are passed to the `lamina` decorator.
+
+    Args:
+        path: Path of the handler.
+        doc: Docstring of the handler.
+        returns: Value returned by the handler.
+    """
+
+    def make(
+        path: str | None = None,
+        *,
+        doc: str | None = None,
+        returns: Any = None,
+        **options: Any,
+    ) -> Callable[..., Any]:
+        def handler(request: Request):
+            return returns
+
+        handler.__doc__ = doc
+        return lamina(path=path, **options)(handler)
+
+    return make
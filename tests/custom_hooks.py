@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from typing import Any, Dict, Optional, Union
 
 # Helper hooks used by unit tests. They are referenced via environment variables
@@ -54,3 +55,37 @@ def pre_response_add_key(body: Any) -> Any:
         except Exception:
             return body
     return body
+
+
+def pre_execute_thread_name(
+    request: Any,
+    event: Union[Dict[str, Any], bytes, str],
+    context: Optional[Dict[str, Any]],
+) -> Any:
+    """Store the name of the thread running the hook in the request data."""
+
+    request.data = threading.current_thread().name
+    return request
+
+
+PRE_EXECUTE_CALLS: list[Any] = []
+
+
+def pre_execute_record(
+    request: Any,
+    event: Union[Dict[str, Any], bytes, str],
+    context: Optional[Dict[str, Any]],
+) -> Any:
+    """Record the Authorization header of each request reaching the hook."""
+
+    PRE_EXECUTE_CALLS.append(request.headers.get("Authorization"))
+    return request
+
+
+async def pre_parse_async(
+    event: Union[Dict[str, Any], bytes, str],
+    context: Optional[Dict[str, Any]],
+) -> Union[Dict[str, Any], bytes, str]:
+    """Async pre-parse hook, so the pipeline runs in the event loop."""
+
+    return event
@@ -0,0 +1,218 @@
+import asyncio
+import base64
+import json
+import threading
+
+import pytest
+from pydantic import BaseModel
+
+from lamina import Request, lamina, resources
+from lamina.asgi import App
+from lamina.gateway import Router, build_event
+
+
+class ItemIn(BaseModel):
+    name: str
+
+
+async def call_app(app, method, path, body=b"", query_string=b"", headers=()):
+    messages = []
+    request = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        return request.pop(0)
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query_string,
+        "headers": [(k.encode(), v.encode()) for k, v in headers],
+    }
+    await app(scope, receive, send)
+    start = messages[0]
+    content = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], dict(start["headers"]), content
+
+
+@pytest.fixture
+def app():
+    @lamina(path="/items", methods=["post"], schema_in=ItemIn)
+    async def create_item(request: Request):
+        return {"name": request.data.name}, 201
+
+    @lamina(path="/items/{item_id}", methods=["get"])
+    def get_item(request: Request):
+        return {
+            "id": request.event["pathParameters"]["item_id"],
+            "thread": threading.current_thread().name,
+            "q": request.event["queryStringParameters"],
+        }
+
+    @lamina(path="/items/latest", methods=["get"])
+    def get_latest(request: Request):
+        return {"id": "latest"}
+
+    @lamina(path="/files", methods=["post"], schema_in=None)
+    def upload(request: Request):
+        return {
+            "body": request.event["body"],
+            "base64": request.event["isBase64Encoded"],
+        }
+
+    return App(handlers=[create_item, get_item, get_latest, upload])
+
+
+async def test_async_handler_runs_on_server_loop(app):
+    # Act
+    status, headers, body = await call_app(
+        app,
+        "POST",
+        "/items",
+        body=b'{"name": "lamina"}',
+        headers=[("Content-Type", "application/json")],
+    )
+
+    # Assert
+    assert status == 201
+    assert json.loads(body) == {"name": "lamina"}
+    assert headers[b"content-type"] == b"application/json; charset=utf-8"
+    assert headers[b"content-length"] == str(len(body)).encode()
+
+
+async def test_path_parameters_and_sync_offload(app):
+    # Act
+    status, _, body = await call_app(app, "GET", "/items/42", query_string=b"a=1")
+    data = json.loads(body)
+
+    # Assert
+    assert status == 200
+    assert data["id"] == "42"
+    assert data["q"] == {"a": "1"}
+    assert data["thread"].startswith("lamina")
+
+
+async def test_static_route_wins_over_parameter(app):
+    # Act
+    _, _, body = await call_app(app, "GET", "/items/latest")
+
+    # Assert
+    assert json.loads(body) == {"id": "latest"}
+
+
+async def test_unknown_route_and_method(app):
+    # Act
+    not_found = await call_app(app, "GET", "/missing")
+    not_allowed = await call_app(app, "DELETE", "/items")
+
+    # Assert
+    assert not_found[0] == 404
+    assert not_allowed[0] == 405
+    assert not_allowed[1][b"allow"] == b"POST"
+
+
+async def test_binary_request_body_is_base64_encoded(app):
+    # Act
+    _, _, body = await call_app(app, "POST", "/files", body=b"\xff\xfe")
+    data = json.loads(body)
+
+    # Assert
+    assert data["base64"] is True
+    assert base64.b64decode(data["body"]) == b"\xff\xfe"
+
+
+async def test_lifespan_shutdown_tears_down_resources(app):
+    # Arrange
+    disposed = []
+    resources.register("client", lambda: "client", teardown=disposed.append)
+    resources.get("client")
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    # Act
+    try:
+        await app({"type": "lifespan"}, receive, send)
+    finally:
+        resources.registry.clear()
+
+    # Assert
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert disposed == ["client"]
+
+
+async def test_chunked_body_and_other_scopes(app):
+    # Arrange
+    chunks = [
+        {"type": "http.request", "body": b'{"na', "more_body": True},
+        {"type": "http.request", "body": b'me": "chunked"}', "more_body": False},
+    ]
+    websocket = [{"type": "websocket.connect"}]
+    sent = []
+
+    async def receive():
+        return (chunks or websocket).pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "path": "/items", "headers": []}
+
+    # Act
+    await app(scope, receive, send)
+    await app({"type": "websocket", "path": "/items"}, receive, send)
+    await app({"type": "unknown"}, receive, send)
+
+    # Assert
+    assert sent[0]["status"] == 201
+    assert json.loads(sent[1]["body"]) == {"name": "chunked"}
+    assert sent[-1] == {"type": "websocket.close", "code": 1003}
+    assert len(sent) == 3
+
+
+async def test_concurrent_requests_share_the_loop(app):
+    # Arrange
+    @lamina(path="/slow", methods=["get"])
+    async def slow(request: Request):
+        await asyncio.sleep(0.1)
+        return {"ok": True}
+
+    slow_app = App(handlers=[slow])
+
+    # Act
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    results = await asyncio.gather(
+        *(call_app(slow_app, "GET", "/slow") for _ in range(10))
+    )
+    elapsed = loop.time() - start
+
+    # Assert
+    assert [status for status, _, _ in results] == [200] * 10
+    assert elapsed < 0.5
+
+
+def test_build_event_and_router():
+    # Arrange
+    event = build_event(
+        method="get",
+        path="/a/1",
+        query_string="x=1&x=2",
+        headers=[("Accept", "application/json")],
+    )
+    router = Router.from_handlers([])
+
+    # Assert
+    assert event["httpMethod"] == "GET"
+    assert event["queryStringParameters"] == {"x": "2"}
+    assert event["multiValueQueryStringParameters"] == {"x": ["1", "2"]}
+    assert event["body"] is None
+    assert router.match("GET", "/a/1") == (None, {}, [])
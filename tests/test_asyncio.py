@@ -1,5 +1,11 @@
+import asyncio
+import json
+import threading
 import time
 
+import pytest
+
+from lamina import Request, lamina
 from lamina.helpers import async_
 
 
@@ -18,3 +24,103 @@ async def test_async_decorator():
 
     # Assert
     assert result == 200
+
+
+@pytest.mark.parametrize("pre_parse", [None, "tests.custom_hooks:pre_parse_async"])
+def test_sync_pipeline_runs_without_event_loop(monkeypatch, pre_parse):
+    # Arrange
+    if pre_parse:
+        # Async hooks run the pipeline in the loop, the handler in the pool
+        monkeypatch.setenv("LAMINA_PRE_PARSE_CALLBACK", pre_parse)
+
+    @lamina()
+    def handler(request: Request):
+        # Sync handlers can still start their own event loop
+        return asyncio.run(asyncio.sleep(0, result={"ok": True}))
+
+    # Act
+    response = handler({"body": "{}"}, None)
+
+    # Assert
+    assert json.loads(response["body"]) == {"ok": True}
+
+
+def test_event_loop_is_reused_between_invocations():
+    # Arrange
+    @lamina()
+    async def handler(request: Request):
+        return {"loop": id(asyncio.get_running_loop())}
+
+    # Act
+    first = handler({"body": "{}"}, None)
+    second = handler({"body": "{}"}, None)
+
+    # Assert
+    assert first["body"] == second["body"]
+
+
+def test_offload_sync_handler_to_thread_pool():
+    # Arrange
+    @lamina(offload_sync=True)
+    def handler(request: Request):
+        return {"thread": threading.current_thread().name}
+
+    # Act
+    response = handler({"body": "{}"}, None)
+
+    # Assert
+    assert json.loads(response["body"])["thread"].startswith("lamina")
+
+
+def test_offload_sync_hooks_from_settings(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("LAMINA_OFFLOAD_SYNC", "true")
+    monkeypatch.setenv(
+        "LAMINA_PRE_EXECUTE_CALLBACK", "tests.custom_hooks:pre_execute_thread_name"
+    )
+
+    @lamina()
+    async def handler(request: Request):
+        return {"hook_thread": request.data}
+
+    # Act
+    response = handler({"body": "{}"}, None)
+
+    # Assert
+    assert json.loads(response["body"])["hook_thread"].startswith("lamina")
+
+
+def test_offloaded_sync_handler_respects_deadline(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("LAMINA_DEADLINE_SAFETY_MARGIN_MS", "0")
+
+    class Context:
+        def get_remaining_time_in_millis(self):
+            return 100
+
+    @lamina(offload_sync=True)
+    def handler(request: Request):
+        time.sleep(0.5)
+        return {"ok": True}
+
+    # Act
+    start = time.perf_counter()
+    response = handler({"body": "{}"}, Context())
+
+    # Assert
+    assert response["statusCode"] == 504
+    assert time.perf_counter() - start < 0.4
+
+
+async def test_aio_runs_in_running_loop():
+    # Arrange
+    @lamina()
+    async def handler(request: Request):
+        await asyncio.sleep(0)
+        return {"ok": True}
+
+    # Act
+    response = await handler.aio({"body": "{}"}, None)
+
+    # Assert
+    assert json.loads(response["body"]) == {"ok": True}
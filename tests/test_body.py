@@ -0,0 +1,143 @@
+import base64
+import io
+import json
+
+import pytest
+from pydantic import BaseModel, RootModel
+
+from lamina import Request, lamina
+from lamina.helpers import get_body_size
+
+
+class Upload(RootModel[bytes]):
+    pass
+
+
+class Item(BaseModel):
+    name: str
+
+
+def base64_event(data: bytes) -> dict:
+    return {"body": base64.b64encode(data).decode(), "isBase64Encoded": True}
+
+
+def test_body_over_limit_returns_413():
+    # Arrange
+    calls = []
+
+    @lamina(max_body_bytes=10)
+    def handler(request: Request):
+        calls.append(1)
+        return {}
+
+    # Act
+    text = handler({"body": json.dumps({"name": "a" * 20})}, None)
+    binary = handler(base64_event(b"x" * 11), None)
+    allowed = handler(base64_event(b"x" * 10), None)
+
+    # Assert
+    assert text["statusCode"] == 413
+    assert binary["statusCode"] == 413
+    assert json.loads(text["body"]) == {"detail": "Request body too large."}
+    assert allowed["statusCode"] == 200
+    assert calls == [1]
+
+
+def test_body_limit_from_settings(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("LAMINA_MAX_BODY_BYTES", "4")
+
+    @lamina()
+    def handler(request: Request):
+        return {}
+
+    # Act
+    response = handler({"body": "ção"}, None)
+
+    # Assert
+    assert response["statusCode"] == 413
+
+
+def test_base64_body_is_decoded_to_bytes():
+    # Arrange
+    @lamina(schema_in=Upload)
+    def upload(request: Request):
+        return {
+            "size": len(request.data.root),
+            "type": type(request.data.root).__name__,
+        }
+
+    @lamina(decode_base64_body=True)
+    def raw(request: Request):
+        return {"data": request.data.decode()}
+
+    # Act
+    uploaded = upload(base64_event(b"\x00\xff" * 100), None)
+    received = raw(base64_event(b"lamina"), None)
+
+    # Assert
+    assert json.loads(uploaded["body"]) == {"size": 200, "type": "bytes"}
+    assert json.loads(received["body"]) == {"data": "lamina"}
+
+
+def test_base64_body_without_schema_stays_encoded_by_default(monkeypatch):
+    # Arrange
+    @lamina()
+    def raw(request: Request):
+        return {"type": type(request.data).__name__, "size": len(request.data)}
+
+    # Act
+    encoded = raw(base64_event(b"lamina"), None)
+    monkeypatch.setenv("LAMINA_DECODE_BASE64_BODY", "true")
+    decoded = raw(base64_event(b"lamina"), None)
+
+    # Assert
+    assert json.loads(encoded["body"]) == {"type": "str", "size": 8}
+    assert json.loads(decoded["body"]) == {"type": "bytes", "size": 6}
+
+
+def test_body_size_of_non_ascii_text():
+    # Arrange
+    text = "ção" * 30_000
+
+    # Act / Assert
+    assert get_body_size(text) == len(text.encode("utf-8"))
+    assert get_body_size(text, limit=len(text) * 4) == len(text)
+    assert get_body_size(text, limit=len(text)) == len(text.encode("utf-8"))
+
+
+def test_base64_json_body_is_validated():
+    # Arrange
+    @lamina(schema_in=Item)
+    def handler(request: Request):
+        return {"name": request.data.name}
+
+    # Act
+    valid = handler(base64_event(b'{"name": "lamina"}'), None)
+    invalid = handler(base64_event(b'{"other": 1}'), None)
+
+    # Assert
+    assert json.loads(valid["body"]) == {"name": "lamina"}
+    assert invalid["statusCode"] == 422
+
+
+def test_stream_body():
+    # Arrange
+    @lamina(stream_body=True)
+    def handler(request: Request):
+        assert isinstance(request.data, io.BytesIO)
+        return {"first": request.data.read(3).decode()}
+
+    # Act
+    binary = handler(base64_event(b"lamina"), None)
+    text = handler({"body": "lamina"}, None)
+
+    # Assert
+    assert json.loads(binary["body"]) == {"first": "lam"}
+    assert json.loads(text["body"]) == {"first": "lam"}
+
+
+def test_stream_body_requires_no_schema():
+    # Act / Assert
+    with pytest.raises(ValueError):
+        lamina(schema_in=Item, stream_body=True)
@@ -0,0 +1,178 @@
+import json
+import time
+from typing import Any, Dict
+
+import pytest
+from pydantic import BaseModel
+
+from lamina import Request, lamina
+from lamina.cache import ResponseCache
+
+
+class ParamsIn(BaseModel):
+    page: int = 1
+
+
+def _get_event(page: int = 1, **headers: str) -> Dict[str, Any]:
+    return {
+        "httpMethod": "GET",
+        "path": "/items",
+        "headers": headers,
+        "queryStringParameters": {"page": str(page)},
+        "body": None,
+    }
+
+
+def test_cache_hit_skips_handler():
+    # Arrange
+    calls = []
+
+    @lamina(params_in=ParamsIn, methods=["GET"], cache=True)
+    def handler(request: Request):
+        calls.append(request.query.page)
+        return {"page": request.query.page}
+
+    # Act
+    first = handler(_get_event(page=1), None)
+    second = handler(_get_event(page=1), None)
+    third = handler(_get_event(page=2), None)
+
+    # Assert
+    assert calls == [1, 2]
+    assert first == second
+    assert json.loads(third["body"]) == {"page": 2}
+    assert handler.cache.stats()["hits"] == 1
+    assert handler.cache.stats()["misses"] == 2
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        {**_get_event(), "httpMethod": "POST"},
+        {"body": '{"foo": "bar"}'},
+    ],
+)
+def test_cache_ignores_non_cacheable_requests(event):
+    # Arrange
+    calls = []
+
+    @lamina(cache=True)
+    def handler(request: Request):
+        calls.append(1)
+        return {"ok": True}
+
+    # Act
+    handler(event, None)
+    handler(event, None)
+
+    # Assert
+    assert len(calls) == 2
+    assert handler.cache.stats()["entries"] == 0
+
+
+def test_cache_vary_headers_and_errors():
+    # Arrange
+    calls = []
+
+    @lamina(cache=ResponseCache(vary_headers=["Accept-Language"]))
+    def handler(request: Request):
+        calls.append(1)
+        if request.headers.get("accept-language") == "xx":
+            return {"error": True}, 404
+        return {"ok": True}
+
+    # Act
+    handler(_get_event(**{"Accept-Language": "en"}), None)
+    handler(_get_event(**{"accept-language": "en"}), None)
+    handler(_get_event(**{"accept-language": "xx"}), None)
+    handler(_get_event(**{"accept-language": "xx"}), None)
+
+    # Assert
+    assert len(calls) == 3
+
+
+def test_cache_key_uses_raw_query_without_params_in():
+    # Arrange
+    @lamina(methods=["GET"], cache=True)
+    def handler(request: Request):
+        return {"q": request.event["queryStringParameters"]["q"]}
+
+    def event(q: str) -> Dict[str, Any]:
+        return {**_get_event(), "queryStringParameters": {"q": q}}
+
+    # Act
+    first = handler(event("a"), None)
+    second = handler(event("b"), None)
+    third = handler(event("a"), None)
+
+    # Assert
+    assert json.loads(first["body"]) == {"q": "a"}
+    assert json.loads(second["body"]) == {"q": "b"}
+    assert handler.cache.stats()["hits"] == 1
+    assert third["body"] == first["body"]
+
+
+def test_cache_hits_run_pre_execute_and_vary_on_authorization(monkeypatch):
+    # Arrange
+    from tests import custom_hooks
+
+    custom_hooks.PRE_EXECUTE_CALLS.clear()
+    monkeypatch.setenv(
+        "LAMINA_PRE_EXECUTE_CALLBACK", "tests.custom_hooks:pre_execute_record"
+    )
+    calls = []
+
+    @lamina(params_in=ParamsIn, methods=["GET"], cache=True)
+    def handler(request: Request):
+        calls.append(request.headers["Authorization"])
+        return {"user": request.headers["Authorization"]}
+
+    # Act
+    first = handler(_get_event(Authorization="alice"), None)
+    second = handler(_get_event(Authorization="bob"), None)
+    third = handler(_get_event(Authorization="alice"), None)
+
+    # Assert
+    assert json.loads(first["body"]) == {"user": "alice"}
+    assert json.loads(second["body"]) == {"user": "bob"}
+    assert third["body"] == first["body"]
+    assert calls == ["alice", "bob"]
+    assert custom_hooks.PRE_EXECUTE_CALLS == ["alice", "bob", "alice"]
+
+
+def test_cache_ttl_and_lru_bounds(monkeypatch):
+    # Arrange
+    cache = ResponseCache(ttl=10, max_entries=2)
+    response = {"statusCode": 200, "headers": {}, "body": "ok"}
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+
+    # Act
+    cache.set(("GET", "/a", "", ()), response)
+    cache.set(("GET", "/b", "", ()), response)
+    cache.get(("GET", "/a", "", ()))
+    cache.set(("GET", "/c", "", ()), response)
+    evicted = cache.get(("GET", "/b", "", ()))
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    expired = cache.get(("GET", "/a", "", ()))
+
+    # Assert
+    assert evicted is None
+    assert expired is None
+    assert cache.stats()["entries"] == 1
+
+
+def test_cache_memory_cap():
+    # Arrange
+    cache = ResponseCache(max_bytes=1024)
+    response = {"statusCode": 200, "headers": {}, "body": "x" * 600}
+
+    # Act
+    cache.set(("GET", "/a", "", ()), response)
+    cache.set(("GET", "/b", "", ()), response)
+    cache.set(("GET", "/big", "", ()), {**response, "body": "x" * 2048})
+
+    # Assert
+    assert cache.stats()["entries"] == 1
+    assert cache.get(("GET", "/b", "", ())) is not None
+    assert cache.stats()["size_bytes"] <= 1024
@@ -0,0 +1,102 @@
+import asyncio
+import functools
+import json
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from lamina import Request, lamina
+from lamina.concurrency import gather
+
+
+@dataclass
+class FakeContext:
+    remaining_ms: int
+
+    def get_remaining_time_in_millis(self) -> int:
+        return self.remaining_ms
+
+
+def blocking_call(value: int) -> int:
+    time.sleep(0.1)
+    return value
+
+
+async def async_call(value: int) -> int:
+    await asyncio.sleep(0.1)
+    return value
+
+
+def test_request_gather_runs_calls_concurrently():
+    # Arrange
+    @lamina()
+    async def handler(request: Request):
+        results = await request.gather(
+            async_call(1),
+            functools.partial(blocking_call, 2),
+            functools.partial(blocking_call, 3),
+            functools.partial(async_call, 4),
+        )
+        return {"results": results, "timings": request.call_timings}
+
+    # Act
+    start = time.perf_counter()
+    response = handler({"body": "{}"}, None)
+    elapsed = time.perf_counter() - start
+    body = json.loads(response["body"])
+
+    # Assert
+    assert body["results"] == [1, 2, 3, 4]
+    assert elapsed < 0.3
+    assert len(body["timings"]) == 4
+    assert {timing["status"] for timing in body["timings"]} == {"ok"}
+
+
+async def test_gather_respects_limit():
+    # Arrange
+    running, peak = 0, 0
+
+    async def tracked():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    # Act
+    await gather(*(tracked() for _ in range(10)), limit=3)
+
+    # Assert
+    assert peak == 3
+
+
+async def test_gather_cancels_siblings_on_failure():
+    # Arrange
+    timings = []
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("downstream error")
+
+    # Act
+    with pytest.raises(ValueError, match="downstream error"):
+        await gather(async_call(1), fail(), timings=timings)
+
+    # Assert
+    assert sorted(timing["status"] for timing in timings) == ["cancelled", "error"]
+
+
+def test_gather_respects_request_deadline(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("LAMINA_DEADLINE_SAFETY_MARGIN_MS", "0")
+
+    @lamina()
+    async def handler(request: Request):
+        return await request.gather(asyncio.sleep(5), asyncio.sleep(5))
+
+    # Act
+    response = handler({"body": "{}"}, FakeContext(remaining_ms=100))
+
+    # Assert
+    assert response["statusCode"] == 504
@@ -1,4 +1,10 @@
+import base64
+import io
 import json
+import mmap
+import os
+
+import pytest
 
 from lamina import Request, lamina
 
@@ -46,3 +52,67 @@ def test_force_content_type():
     assert response["statusCode"] == 200
     assert response["body"] == "<html><h1>hello world</h1></html>"
     assert response["headers"] == {"Content-Type": "text/plain"}
+
+
+PNG = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + b"\x00\x00\x00\x01" * 2 + b"\x00" * 100
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [bytes, bytearray, memoryview, io.BytesIO],
+    ids=["bytes", "bytearray", "memoryview", "file"],
+)
+def test_binary_response(factory):
+    # Arrange
+    @lamina()
+    def handler(request: Request):
+        return factory(PNG)
+
+    # Act
+    response = handler({"body": "{}"}, None)
+
+    # Assert
+    assert response["isBase64Encoded"] is True
+    assert base64.b64decode(response["body"]) == PNG
+    assert response["headers"] == {"Content-Type": "image/png"}
+
+
+def test_binary_response_from_mmap_and_file(tmp_path):
+    # Arrange
+    path = tmp_path / "report.pdf"
+    data = os.urandom(1024 * 1024 + 1)
+    path.write_bytes(data)
+
+    @lamina(produces="application/pdf")
+    def from_file(request: Request):
+        return open(path, "rb")
+
+    @lamina(produces="application/pdf")
+    def from_mmap(request: Request):
+        with open(path, "rb") as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # Act
+    file_response = from_file({"body": "{}"}, None)
+    mmap_response = from_mmap({"body": "{}"}, None)
+
+    # Assert
+    assert base64.b64decode(file_response["body"]) == data
+    assert file_response["body"] == mmap_response["body"]
+    assert mmap_response["headers"] == {"Content-Type": "application/pdf"}
+
+
+def test_binary_response_with_status_and_headers():
+    # Arrange
+    @lamina()
+    def handler(request: Request):
+        return b"", 201, {"Content-Disposition": "attachment"}
+
+    # Act
+    response = handler({"body": "{}"}, None)
+
+    # Assert
+    assert response["statusCode"] == 201
+    assert response["body"] == ""
+    assert response["isBase64Encoded"] is True
+    assert response["headers"]["Content-Type"] == "application/octet-stream"
@@ -0,0 +1,122 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from lamina import Request, lamina
+from lamina.deadline import Deadline
+
+
+@dataclass
+class FakeContext:
+    remaining_ms: int
+
+    def get_remaining_time_in_millis(self) -> int:
+        return self.remaining_ms
+
+
+@pytest.fixture(autouse=True)
+def safety_margin(monkeypatch):
+    monkeypatch.setenv("LAMINA_DEADLINE_SAFETY_MARGIN_MS", "100")
+
+
+def test_deadline_is_exposed_in_request():
+    # Arrange
+    @lamina()
+    def handler(request: Request):
+        return {"remaining": request.remaining_time()}
+
+    # Act
+    response = handler({"body": "{}"}, FakeContext(remaining_ms=3100))
+    remaining = json.loads(response["body"])["remaining"]
+
+    # Assert
+    assert 2.9 < remaining <= 3.0
+
+
+def test_no_context_means_no_deadline():
+    # Arrange
+    @lamina()
+    def handler(request: Request):
+        return {"remaining": request.remaining_time()}
+
+    # Act
+    response = handler({"body": "{}"}, None)
+
+    # Assert
+    assert json.loads(response["body"]) == {"remaining": None}
+
+
+def test_async_handler_timeout_returns_504():
+    # Arrange
+    @lamina()
+    async def handler(request: Request):
+        await asyncio.sleep(5)
+        return {"ok": True}
+
+    # Act
+    start = time.perf_counter()
+    response = handler({"body": "{}"}, FakeContext(remaining_ms=200))
+    elapsed = time.perf_counter() - start
+    body = json.loads(response["body"])
+
+    # Assert
+    assert response["statusCode"] == 504
+    assert elapsed < 1
+    assert body["detail"] == "Request deadline exceeded."
+    assert {"pre_parse", "parse", "pre_execute", "timeout"} <= set(body["timings"])
+
+
+def test_expired_deadline_skips_sync_handler():
+    # Arrange
+    calls = []
+
+    @lamina()
+    def handler(request: Request):
+        calls.append(1)
+        return {"ok": True}
+
+    # Act
+    response = handler({"body": "{}"}, FakeContext(remaining_ms=50))
+
+    # Assert
+    assert response["statusCode"] == 504
+    assert calls == []
+
+
+def test_handler_timeout_errors_are_not_deadlines():
+    # Arrange
+    @lamina()
+    async def handler(request: Request):
+        raise TimeoutError("socket timeout")
+
+    # Act
+    response = handler({"body": "{}"}, FakeContext(remaining_ms=5000))
+
+    # Assert
+    assert response["statusCode"] == 500
+
+
+def test_phase_timings_are_recorded():
+    # Arrange
+    @lamina()
+    def handler(request: Request):
+        return dict(request.timings)
+
+    # Act
+    response = handler({"body": "{}"}, None)
+
+    # Assert
+    assert list(json.loads(response["body"])) == ["pre_parse", "parse", "pre_execute"]
+
+
+def test_deadline_from_context():
+    # Act
+    deadline = Deadline.from_context(FakeContext(remaining_ms=1000), 400)
+
+    # Assert
+    assert 0.5 < deadline.remaining() <= 0.6
+    assert not deadline.expired
+    assert Deadline.from_context({}).remaining() is None
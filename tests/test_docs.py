@@ -0,0 +1,107 @@
+import base64
+import gzip
+import json
+
+import pytest
+
+import lamina
+import lamina.spec
+
+SPEC = {
+    "openapi": "3.1.0",
+    "info": {"title": "Docs API", "version": "1.0.0"},
+    "paths": {f"/items-{index}": {} for index in range(100)},
+}
+
+
+@pytest.fixture
+def spec_file(tmp_path):
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps(SPEC))
+    return path
+
+
+def test_serves_prebuilt_spec_with_gzip(spec_file):
+    # Arrange
+    handler = lamina.docs_handler(spec_file)
+
+    # Act
+    plain = handler({"path": "/docs/openapi.json", "headers": {}}, None)
+    compressed = handler(
+        {
+            "path": "/docs/openapi.json",
+            "headers": {"accept-encoding": "br;q=1.0, gzip;q=0.8"},
+        },
+        None,
+    )
+
+    # Assert
+    assert plain["statusCode"] == 200
+    assert json.loads(plain["body"]) == SPEC
+    assert compressed["isBase64Encoded"] is True
+    assert compressed["headers"]["Content-Encoding"] == "gzip"
+    assert gzip.decompress(base64.b64decode(compressed["body"])) == (
+        plain["body"].encode()
+    )
+    assert compressed["headers"]["ETag"] == plain["headers"]["ETag"][:-1] + '-gzip"'
+
+
+def test_if_none_match_returns_not_modified(spec_file):
+    # Arrange
+    handler = lamina.docs_handler(spec_file)
+    etag = handler({"path": "/openapi.json"}, None)["headers"]["ETag"]
+
+    # Act
+    response = handler(
+        {"path": "/openapi.json", "headers": {"If-None-Match": etag}}, None
+    )
+
+    def gzip_request(if_none_match: str | None = None):
+        headers = {"Accept-Encoding": "gzip", "If-None-Match": if_none_match}
+        return handler({"path": "/openapi.json", "headers": headers}, None)
+
+    gzip_etag = gzip_request()["headers"]["ETag"]
+    identity_etag_with_gzip = gzip_request(etag)
+    gzip_not_modified = gzip_request(gzip_etag)
+
+    # Assert
+    assert response["statusCode"] == 304
+    assert response["body"] == ""
+    assert response["headers"]["ETag"] == etag
+    assert identity_etag_with_gzip["statusCode"] == 200
+    assert gzip_not_modified["statusCode"] == 304
+    assert gzip_not_modified["headers"]["ETag"] == gzip_etag
+
+
+@pytest.mark.parametrize(
+    "ui, expected", [("swagger", "SwaggerUIBundle"), ("redoc", "Redoc.init")]
+)
+def test_documentation_page(spec_file, ui, expected):
+    # Arrange
+    handler = lamina.docs_handler(spec_file, ui=ui, title="<My API>")
+
+    # Act
+    response = handler({"path": "/docs"}, None)
+
+    # Assert
+    assert response["headers"]["Content-Type"] == "text/html; charset=utf-8"
+    assert expected in response["body"]
+    assert "<title>&lt;My API&gt;</title>" in response["body"]
+
+
+def test_spec_from_module_attribute(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(lamina.spec, "PREBUILT_SPEC", SPEC, raising=False)
+
+    # Act
+    handler = lamina.docs_handler("lamina.spec:PREBUILT_SPEC", ui=None)
+    response = handler({"path": "/docs"}, None)
+
+    # Assert
+    assert json.loads(response["body"]) == SPEC
+
+
+def test_missing_spec_fails_at_init(tmp_path):
+    # Act / Assert
+    with pytest.raises(FileNotFoundError):
+        lamina.docs_handler(tmp_path / "missing.json")
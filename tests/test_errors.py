@@ -0,0 +1,114 @@
+import json
+
+import pytest
+from loguru import logger
+from pydantic import BaseModel
+
+from lamina import Request, lamina
+from lamina.errors import LogLimiter, client_error_logs, error_response
+
+
+class Item(BaseModel):
+    name: str
+    quantity: int
+
+
+@pytest.fixture
+def errors():
+    client_error_logs._window_start = 0.0
+    messages = []
+    sink = logger.add(messages.append, level="ERROR")
+    yield messages
+    logger.remove(sink)
+    client_error_logs._suppressed = 0
+
+
+def test_validation_errors_are_formatted():
+    # Arrange
+    @lamina(schema_in=Item)
+    def handler(request: Request):
+        return {}
+
+    # Act
+    response = handler({"body": json.dumps({"quantity": "many"})}, None)
+
+    # Assert
+    assert response["statusCode"] == 422
+    assert json.loads(response["body"]) == {
+        "detail": [
+            {"field": "name", "message": "Field required"},
+            {
+                "field": "quantity",
+                "message": (
+                    "Input should be a valid integer, unable to parse string "
+                    "as an integer"
+                ),
+            },
+        ]
+    }
+    assert response["headers"] == {"Content-Type": "application/json; charset=utf-8"}
+
+
+def test_client_error_logs_are_rate_limited(monkeypatch, errors):
+    # Arrange
+    monkeypatch.setenv("LAMINA_CLIENT_ERROR_LOG_LIMIT", "3")
+
+    @lamina(schema_in=Item)
+    def handler(request: Request):
+        return {}
+
+    # Act
+    responses = [handler({"body": "{}"}, None) for _ in range(10)]
+
+    # Assert
+    assert {response["statusCode"] for response in responses} == {422}
+    assert len(errors) == 3
+
+
+def test_server_errors_are_always_logged(monkeypatch, errors):
+    # Arrange
+    monkeypatch.setenv("LAMINA_CLIENT_ERROR_LOG_LIMIT", "1")
+
+    @lamina()
+    def handler(request: Request):
+        raise RuntimeError("boom")
+
+    # Act
+    for _ in range(3):
+        handler({"body": "{}"}, None)
+
+    # Assert
+    assert len(errors) == 3
+
+
+def test_log_limiter_reports_suppressed_entries(monkeypatch):
+    # Arrange
+    now = [0.0]
+    monkeypatch.setattr("lamina.errors.time.monotonic", lambda: now[0])
+    warnings = []
+    sink = logger.add(warnings.append, level="WARNING")
+    limiter = LogLimiter(limit=2, interval=1.0)
+    limiter._window_start = -1.0
+
+    # Act
+    try:
+        first_window = [limiter.allow() for _ in range(4)]
+        now[0] = 1.5
+        second_window = limiter.allow()
+    finally:
+        logger.remove(sink)
+
+    # Assert
+    assert first_window == [True, True, False, False]
+    assert second_window is True
+    assert "2 client error log entries were suppressed" in warnings[0]
+
+
+def test_constant_error_bodies_are_cached():
+    # Act
+    first = error_response(413, "Request body too large.", constant=True)
+    second = error_response(413, "Request body too large.", constant=True)
+
+    # Assert
+    assert first["body"] is second["body"]
+    assert first["headers"] is not second["headers"]
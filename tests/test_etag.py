@@ -0,0 +1,93 @@
+from typing import Any, Dict
+
+import pytest
+
+from lamina import Request, lamina
+from lamina.helpers import compute_etag, etag_matches
+
+
+def _get_event(**headers: str) -> Dict[str, Any]:
+    return {"httpMethod": "GET", "path": "/status", "headers": headers, "body": None}
+
+
+def test_etag_header_is_added():
+    # Arrange
+    @lamina(methods=["GET"], etag=True)
+    def handler(request: Request):
+        return {"status": "ok"}
+
+    # Act
+    response = handler(_get_event(), None)
+
+    # Assert
+    assert response["statusCode"] == 200
+    assert response["headers"]["ETag"] == compute_etag('{"status": "ok"}')
+
+
+def test_if_none_match_returns_304():
+    # Arrange
+    @lamina(methods=["GET"], etag=True)
+    def handler(request: Request):
+        return {"status": "ok"}, 200, {"Cache-Control": "max-age=10"}
+
+    etag = handler(_get_event(), None)["headers"]["ETag"]
+
+    # Act
+    response = handler(_get_event(**{"if-none-match": etag}), None)
+
+    # Assert
+    assert response == {
+        "statusCode": 304,
+        "headers": {"Cache-Control": "max-age=10", "ETag": etag},
+        "body": "",
+    }
+
+
+def test_cached_etag_skips_handler():
+    # Arrange
+    calls = []
+
+    @lamina(methods=["GET"], etag=True, cache=True)
+    def handler(request: Request):
+        calls.append(1)
+        return {"status": "ok"}
+
+    etag = handler(_get_event(), None)["headers"]["ETag"]
+
+    # Act
+    not_modified = handler(_get_event(**{"If-None-Match": etag}), None)
+    modified = handler(_get_event(**{"If-None-Match": '"other"'}), None)
+
+    # Assert
+    assert len(calls) == 1
+    assert not_modified["statusCode"] == 304
+    assert modified["statusCode"] == 200
+    assert modified["body"] == '{"status": "ok"}'
+
+
+def test_etag_ignored_for_unsafe_methods():
+    # Arrange
+    @lamina(etag=True)
+    def handler(request: Request):
+        return {"status": "ok"}
+
+    # Act
+    response = handler({"httpMethod": "POST", "body": "{}"}, None)
+
+    # Assert
+    assert "ETag" not in response["headers"]
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ("*", True),
+        ('"xyz"', False),
+        (None, False),
+    ],
+)
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, '"abc"') is expected
@@ -0,0 +1,155 @@
+import json
+from typing import Dict, List, Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+from lamina import Request, get_openapi_spec, lamina
+from lamina.fieldsets import compile_projection, get_projection
+
+
+class Line(BaseModel):
+    sku: str
+    quantity: int = Field(alias="qty")
+
+
+class Order(BaseModel):
+    order_id: int = Field(alias="orderId")
+    lines: List[Line]
+    main_line: Optional[Line] = Field(None, alias="mainLine")
+    by_sku: Dict[str, Line] = Field(default_factory=dict, alias="bySku")
+
+
+class Orders(RootModel[List[Order]]):
+    pass
+
+
+ORDER = {
+    "orderId": 1,
+    "lines": [{"sku": "A", "qty": 2}],
+    "mainLine": {"sku": "A", "qty": 2},
+    "bySku": {"A": {"sku": "A", "qty": 2}},
+}
+
+
+def _event(**query: str) -> dict:
+    return {
+        "httpMethod": "GET",
+        "headers": {},
+        "body": None,
+        "queryStringParameters": query,
+    }
+
+
+@pytest.fixture
+def handler(make_handler):
+    return make_handler(
+        "/get-order",
+        returns=ORDER,
+        schema_out=Order,
+        sparse_fields=True,
+        methods=["GET"],
+        cache=True,
+    )
+
+
+def test_fields_select_nested_response_fields(handler):
+    # Act
+    response = handler(_event(fields="orderId,lines.qty,mainLine.sku"), None)
+
+    # Assert
+    assert json.loads(response["body"]) == {
+        "orderId": 1,
+        "lines": [{"qty": 2}],
+        "mainLine": {"sku": "A"},
+    }
+
+
+def test_exclude_and_cache_key(handler):
+    # Act
+    excluded = handler(_event(exclude="lines,bySku.sku"), None)
+    full = handler(_event(), None)
+
+    # Assert
+    assert json.loads(excluded["body"]) == {
+        "orderId": 1,
+        "mainLine": {"sku": "A", "qty": 2},
+        "bySku": {"A": {"qty": 2}},
+    }
+    assert json.loads(full["body"]) == ORDER
+    assert handler.cache.stats()["misses"] == 2
+
+
+@pytest.mark.parametrize(
+    "query, message",
+    [
+        ({"fields": "orderId,total"}, "Unknown field in fields: total."),
+        ({"exclude": "orderId.sku"}, "Field has no nested fields in exclude: "),
+    ],
+)
+def test_unknown_fields_are_rejected(handler, query, message):
+    # Act
+    response = handler(_event(**query), None)
+
+    # Assert
+    assert response["statusCode"] == 400
+    assert message in response["body"]
+    assert ".." not in response["body"]
+
+
+def test_projections_are_compiled_once_per_fieldset():
+    # Act
+    first = get_projection(Orders, {"fields": "lines.sku, orderId"})
+    second = get_projection(Orders, {"fields": "orderId,lines.sku"})
+
+    # Assert
+    assert first is second
+    assert first.include == {
+        "__all__": {"order_id": True, "lines": {"__all__": {"sku": True}}}
+    }
+    assert get_projection(Orders, {}) is None
+    assert compile_projection.cache_info().hits >= 1
+
+
+def test_sparse_fields_are_documented(handler):
+    # Act
+    spec = get_openapi_spec()
+
+    # Assert
+    parameters = spec["paths"]["/get-order"]["get"]["parameters"]
+    assert [p["name"] for p in parameters] == ["fields", "exclude"]
+    assert "`orderId`, `lines`, `mainLine`, `bySku`" in parameters[0]["description"]
+
+
+def test_sparse_fields_require_schema_out():
+    # Act / Assert
+    with pytest.raises(ValueError, match="sparse_fields requires schema_out"):
+        lamina(sparse_fields=True)
+
+
+def test_fieldset_parameters_are_not_passed_to_params_in():
+    # Arrange
+    class Params(BaseModel):
+        model_config = ConfigDict(extra="forbid")
+        page: int = 1
+
+    @lamina(params_in=Params, schema_out=Order, sparse_fields=True, methods=["GET"])
+    def get_order(request: Request):
+        return {**ORDER, "orderId": request.query.page}
+
+    # Act
+    response = get_order(_event(page="2", fields="orderId"), None)
+
+    # Assert
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) == {"orderId": 2}
+
+
+def test_params_in_cannot_declare_fieldset_parameters():
+    # Arrange
+    class Params(BaseModel):
+        fields: str | None = None
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="params_in cannot declare fields"):
+        lamina(params_in=Params, schema_out=Order, sparse_fields=True)
@@ -0,0 +1,232 @@
+import json
+import time
+from typing import Any, Dict
+
+import pytest
+from pydantic import BaseModel
+
+from lamina import Request, lamina
+from lamina.idempotency import (
+    DynamoDBIdempotencyStore,
+    Idempotency,
+    IdempotencyStatus,
+    IdempotencyStore,
+    MemoryIdempotencyStore,
+    SQLiteIdempotencyStore,
+)
+
+
+class OrderIn(BaseModel):
+    item: str
+    quantity: int
+
+
+def _post_event(body: Dict[str, Any], **headers: str) -> Dict[str, Any]:
+    return {"httpMethod": "POST", "headers": headers, "body": json.dumps(body)}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryIdempotencyStore()
+    return SQLiteIdempotencyStore(path=str(tmp_path / "idempotency.db"))
+
+
+def test_duplicate_payload_returns_stored_response(store):
+    # Arrange
+    calls = []
+
+    @lamina(schema_in=OrderIn, idempotency=Idempotency(store=store))
+    def handler(request: Request):
+        calls.append(request.data.item)
+        return {"order": len(calls)}, 201
+
+    # Act
+    first = handler(_post_event({"item": "book", "quantity": 1}), None)
+    second = handler(_post_event({"quantity": 1, "item": "book"}), None)
+    other = handler(_post_event({"item": "pen", "quantity": 1}), None)
+
+    # Assert
+    assert calls == ["book", "pen"]
+    assert first == second
+    assert second["statusCode"] == 201
+    assert json.loads(other["body"]) == {"order": 2}
+
+
+def test_header_key_takes_precedence(store):
+    # Arrange
+    calls = []
+
+    @lamina(schema_in=OrderIn, idempotency=Idempotency(store=store))
+    def handler(request: Request):
+        calls.append(1)
+        return {"order": len(calls)}
+
+    # Act
+    handler(_post_event({"item": "a", "quantity": 1}, **{"Idempotency-Key": "k"}), None)
+    replay = handler(
+        _post_event({"item": "b", "quantity": 2}, **{"idempotency-key": "k"}), None
+    )
+
+    # Assert
+    assert len(calls) == 1
+    assert json.loads(replay["body"]) == {"order": 1}
+
+
+def test_callers_do_not_share_stored_responses(store):
+    # Arrange
+    calls = []
+
+    @lamina(schema_in=OrderIn, idempotency=Idempotency(store=store))
+    def handler(request: Request):
+        owner = request.headers["Authorization"]
+        calls.append(owner)
+        return {"owner": owner, "quantity": request.data.quantity}
+
+    body = {"item": "book", "quantity": 5}
+
+    # Act
+    alice = handler(_post_event(body, Authorization="alice"), None)
+    bob = handler(_post_event(body, Authorization="bob"), None)
+    alice_again = handler(_post_event(body, Authorization="alice"), None)
+
+    # Assert
+    assert calls == ["alice", "bob"]
+    assert json.loads(alice["body"]) == {"owner": "alice", "quantity": 5}
+    assert json.loads(bob["body"]) == {"owner": "bob", "quantity": 5}
+    assert alice_again == alice
+
+
+def test_failed_execution_releases_key(store):
+    # Arrange
+    calls = []
+
+    @lamina(schema_in=OrderIn, idempotency=Idempotency(store=store))
+    def handler(request: Request):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("downstream failure")
+        return {"ok": True}
+
+    event = _post_event({"item": "a", "quantity": 1})
+
+    # Act
+    failed = handler(event, None)
+    retried = handler(event, None)
+
+    # Assert
+    assert failed["statusCode"] == 500
+    assert retried["statusCode"] == 200
+    assert len(calls) == 2
+
+
+def test_in_progress_returns_conflict(store):
+    # Arrange
+    @lamina(
+        schema_in=OrderIn,
+        idempotency=Idempotency(store=store, use_payload_hash=False),
+    )
+    def handler(request: Request):
+        return {"ok": True}
+
+    key = f"{handler.import_path}#in-flight"
+    store.put_in_progress(key, time.time() + 60)
+
+    # Act
+    response = handler(
+        _post_event({"item": "a", "quantity": 1}, **{"Idempotency-Key": "in-flight"}),
+        None,
+    )
+    record = store.put_in_progress(key, time.time() + 60)
+
+    # Assert
+    assert response["statusCode"] == 409
+    assert record.status == IdempotencyStatus.IN_PROGRESS
+
+
+def test_no_key_skips_idempotency():
+    # Arrange
+    calls = []
+
+    @lamina(
+        schema_in=OrderIn,
+        idempotency=Idempotency(use_payload_hash=False),
+    )
+    def handler(request: Request):
+        calls.append(1)
+        return {"ok": True}
+
+    # Act
+    handler(_post_event({"item": "a", "quantity": 1}), None)
+    handler(_post_event({"item": "a", "quantity": 1}), None)
+
+    # Assert
+    assert len(calls) == 2
+
+
+def test_expired_records_are_replaced(store):
+    # Act
+    store.complete("key", {"statusCode": 200}, time.time() - 1)
+    record = store.put_in_progress("key", time.time() + 60)
+
+    # Assert
+    assert record is None
+
+
+def test_store_base_class_is_abstract():
+    # Act / Assert
+    with pytest.raises(TypeError, match="abstract"):
+        IdempotencyStore()
+
+
+class FakeDynamoDBClient:
+    """DynamoDB client whose conditional puts fail, with a scripted read."""
+
+    class exceptions:
+        class ConditionalCheckFailedException(Exception):
+            pass
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.puts = 0
+
+    def put_item(self, **kwargs):
+        self.puts += 1
+        if self.items:
+            raise self.exceptions.ConditionalCheckFailedException()
+
+    def get_item(self, **kwargs):
+        item = self.items.pop(0)
+        return {"Item": item} if item else {}
+
+
+def test_dynamodb_store_retries_when_the_record_disappears():
+    # Arrange
+    client = FakeDynamoDBClient([None, None])
+    store = DynamoDBIdempotencyStore(table_name="records", client=client)
+
+    # Act
+    record = store.put_in_progress("key", time.time() + 60)
+
+    # Assert
+    assert record is None
+    assert client.puts == 3
+
+
+def test_dynamodb_store_reports_in_progress_after_failed_attempts():
+    # Arrange
+    expired = {
+        "id": {"S": "key"},
+        "status": {"S": "COMPLETED"},
+        "expiration": {"N": str(int(time.time()) - 10)},
+    }
+    client = FakeDynamoDBClient([expired, None, expired, None])
+    store = DynamoDBIdempotencyStore(table_name="records", client=client)
+
+    # Act
+    record = store.put_in_progress("key", time.time() + 60)
+
+    # Assert
+    assert record is not None
+    assert record.status == IdempotencyStatus.IN_PROGRESS
+    assert client.puts == 3
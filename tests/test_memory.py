@@ -0,0 +1,112 @@
+import json
+import tracemalloc
+from dataclasses import dataclass
+
+import pytest
+from loguru import logger
+
+from lamina import Request, lamina, memory
+from lamina.memory import MemoryTracker
+
+
+@dataclass
+class FakeContext:
+    memory_limit_in_mb: int
+
+    def get_remaining_time_in_millis(self) -> int:
+        return 10_000
+
+
+@pytest.fixture
+def track_memory(monkeypatch):
+    monkeypatch.setenv("LAMINA_TRACK_MEMORY", "true")
+    monkeypatch.setenv("LAMINA_TRACEMALLOC", "true")
+    yield
+    tracemalloc.stop()
+
+
+@pytest.fixture
+def warnings(monkeypatch):
+    monkeypatch.setattr(memory, "_alarm_peak_mb", None)
+    messages = []
+    sink = logger.add(messages.append, level="WARNING")
+    yield messages
+    logger.remove(sink)
+
+
+def test_memory_usage_is_exposed_in_request(track_memory):
+    # Arrange
+    @lamina()
+    def handler(request: Request):
+        return request.memory_usage
+
+    # Act
+    response = handler({"body": "{}"}, None)
+    usage = json.loads(response["body"])
+
+    # Assert
+    assert {"pre_parse", "parse", "pre_execute"} <= set(usage)
+    assert {"peak_rss_delta_mb", "traced_peak_mb"} <= set(usage["parse"])
+
+
+def test_tracker_records_phase_peak(track_memory):
+    # Arrange
+    tracker = MemoryTracker.from_settings()
+
+    # Act
+    data = bytearray(8 * 1024 * 1024)
+    del data
+    tracker.lap("handler")
+    tracker.lap("serialize")
+
+    # Assert
+    assert tracker.usage["handler"]["traced_peak_mb"] >= 8
+    assert tracker.usage["serialize"]["traced_peak_mb"] < 8
+
+
+def test_alarm_when_memory_limit_fraction_is_crossed(monkeypatch, warnings):
+    # Arrange
+    monkeypatch.setenv("LAMINA_TRACK_MEMORY", "true")
+    monkeypatch.setenv("LAMINA_MEMORY_ALARM_PERCENT", "50")
+
+    @lamina()
+    def handler(request: Request):
+        return {}
+
+    # Act
+    handler({"body": "{}"}, FakeContext(memory_limit_in_mb=1))
+    handler({"body": "{}"}, FakeContext(memory_limit_in_mb=1024 * 1024))
+
+    # Assert
+    assert len(warnings) == 1
+    assert "crossed 50% of the 1 MB limit" in warnings[0]
+
+
+def test_alarm_is_logged_again_only_when_peak_grows(monkeypatch, warnings):
+    # Arrange
+    tracker = MemoryTracker(alarm_percent=50)
+    peaks = iter([100.0, 100.0, 120.0])
+    monkeypatch.setattr(memory, "peak_rss_mb", lambda: next(peaks))
+    context = FakeContext(memory_limit_in_mb=128)
+
+    # Act
+    crossed = [tracker.check(context) for _ in range(2)]
+    grown = tracker.check(context)
+
+    # Assert
+    assert crossed == [True, False]
+    assert grown is True
+    assert len(warnings) == 2
+
+
+def test_memory_is_not_tracked_by_default():
+    # Arrange
+    @lamina()
+    def handler(request: Request):
+        return {"usage": request.memory_usage}
+
+    # Act
+    response = handler({"body": "{}"}, None)
+
+    # Assert
+    assert json.loads(response["body"]) == {"usage": {}}
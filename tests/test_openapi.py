@@ -1,22 +1,22 @@
 import datetime
+import importlib
+import json
 import os
+import sys
 from decimal import Decimal
 from enum import Enum
 from textwrap import dedent
 from typing import Any, Dict, Literal, Optional, Union
 
 import pytest
+from loguru import logger
 from openapi_spec_validator import validate
-from pydantic import UUID4, BaseModel, ConfigDict, Field, RootModel
+from pydantic import UUID4, BaseModel, ConfigDict, Field, RootModel, create_model
 
-import lamina.main as lamina_main
 from lamina import Request, get_openapi_spec, lamina
+from lamina.openapi.view_data import model_field_table, parse_docstring
 
-
-@pytest.fixture(scope="function", autouse=True)
-def clear_registry():
-    yield
-    lamina_main.LAMINA_REGISTRY.clear()
+pytestmark = pytest.mark.usefixtures("clear_registry")
 
 
 def test_get_openapi_minimal():
@@ -1043,3 +1043,378 @@ def test_optional_and_array_fields_in_schema():
 
     # Assert
     assert dedent(html_desc) == dedent(optional_and_array_expected_result)
+
+
+def test_shared_model_tables_and_docstrings_are_cached(make_handler):
+    # Arrange
+    class SharedError(BaseModel):
+        """Error returned by every endpoint."""
+
+        detail: str
+
+    class Page(BaseModel):
+        """Page of results."""
+
+        total: int
+
+    for index in range(5):
+        make_handler(
+            f"/items-{index}",
+            doc="List items.\n\nReturns a page of items.",
+            methods=["get"],
+            schema_out=Page,
+            responses={400: {"schema": SharedError}},
+        )
+    model_field_table.cache_clear()
+    parse_docstring.cache_clear()
+
+    # Act
+    spec = get_openapi_spec()
+
+    # Assert
+    assert len(spec["paths"]) == 5
+    descriptions = {
+        spec["paths"][f"/items-{i}"]["get"]["description"] for i in range(5)
+    }
+    assert len(descriptions) == 1
+    assert "Error returned by every endpoint" in descriptions.pop()
+    assert model_field_table.cache_info().misses == 2
+    assert model_field_table.cache_info().hits >= 8
+    assert parse_docstring.cache_info().hits > 0
+
+
+def test_parallel_spec_matches_sequential(tmp_path, monkeypatch, request):
+    # Arrange
+    module = tmp_path / "parallel_views.py"
+    views = "\n".join(dedent(f'''
+            @lamina(path="/items-{index}", schema_in=Item, schema_out=Item)
+            def view_{index}(request):
+                """View {index}.
+
+                Handles **item** {index}.
+                """
+            ''') for index in range(6))
+    module.write_text(dedent('''
+            from pydantic import BaseModel
+
+            from lamina import lamina
+
+
+            class Item(BaseModel):
+                """An item."""
+
+                name: str
+            ''') + views)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importlib.import_module("parallel_views")
+    request.addfinalizer(lambda: sys.modules.pop("parallel_views", None))
+    messages = []
+    sink = logger.add(messages.append, level="DEBUG")
+
+    class Local(BaseModel):
+        value: int
+
+    @lamina(path="/local", schema_out=Local)
+    def local(request: Request):
+        """Not importable by workers."""
+
+    # Act
+    try:
+        sequential = get_openapi_spec()
+        parallel = get_openapi_spec(workers=2)
+    finally:
+        logger.remove(sink)
+
+    # Assert
+    assert any("Built 6 of 7 OpenAPI views" in message for message in messages)
+    assert len(parallel["paths"]) == 7
+    assert json.dumps(parallel) == json.dumps(sequential)
+
+
+def test_view_responses_do_not_leak_into_other_views():
+    # Arrange
+    class NotFound(BaseModel):
+        detail: str
+
+    class Conflict(BaseModel):
+        detail: str
+
+    class Item(BaseModel):
+        name: str
+
+    @lamina(path="/a", schema_out=Item, responses={404: {"schema": NotFound}})
+    def view_a(request: Request):
+        pass
+
+    @lamina(path="/b", schema_out=Item)
+    def view_b(request: Request):
+        pass
+
+    # Act
+    spec = get_openapi_spec(extra_responses={409: {"schema": Conflict}})
+
+    # Assert
+    assert "404" in spec["paths"]["/a"]["post"]["responses"]
+    assert "404" not in spec["paths"]["/b"]["post"]["responses"]
+    assert "409" in spec["paths"]["/b"]["post"]["responses"]
+
+
+def test_identical_schemas_are_stored_once():
+    # Arrange
+    class Address(BaseModel):
+        model_config = ConfigDict(title="PostalAddress")
+        street: str
+
+    class Customer(BaseModel):
+        address: Address
+
+    @lamina(path="/addresses", schema_out=Address)
+    def addresses(request: Request):
+        pass
+
+    @lamina(path="/customers", schema_out=Customer)
+    def customers(request: Request):
+        pass
+
+    # Act
+    spec = get_openapi_spec()
+
+    # Assert
+    schemas = spec["components"]["schemas"]
+    assert "PostalAddress" in schemas
+    assert "Address" not in schemas
+    assert schemas["Customer"]["properties"]["address"] == {
+        "$ref": "#/components/schemas/PostalAddress"
+    }
+    validate(spec)
+
+
+def test_schema_name_conflicts_are_renamed(make_handler):
+    # Arrange
+    class Detail(BaseModel):
+        value: str
+
+    for path, fields in (
+        ("/a", {"name": (str, ...)}),
+        ("/b", {"quantity": (int, ...)}),
+    ):
+        Item = create_model("Item", detail=(Detail, ...), **fields)
+        make_handler(path, schema_out=Item)
+
+    # Act
+    spec = get_openapi_spec()
+
+    # Assert
+    schemas = spec["components"]["schemas"]
+    ref_a = spec["paths"]["/a"]["post"]["responses"]["200"]["content"]
+    ref_b = spec["paths"]["/b"]["post"]["responses"]["200"]["content"]
+    name_a = ref_a["application/json"]["schema"]["$ref"].split("/")[-1]
+    name_b = ref_b["application/json"]["schema"]["$ref"].split("/")[-1]
+    assert name_a == "Item"
+    assert name_b.startswith("Item_")
+    assert "name" in schemas[name_a]["properties"]
+    assert "quantity" in schemas[name_b]["properties"]
+    assert "Detail" in schemas
+    validate(spec)
+
+
+def test_nested_schema_name_conflicts_are_renamed(make_handler):
+    # Arrange
+    for path, annotation in (("/one", int), ("/two", str)):
+        Item = create_model("Item", value=(annotation, ...))
+        make_handler(path, schema_out=create_model("Order", items=(list[Item], ...)))
+
+    # Act
+    spec = get_openapi_spec()
+
+    # Assert
+    schemas = spec["components"]["schemas"]
+
+    def resolve(path: str) -> Dict[str, Any]:
+        content = spec["paths"][path]["post"]["responses"]["200"]["content"]
+        order = schemas[content["application/json"]["schema"]["$ref"].split("/")[-1]]
+        return schemas[order["properties"]["items"]["items"]["$ref"].split("/")[-1]]
+
+    assert resolve("/one")["properties"]["value"]["type"] == "integer"
+    assert resolve("/two")["properties"]["value"]["type"] == "string"
+    models = sorted(n.split("_")[0] for n in schemas if n.startswith(("Item", "Order")))
+    assert models == ["Item", "Item", "Order", "Order"]
+    validate(spec)
+
+
+def test_schema_name_conflicts_can_raise(monkeypatch, make_handler):
+    # Arrange
+    monkeypatch.setenv("LAMINA_OPENAPI_SCHEMA_CONFLICTS", "raise")
+    make_handler("/a", schema_out=create_model("Item", value=(str, ...)))
+    make_handler("/b", schema_out=create_model("Item", value=(int, ...)))
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="Different OpenAPI schemas are named 'Item'"):
+        get_openapi_spec()
+
+
+def test_generated_spec_can_be_modified(make_handler):
+    # Arrange
+    class Item(BaseModel):
+        name: str
+
+    make_handler("/items", schema_out=Item)
+    spec = get_openapi_spec()
+
+    # Act
+    spec["components"]["schemas"]["Item"]["properties"]["name"]["title"] = "MUTATED"
+    fresh = get_openapi_spec()
+
+    # Assert
+    assert fresh["components"]["schemas"]["Item"]["properties"]["name"] == {
+        "title": "Name",
+        "type": "string",
+    }
+
+
+def test_description_and_field_table_options():
+    # Arrange
+    class Tag(BaseModel):
+        label: str
+
+    class Pet(BaseModel):
+        name: str
+        tag: Tag
+
+    @lamina(path="/pets", schema_out=Pet)
+    def pets(request: Request):
+        """List pets
+
+        Returns the pets of the store.
+
+        Pets are sorted by name.
+        """
+
+    # Act
+    full = get_openapi_spec()["paths"]["/pets"]["post"]["description"]
+    top = get_openapi_spec(field_tables="top")["paths"]["/pets"]["post"]
+    summary = get_openapi_spec(descriptions="summary")["paths"]["/pets"]["post"]
+    none = get_openapi_spec(descriptions="none")["paths"]["/pets"]["post"]
+
+    # Assert
+    assert "Response Body Fields" in full and "<h3>Tag</h3>" in full
+    assert "Response Body Fields" in top["description"]
+    assert "<h3>Tag</h3>" not in top["description"]
+    assert summary["description"] == "<p>Returns the pets of the store.</p>\n"
+    assert "description" not in none
+    assert none["summary"] == "List pets"
+
+
+def test_field_tables_setting_accepts_booleans(monkeypatch):
+    # Arrange
+    from lamina import conf
+
+    # Act / Assert
+    for value, mode in [("false", "none"), ("1", "all"), ("TOP", "top")]:
+        monkeypatch.setenv("LAMINA_GENERATE_FIELD_TABLES_IN_DOCS", value)
+        assert conf.LAMINA_GENERATE_FIELD_TABLES_IN_DOCS == mode
+
+
+def test_split_by_tag_and_streamed_json():
+    # Arrange
+    from lamina.openapi.output import iter_json, split_by_tag
+
+    class Owner(BaseModel):
+        name: str
+
+    class Pet(BaseModel):
+        owner: Owner
+
+    class Order(BaseModel):
+        total: int
+
+    @lamina(path="/pets", schema_out=Pet, tags=["pets"])
+    def pets(request: Request):
+        pass
+
+    @lamina(path="/orders", schema_out=Order, tags=["store"])
+    def orders(request: Request):
+        pass
+
+    spec = get_openapi_spec()
+
+    # Act
+    documents = split_by_tag(spec)
+
+    # Assert
+    assert list(documents) == ["store", "pets"]
+    assert list(documents["pets"]["paths"]) == ["/pets"]
+    pet_schemas = documents["pets"]["components"]["schemas"]
+    assert {"Pet", "Owner", "BadRequest400"} <= set(pet_schemas)
+    assert "Order" not in pet_schemas
+    assert documents["pets"]["info"] == spec["info"]
+    validate(documents["pets"])
+    assert "".join(iter_json(spec)) == json.dumps(spec, indent=2)
+    assert "".join(iter_json(spec, minify=True)) == json.dumps(
+        spec, separators=(",", ":")
+    )
+
+
+def test_view_data_is_resolved_once(monkeypatch):
+    # Arrange
+    import dataclasses
+
+    from lamina.openapi.view_data import ViewData
+
+    class Query(BaseModel):
+        limit: int = 10
+
+    @lamina(schema_out=Query, params_in=Query, methods=["GET"], tags=["misc"])
+    def list_things(request: Request):
+        """List things"""
+
+    # Act
+    view = ViewData.from_wrapper(list_things)
+    same_view = ViewData.from_wrapper(list_things)
+    monkeypatch.setenv("LAMINA_USE_OBJECT_NAME", "module")
+
+    # Assert
+    assert view.path == view.get_path() == "/list-things"
+    assert view.methods == ("get",)
+    assert view.tags == ("misc",)
+    assert (view.summary, view.operation_id) == ("List things", "listThings")
+    assert [p["name"] for p in view.get_parameters()] == ["limit"]
+    assert view == same_view and hash(view) == hash(same_view)
+    assert not hasattr(view, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        view.path = "/other"
+
+
+def test_route_data_does_not_generate_schemas(monkeypatch):
+    # Arrange
+    from lamina.openapi import view_data
+    from lamina.openapi.view_data import RouteData, ViewData
+
+    class Things(BaseModel):
+        model_config = ConfigDict(
+            json_schema_extra={"methods": ["GET", "HEAD"], "tags": "misc"}
+        )
+        limit: int = 10
+
+    @lamina(schema_out=Things)
+    def list_things(request: Request):
+        """List things"""
+
+    # Act
+    monkeypatch.setattr(view_data, "model_schema", None)
+    route = RouteData.from_wrapper(list_things)
+    monkeypatch.undo()
+    view = ViewData.from_wrapper(list_things)
+
+    # Assert
+    assert route == RouteData(
+        import_path=list_things.import_path,
+        path="/list-things",
+        methods=("get", "head"),
+        tags=("misc",),
+    )
+    assert (view.path, view.methods, view.tags) == (
+        route.path,
+        route.methods,
+        route.tags,
+    )
@@ -0,0 +1,126 @@
+import json
+import sys
+
+import pytest
+
+from lamina import Request, lamina
+from lamina.recorder import EventRecorder, read_records
+from lamina.replay import compare, load_events, load_records
+
+
+@pytest.fixture
+def record_file(tmp_path, monkeypatch):
+    path = tmp_path / "events.jsonl"
+    monkeypatch.setenv("LAMINA_RECORD_EVENTS", str(path))
+    monkeypatch.setenv("LAMINA_RECORD_REDACT", "authorization,password")
+    return path
+
+
+def test_invocations_are_recorded_with_redaction(record_file):
+    # Arrange
+    @lamina()
+    def handler(request: Request):
+        return {"user": "lamina", "password": "secret"}
+
+    event = {
+        "body": json.dumps({"password": "secret", "name": "lamina"}),
+        "headers": {"Authorization": "Bearer token", "Accept": "*/*"},
+    }
+
+    # Act
+    handler(event, None)
+    [record] = list(read_records(record_file))
+
+    # Assert
+    assert record["handler"].endswith("handler")
+    assert record["event"]["headers"] == {"Authorization": "***", "Accept": "*/*"}
+    assert json.loads(record["event"]["body"]) == {
+        "password": "***",
+        "name": "lamina",
+    }
+    assert json.loads(record["response"]["body"])["password"] == "***"
+    assert record["response"]["statusCode"] == 200
+    assert {"pre_parse", "handler", "total"} <= set(record["timings"])
+    assert event["headers"]["Authorization"] == "Bearer token"
+
+
+def test_sample_rate_zero_records_nothing(record_file, monkeypatch):
+    # Arrange
+    monkeypatch.setenv("LAMINA_RECORD_SAMPLE_RATE", "0.0")
+
+    @lamina()
+    def handler(request: Request):
+        return {}
+
+    # Act
+    handler({"body": "{}"}, None)
+
+    # Assert
+    assert not record_file.exists()
+
+
+def test_recording_rotates_files(tmp_path):
+    # Arrange
+    path = tmp_path / "events.jsonl"
+    recorder = EventRecorder(str(path), max_bytes=300, backups=2)
+    response = {"statusCode": 200, "headers": {}, "body": "x" * 100}
+
+    # Act
+    for _ in range(6):
+        recorder.record("handler", {"body": "{}"}, None, response, {})
+
+    # Assert
+    assert (tmp_path / "events.jsonl.1").exists()
+    assert (tmp_path / "events.jsonl.2").exists()
+    assert not (tmp_path / "events.jsonl.3").exists()
+
+
+def test_compressed_recording(tmp_path):
+    # Arrange
+    pytest.importorskip("zstandard")
+    path = tmp_path / "events.jsonl.zst"
+    recorder = EventRecorder(str(path))
+    response = {"statusCode": 200, "headers": {}, "body": "{}"}
+
+    # Act
+    for index in range(3):
+        recorder.record("handler", {"body": str(index)}, None, response, {})
+
+    # Assert
+    assert [event["body"] for event in load_events(path)] == ["0", "1", "2"]
+
+
+def test_compressed_recording_names_the_extra(tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    # Act / Assert
+    with pytest.raises(ImportError, match=r"py-lamina\[record\]"):
+        EventRecorder(str(tmp_path / "events.jsonl.zst"))
+
+
+def test_compare_replays_recorded_invocations(record_file, monkeypatch):
+    # Arrange
+    version = {"value": 1}
+
+    @lamina()
+    def handler(request: Request):
+        return {"name": json.loads(request.data)["name"], "version": version["value"]}
+
+    for name in ("a", "b"):
+        handler({"body": json.dumps({"name": name})}, None)
+    monkeypatch.delenv("LAMINA_RECORD_EVENTS")
+
+    # Act
+    unchanged = compare(handler, load_records(record_file))
+    version["value"] = 2
+    changed = compare(handler, load_records(record_file, handler="other.handler"))
+    all_changed = compare(handler, load_records(record_file), concurrency=2)
+
+    # Assert
+    assert unchanged.changed == []
+    assert len(changed.results) == 0
+    assert [result.index for result in all_changed.changed] == [0, 1]
+    assert not all_changed.results[0].status_changed
+    assert all_changed.results[0].body_changed
+    assert "recorded" in all_changed.summary()
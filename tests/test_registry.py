@@ -0,0 +1,145 @@
+import threading
+
+import pytest
+from loguru import logger
+from pydantic import BaseModel
+
+import lamina
+import lamina.main as lamina_main
+from lamina import Request
+from lamina.gateway import Router
+from lamina.registry import HandlerRegistry, RouteConflictError
+
+pytestmark = pytest.mark.usefixtures("clear_registry")
+
+
+class Item(BaseModel):
+    name: str
+
+
+def test_registering_again_replaces_the_handler(make_handler):
+    # Arrange
+    first = make_handler("/items")
+    other = make_handler("/orders")
+
+    # Act
+    second = make_handler("/items")
+
+    # Assert
+    assert list(lamina_main.LAMINA_REGISTRY) == [second, other]
+    assert first not in lamina_main.LAMINA_REGISTRY
+    assert lamina_main.LAMINA_REGISTRY.get(second.import_path) is second
+
+
+def test_lookups_by_route_and_tag(make_handler):
+    # Arrange
+    items = make_handler("/items", methods=["GET", "POST"], tags=["store"])
+    orders = make_handler("/orders/{id}", methods=["GET"], tags=["store", "sales"])
+    registry = lamina_main.LAMINA_REGISTRY
+
+    # Act / Assert
+    assert registry.get_route("post", "/items") is items
+    assert registry.get_route("GET", "/orders/{id}") is orders
+    assert registry.get_route("DELETE", "/items") is None
+    assert registry.by_tag("store") == [items, orders]
+    assert registry.by_tag("sales") == [orders]
+
+
+def test_route_conflicts_warn_or_raise(make_handler):
+    # Arrange
+    first = make_handler("/items", methods=["GET"])
+
+    @lamina.lamina(path="/items", schema_out=Item, methods=["GET"])
+    def other_items(request: Request):
+        pass
+
+    messages = []
+    sink = logger.add(messages.append, level="WARNING")
+
+    # Act
+    try:
+        route = lamina_main.LAMINA_REGISTRY.get_route("GET", "/items")
+    finally:
+        logger.remove(sink)
+    strict = HandlerRegistry([first, other_items], on_conflict="raise")
+
+    # Assert
+    assert route is first
+    assert "Route GET /items of tests.test_registry.other_items" in messages[0]
+    with pytest.raises(RouteConflictError, match="already served by"):
+        strict.routes()
+
+
+def test_list_operations_keep_working(make_handler):
+    # Arrange
+    items = make_handler("/items")
+    orders = make_handler("/orders")
+    registry = lamina_main.LAMINA_REGISTRY
+
+    # Act
+    registry[:] = [wrapper for wrapper in registry if wrapper is not items]
+
+    # Assert
+    assert len(registry) == 1
+    assert registry[0] is orders
+    assert registry.get_route("POST", "/items") is None
+    assert registry.get_route("POST", "/orders") is orders
+
+
+def test_concurrent_registration(make_handler):
+    # Arrange
+    registry = HandlerRegistry()
+    handlers = [make_handler(f"/items/{index}") for index in range(200)]
+
+    def register(chunk):
+        for wrapper in chunk:
+            registry.register(wrapper)
+            list(registry)
+
+    threads = [
+        threading.Thread(target=register, args=(handlers[start::4],))
+        for start in range(4)
+    ]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert len(registry) == 200
+    assert registry.get_route("POST", "/items/199") is handlers[199]
+
+
+def test_router_finds_static_routes_by_lookup(make_handler):
+    # Arrange
+    items = make_handler("/items", methods=["GET"])
+    item = make_handler("/items/{id}", methods=["GET", "DELETE"])
+    router = Router.from_handlers(lamina_main.LAMINA_REGISTRY)
+
+    # Act / Assert
+    assert router.match("HEAD", "/items/")[0].handler is items
+    route, parameters, _ = router.match("GET", "/items/1")
+    assert (route.handler, parameters) == (item, {"id": "1"})
+    assert router.match("PUT", "/items/1") == (None, {}, ["GET", "DELETE"])
+
+
+def test_router_applies_route_conflict_policy(monkeypatch, make_handler):
+    # Arrange
+    first = make_handler("/items", methods=["GET"])
+
+    @lamina.lamina(path="/items", schema_out=Item, methods=["GET"])
+    def other_items(request: Request):
+        pass
+
+    # Act
+    router = Router.from_handlers([first, other_items])
+    monkeypatch.setenv("LAMINA_ROUTE_CONFLICTS", "raise")
+
+    # Assert
+    assert [route.handler for route in router.routes] == [first]
+    with pytest.raises(RouteConflictError):
+        Router.from_handlers([first, other_items])
+    with pytest.raises(RouteConflictError):
+        lamina.warmup()
@@ -0,0 +1,135 @@
+import json
+import signal
+
+import pytest
+
+from lamina import Request, lamina, resources
+from lamina.resources import ResourceRegistry
+
+
+@pytest.fixture(autouse=True)
+def clear_resources():
+    yield
+    resources.registry.clear()
+
+
+def test_resource_is_created_once_and_injected():
+    # Arrange
+    created = []
+
+    @resources.register("client")
+    def create_client():
+        created.append(1)
+        return {"id": len(created)}
+
+    @lamina()
+    def handler(request: Request):
+        return request.resources.client
+
+    # Act
+    first = handler({"body": "{}"}, None)
+    second = handler({"body": "{}"}, None)
+
+    # Assert
+    assert json.loads(first["body"]) == {"id": 1}
+    assert json.loads(second["body"]) == {"id": 1}
+    assert len(created) == 1
+
+
+def test_async_resource():
+    # Arrange
+    async def create_session():
+        return "session"
+
+    resources.register("session", create_session)
+
+    @lamina()
+    async def handler(request: Request):
+        return await request.resources.aget("session")
+
+    # Act
+    response = handler({"body": "{}"}, None)
+
+    # Assert
+    assert response["body"] == "session"
+    assert resources.get("session") == "session"
+
+
+def test_unknown_resource_returns_error():
+    # Arrange
+    @lamina()
+    def handler(request: Request):
+        return request.resources.missing
+
+    # Act
+    response = handler({"body": "{}"}, None)
+
+    # Assert
+    assert response["statusCode"] == 500
+    assert "missing" in json.loads(response["body"])["detail"]
+
+
+def test_reset_on_error_recreates_resource():
+    # Arrange
+    created, disposed = [], []
+    resources.register(
+        "db",
+        lambda: created.append(1) or len(created),
+        teardown=disposed.append,
+        reset_on=(ConnectionError,),
+    )
+
+    @lamina()
+    def handler(request: Request):
+        db = request.resources.db
+        if db == 1:
+            raise ConnectionError("connection lost")
+        return {"db": db}
+
+    # Act
+    failed = handler({"body": "{}"}, None)
+    recovered = handler({"body": "{}"}, None)
+
+    # Assert
+    assert failed["statusCode"] == 500
+    assert json.loads(recovered["body"]) == {"db": 2}
+    assert disposed == [1]
+
+
+def test_health_check_recreates_unhealthy_resource():
+    # Arrange
+    registry = ResourceRegistry()
+    created = []
+    registry.register(
+        "pool",
+        lambda: created.append(1) or len(created),
+        health_check=lambda pool: pool > 1,
+    )
+
+    # Act
+    first = registry.get("pool")
+    second = registry.get("pool")
+    third = registry.get("pool")
+
+    # Assert
+    assert (first, second, third) == (1, 2, 2)
+
+
+def test_sigterm_tears_down_resources(monkeypatch):
+    # Arrange
+    received, disposed = [], []
+    original = signal.getsignal(signal.SIGTERM)
+    signal.signal(signal.SIGTERM, lambda signum, frame: received.append(signum))
+    registry = ResourceRegistry()
+    registry.register("client", lambda: "client", teardown=disposed.append)
+    registry.get("client")
+
+    # Act
+    try:
+        signal.getsignal(signal.SIGTERM)(signal.SIGTERM, None)
+    finally:
+        signal.signal(signal.SIGTERM, original)
+
+    # Assert
+    assert disposed == ["client"]
+    assert received == [signal.SIGTERM]
@@ -0,0 +1,117 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from lamina import Request, lamina
+from lamina.cli import main
+from lamina.gateway import Router
+from lamina.replay import load_events, percentile, replay
+from lamina.server import LaminaHTTPServer
+
+
+@lamina(path="/echo/{name}", methods=["get", "post"], add_to_spec=False)
+def echo(request: Request):
+    if request.event["pathParameters"]["name"] == "boom":
+        raise RuntimeError("boom")
+    return {"name": request.event["pathParameters"]["name"]}
+
+
+@lamina(path="/ping", methods=["get"], add_to_spec=False)
+async def ping(request: Request):
+    return {"pong": True}
+
+
+@pytest.fixture
+def server():
+    server = LaminaHTTPServer(("127.0.0.1", 0), Router.from_handlers([echo, ping]))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_server_dispatches_requests(server):
+    # Act
+    with urllib.request.urlopen(f"{server}/echo/lamina") as response:
+        echoed = json.loads(response.read())
+    with urllib.request.urlopen(f"{server}/ping") as response:
+        pinged = json.loads(response.read())
+    with pytest.raises(urllib.error.HTTPError) as not_found:
+        urllib.request.urlopen(f"{server}/missing")
+
+    # Assert
+    assert echoed == {"name": "lamina"}
+    assert pinged == {"pong": True}
+    assert not_found.value.code == 404
+
+
+def test_replay_reports_latency_and_errors(tmp_path):
+    # Arrange
+    events_file = tmp_path / "events.jsonl"
+    lines = [
+        json.dumps({"event": {"body": "{}", "pathParameters": {"name": "a"}}}),
+        json.dumps({"body": "{}", "pathParameters": {"name": "boom"}}),
+        "",
+        json.dumps({"body": "{}", "pathParameters": {"name": "b"}}),
+    ]
+    events_file.write_text("\n".join(lines))
+
+    # Act
+    report = replay(echo, load_events(events_file), rate=100, concurrency=2)
+
+    # Assert
+    assert report.count == 3
+    assert report.status_codes == {200: 2, 500: 1}
+    assert report.errors == 1
+    assert report.percentile(99) >= report.percentile(50) > 0
+    assert "p95=" in report.summary()
+
+
+def test_replay_latency_includes_queueing_and_failures():
+    # Arrange
+    def slow(event, context):
+        time.sleep(0.05)
+        if event["fail"]:
+            raise ValueError("bad event")
+        return {"statusCode": 200}
+
+    events = [{"fail": index % 2 == 1} for index in range(5)]
+
+    # Act
+    report = replay(slow, events, rate=100, concurrency=1)
+
+    # Assert
+    assert report.exceptions == 2
+    assert report.failures == {"ValueError: bad event": 2}
+    assert report.status_codes == {200: 3}
+    # The last invocation was scheduled 40ms in, and ran after four others
+    assert max(report.latencies) > 150
+    assert "exceptions=2" in report.summary()
+    assert "2x ValueError: bad event" in report.summary()
+
+
+def test_percentile():
+    # Assert
+    assert percentile([], 50) == 0.0
+    assert percentile(list(range(1, 101)), 95) == 95
+    assert percentile([3, 1, 2], 50) == 2
+
+
+def test_cli_replay(tmp_path, capsys):
+    # Arrange
+    events_file = tmp_path / "events.jsonl"
+    events_file.write_text(json.dumps({"body": "{}", "pathParameters": {"name": "a"}}))
+
+    # Act
+    exit_code = main(
+        ["replay", str(events_file), "--handler", "tests.test_server:echo"]
+    )
+
+    # Assert
+    assert exit_code == 0
+    assert "requests=1 errors=0" in capsys.readouterr().out
@@ -0,0 +1,180 @@
+import json
+import os
+import sys
+import threading
+import time
+from textwrap import dedent
+
+import pytest
+from pydantic import BaseModel
+
+import lamina.main as lamina_main
+import lamina.spec as lamina_spec
+from lamina import Request, lamina
+from lamina.cli import main
+from lamina.openapi.generator import SwaggerGenerator
+from lamina.spec_builder import SpecBuilder, SpecConfig, watch
+
+
+@pytest.fixture(autouse=True)
+def project(tmp_path, monkeypatch, clear_registry):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    modules = set(sys.modules)
+    yield tmp_path
+    for name in set(sys.modules) - modules:
+        sys.modules.pop(name)
+
+
+class Item(BaseModel):
+    name: str
+
+
+def test_build_uses_pyproject_settings(project):
+    # Arrange
+    (project / "pyproject.toml").write_text(dedent("""
+            [tool.lamina.spec]
+            output = "docs/api.json"
+            minify = true
+            title = "Built API"
+            servers = [{url = "https://api.example.com"}]
+            """))
+
+    @lamina(path="/items", schema_out=Item)
+    def items(request: Request):
+        pass
+
+    # Act
+    exit_code = main(["spec", "build"])
+
+    # Assert
+    content = (project / "docs" / "api.json").read_text()
+    spec = json.loads(content)
+    assert exit_code == 0
+    assert "\n" not in content
+    assert spec["info"]["title"] == "Built API"
+    assert spec["servers"] == [{"url": "https://api.example.com"}]
+    assert "/items" in spec["paths"]
+
+
+def test_rebuild_reuses_unchanged_views(project, monkeypatch):
+    # Arrange
+    @lamina(path="/a", schema_out=Item)
+    def view_a(request: Request):
+        pass
+
+    @lamina(path="/b", schema_out=Item)
+    def view_b(request: Request):
+        pass
+
+    builds = []
+    build_fragment = SwaggerGenerator.build_fragment
+
+    def spy(self, view):
+        builds.append(view.path)
+        return build_fragment(self, view)
+
+    monkeypatch.setattr(SwaggerGenerator, "build_fragment", spy)
+    builder = SpecBuilder(SpecConfig(output="openapi.json"))
+
+    # Act
+    first = builder.build()
+    view_b.last_updated = time.time()
+    second = builder.build()
+    third = builder.build()
+
+    # Assert
+    assert builds == ["/a", "/b", "/b"]
+    assert (first, third) == (True, False)
+    assert second is True
+
+
+def test_unknown_options_are_rejected():
+    # Act / Assert
+    with pytest.raises(ValueError, match="Unknown spec options: colour"):
+        SpecConfig(options={"colour": "blue"})
+
+
+def test_yaml_output_names_the_extra(project, monkeypatch):
+    # Arrange
+    monkeypatch.setitem(sys.modules, "yaml", None)
+    config = SpecConfig(output="openapi.yaml")
+
+    # Act / Assert
+    with pytest.raises(ImportError, match=r"py-lamina\[spec\]"):
+        config.write({"openapi": "3.0.3"}, project / "openapi.yaml")
+
+
+def test_watch_reloads_changed_modules(project, monkeypatch):
+    # Arrange
+    models = project / "watch_models.py"
+    models.write_text(
+        "from pydantic import BaseModel\n\nclass Out(BaseModel):\n    a: int\n"
+    )
+    (project / "watch_views.py").write_text(dedent("""
+            from lamina import lamina
+            from watch_models import Out
+
+            @lamina(path="/watched", schema_out=Out)
+            def watched(request):
+                pass
+            """))
+    monkeypatch.setattr(lamina_spec, "_modules_imported", False)
+    output = project / "openapi.json"
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=watch, args=(SpecConfig(),), kwargs={"interval": 0.05, "stop": stop}
+    )
+
+    def properties():
+        if not output.exists():
+            return {}
+        return json.loads(output.read_text())["components"]["schemas"]["Out"][
+            "properties"
+        ]
+
+    def wait_for(condition):
+        deadline = time.monotonic() + 5
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        return condition()
+
+    # Act
+    thread.start()
+    try:
+        assert wait_for(lambda: "a" in properties())
+        models.write_text(models.read_text() + "    b: str\n")
+        os.utime(models, (time.time() + 10, time.time() + 10))
+        changed = wait_for(lambda: "b" in properties())
+    finally:
+        stop.set()
+        thread.join()
+
+    # Assert
+    assert changed
+    assert len(lamina_main.LAMINA_REGISTRY) == 1
+
+
+def test_build_splits_documents_by_tag(project):
+    # Arrange
+    @lamina(path="/items", schema_out=Item, tags=["Store Items"])
+    def items(request: Request):
+        pass
+
+    @lamina(path="/health", schema_out=Item)
+    def health(request: Request):
+        pass
+
+    # Act
+    exit_code = main(["spec", "build", "--split-by-tag", "--descriptions", "none"])
+
+    # Assert
+    spec = json.loads((project / "openapi.json").read_text())
+    store = json.loads((project / "openapi.store-items.json").read_text())
+    default = json.loads((project / "openapi.default.json").read_text())
+    assert exit_code == 0
+    assert "description" not in spec["paths"]["/items"]["post"]
+    assert list(store["paths"]) == ["/items"]
+    assert "Item" in store["components"]["schemas"]
+    assert list(default["paths"]) == ["/health"]
+    assert "BadRequest400" in default["components"]["schemas"]
@@ -0,0 +1,145 @@
+import datetime
+import json
+from typing import List
+
+import pytest
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from lamina import Request, lamina
+from lamina.validation import ValidationPolicy
+
+
+class Line(BaseModel):
+    sku: str
+    quantity: int
+
+
+class Order(BaseModel):
+    order_id: int = Field(alias="orderId")
+    placed_at: datetime.datetime
+    lines: List[Line] = []
+
+
+def _event(body: dict) -> dict:
+    return {"httpMethod": "POST", "headers": {}, "body": json.dumps(body)}
+
+
+ORDER = {"orderId": 1, "placed_at": "2024-05-01T10:00:00", "lines": []}
+
+
+def test_trusted_output_is_serialized_without_validation():
+    # Arrange
+    @lamina(schema_out=Order, validation=ValidationPolicy(output="trusted"))
+    def handler(request: Request):
+        return {"orderId": 1, "placed_at": "not a date", "lines": [{"sku": "A"}]}
+
+    # Act
+    response = handler(_event({}), None)
+
+    # Assert
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) == {
+        "orderId": 1,
+        "placed_at": "not a date",
+        "lines": [{"sku": "A"}],
+    }
+    assert handler.validation.stats()["output"]["skipped"] == 1
+
+
+def test_sampled_output_logs_drift_and_keeps_the_response():
+    # Arrange
+    policy = ValidationPolicy(output="sampled", sample_rate=1)
+
+    @lamina(schema_out=Order, validation=policy)
+    def handler(request: Request):
+        return {"orderId": "x", "placed_at": "2024-05-01T10:00:00"}
+
+    messages = []
+    sink = logger.add(messages.append, level="WARNING")
+
+    # Act
+    try:
+        response = handler(_event({}), None)
+    finally:
+        logger.remove(sink)
+
+    # Assert
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["orderId"] == "x"
+    assert "Validation drift in output of Order (1 errors)" in messages[0]
+    assert policy.stats()["output"] == {
+        "validated": 0,
+        "skipped": 0,
+        "failed": 0,
+        "drift": 1,
+    }
+
+
+def test_sampled_validation_rate():
+    # Arrange
+    never = ValidationPolicy(output="sampled", sample_rate=0)
+    always = ValidationPolicy(output="sampled", sample_rate=1)
+
+    # Act
+    for policy in (never, always):
+        for _ in range(3):
+            policy.dump_json(Order, ORDER)
+
+    # Assert
+    assert never.stats()["output"]["skipped"] == 3
+    assert always.stats()["output"]["validated"] == 3
+
+
+def test_strict_input_rejects_coercion():
+    # Arrange
+    @lamina(schema_in=Order, validation=ValidationPolicy(input="strict"))
+    def handler(request: Request):
+        return {"placed_at": request.data.placed_at.isoformat()}
+
+    # Act
+    valid = handler(_event(ORDER), None)
+    coerced = handler(_event({**ORDER, "orderId": "1"}), None)
+
+    # Assert
+    assert valid["statusCode"] == 200
+    assert json.loads(valid["body"]) == {"placed_at": "2024-05-01T10:00:00"}
+    assert coerced["statusCode"] == 422
+    assert handler.validation.stats()["input"]["failed"] == 1
+
+
+def test_trusted_input_from_settings(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("LAMINA_INPUT_VALIDATION", "trusted")
+
+    @lamina(schema_in=Order)
+    def handler(request: Request):
+        return {"order_id": request.data.order_id}
+
+    # Act
+    response = handler(_event({**ORDER, "orderId": "7"}), None)
+
+    # Assert
+    assert json.loads(response["body"]) == {"order_id": "7"}
+    assert handler.validation.stats()["input"]["skipped"] == 1
+
+
+def test_model_responses_are_not_validated_again():
+    # Arrange
+    @lamina(schema_out=Order)
+    def handler(request: Request):
+        return Order.model_validate(ORDER)
+
+    # Act
+    response = handler(_event({}), None)
+
+    # Assert
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["orderId"] == 1
+    assert handler.validation.stats()["output"]["skipped"] == 1
+
+
+def test_invalid_mode_is_rejected():
+    # Act / Assert
+    with pytest.raises(ValueError, match="Invalid validation mode: lax"):
+        ValidationPolicy(input="lax")
@@ -0,0 +1,81 @@
+import json
+
+from pydantic import BaseModel, ConfigDict
+
+import lamina
+from lamina import Request
+
+
+class DeferredIn(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str
+
+
+class DeferredOut(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    message: str
+
+
+def test_warmup_compiles_registered_schemas():
+    # Arrange
+    @lamina.lamina(schema_in=DeferredIn, schema_out=DeferredOut, add_to_spec=False)
+    def handler(request: Request):
+        return {"message": request.data.name}
+
+    # Act
+    timings = lamina.warmup([handler])
+
+    # Assert
+    assert DeferredIn.__pydantic_complete__
+    assert DeferredOut.__pydantic_complete__
+    assert list(timings) == ["hooks", "schemas", "magic", "runtime"]
+
+
+def test_warmup_decorator_option():
+    # Arrange
+    class Deferred(BaseModel):
+        model_config = ConfigDict(defer_build=True)
+
+        name: str
+
+    # Act
+    @lamina.lamina(schema_in=Deferred, warmup=True, add_to_spec=False)
+    def handler(request: Request):
+        return {}
+
+    # Assert
+    assert Deferred.__pydantic_complete__
+
+
+def test_warmup_ping_is_short_circuited():
+    # Arrange
+    calls = []
+
+    @lamina.lamina(schema_in=DeferredIn)
+    def handler(request: Request):
+        calls.append(1)
+        return {}
+
+    # Act
+    plugin = handler({"source": "serverless-plugin-warmup"}, None)
+    ping = handler({"warmup": True}, None)
+
+    # Assert
+    assert plugin["statusCode"] == ping["statusCode"] == 200
+    assert json.loads(ping["body"]) == {"warmup": True}
+    assert calls == []
+
+
+def test_step_functions_events_are_not_warmup_pings():
+    # Arrange
+    @lamina.lamina(step_functions=True)
+    def handler(request: Request):
+        return {"received": request.data}
+
+    # Act
+    response = handler({"warmup": True}, None)
+
+    # Assert
+    assert json.loads(response["body"]) == {"received": {"warmup": True}}